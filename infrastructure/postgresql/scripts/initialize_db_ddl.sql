@@ -10,6 +10,10 @@ DROP TABLE IF EXISTS usage_types;
 DROP TABLE IF EXISTS directions;
 DROP TABLE IF EXISTS building_types;
 DROP TABLE IF EXISTS transactions;
+DROP TABLE IF EXISTS source_file_states;
+DROP TABLE IF EXISTS pipeline_run_steps;
+DROP TABLE IF EXISTS pipeline_runs;
+DROP TABLE IF EXISTS load_rejects;
 
 /*Create DB Structure*/
 CREATE TABLE IF NOT EXISTS states(
@@ -146,6 +150,7 @@ CREATE TABLE IF NOT EXISTS transactions (
     property_carpet_area       DECIMAL,
     property_tax_rate          DECIMAL,
     property_face_direction_id INTEGER NOT NULL,
+    row_hash                   BIGINT,
     utc_datetime_created       TIMESTAMP(3)  NOT null DEFAULT CURRENT_TIMESTAMP(3),
     utc_datetime_deleted       TIMESTAMP(3),
     utc_datetime_updated       TIMESTAMP(3)  NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
@@ -154,4 +159,75 @@ CREATE TABLE IF NOT EXISTS transactions (
     FOREIGN KEY(property_city_id) REFERENCES cities(city_id),
     FOREIGN KEY(property_type_id) REFERENCES property_types(property_type_id),
     FOREIGN KEY(property_face_direction_id) REFERENCES directions(direction_id)
-);
\ No newline at end of file
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS transactions_row_hash_uidx ON transactions (row_hash);
+
+/*Case normalized natural key unique indexes of the dimension tables, used by the dimension loads through INSERT ... ON CONFLICT DO NOTHING*/
+CREATE UNIQUE INDEX IF NOT EXISTS regions_natural_key_uidx ON regions (COALESCE(LOWER(description), ''), COALESCE(LOWER(region_url), ''));
+
+CREATE UNIQUE INDEX IF NOT EXISTS locations_natural_key_uidx ON locations (COALESCE(region_id, 0), COALESCE(state_id, 0));
+
+CREATE UNIQUE INDEX IF NOT EXISTS property_types_natural_key_uidx ON property_types (COALESCE(LOWER(description), ''));
+
+CREATE UNIQUE INDEX IF NOT EXISTS laundry_options_natural_key_uidx ON laundry_options (COALESCE(LOWER(description), ''));
+
+CREATE UNIQUE INDEX IF NOT EXISTS parking_options_natural_key_uidx ON parking_options (COALESCE(LOWER(description), ''));
+
+CREATE UNIQUE INDEX IF NOT EXISTS building_types_natural_key_uidx ON building_types (COALESCE(LOWER(description), ''));
+
+CREATE UNIQUE INDEX IF NOT EXISTS directions_natural_key_uidx ON directions (COALESCE(LOWER(description), ''));
+
+CREATE UNIQUE INDEX IF NOT EXISTS cities_natural_key_uidx ON cities (COALESCE(LOWER(name), ''));
+
+/*Run state of the pipeline input files, used by the incremental runs to skip unchanged files and resume appended ones*/
+CREATE TABLE IF NOT EXISTS source_file_states (
+    source_file_state_id SERIAL        NOT NULL PRIMARY KEY,
+    pipeline_name        VARCHAR(100)  NOT NULL,
+    file_path            VARCHAR(1000) NOT NULL,
+    file_size            BIGINT        NOT NULL,
+    file_mtime_ns        BIGINT        NOT NULL,
+    prefix_size          BIGINT        NOT NULL,
+    prefix_hash          VARCHAR(64)   NOT NULL,
+    byte_offset          BIGINT        NOT NULL DEFAULT 0,
+    row_offset           BIGINT        NOT NULL DEFAULT 0,
+    utc_datetime_created TIMESTAMP(3)  NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+    utc_datetime_updated TIMESTAMP(3)  NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+
+    UNIQUE (pipeline_name, file_path)
+);
+
+/*Run log of the pipeline runs, used by the resumed runs to skip the steps and chunks a failed run already committed*/
+CREATE TABLE IF NOT EXISTS pipeline_runs (
+    pipeline_run_id      SERIAL       NOT NULL PRIMARY KEY,
+    pipeline_name        VARCHAR(100) NOT NULL,
+    input_fingerprint    VARCHAR(64)  NOT NULL,
+    status               VARCHAR(20)  NOT NULL,
+    utc_datetime_created TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+    utc_datetime_updated TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3)
+);
+
+CREATE INDEX IF NOT EXISTS pipeline_runs_input_idx ON pipeline_runs (pipeline_name, input_fingerprint);
+
+CREATE TABLE IF NOT EXISTS pipeline_run_steps (
+    pipeline_run_step_id SERIAL       NOT NULL PRIMARY KEY,
+    pipeline_run_id      INTEGER      NOT NULL REFERENCES pipeline_runs (pipeline_run_id),
+    step                 VARCHAR(100) NOT NULL,
+    chunk                INTEGER      NOT NULL,
+    status               VARCHAR(20)  NOT NULL,
+    source_rows          BIGINT       NOT NULL DEFAULT 0,
+    rows_written         BIGINT       NOT NULL DEFAULT 0,
+    utc_datetime_created TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+    utc_datetime_updated TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+
+    UNIQUE (pipeline_run_id, step, chunk)
+);
+
+/*Rows of the write batches that couldn't be loaded, kept as JSON along with the error they were rejected by*/
+CREATE TABLE IF NOT EXISTS load_rejects (
+    load_reject_id       SERIAL       NOT NULL PRIMARY KEY,
+    table_name           VARCHAR(100) NOT NULL,
+    error                TEXT         NOT NULL,
+    row_data             JSONB        NOT NULL,
+    utc_datetime_created TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3)
+);
@@ -0,0 +1,16 @@
+/*Run state of the pipeline input files, used by the incremental runs to skip unchanged files and resume appended ones*/
+CREATE TABLE IF NOT EXISTS source_file_states (
+    source_file_state_id SERIAL        NOT NULL PRIMARY KEY,
+    pipeline_name        VARCHAR(100)  NOT NULL,
+    file_path            VARCHAR(1000) NOT NULL,
+    file_size            BIGINT        NOT NULL,
+    file_mtime_ns        BIGINT        NOT NULL,
+    prefix_size          BIGINT        NOT NULL,
+    prefix_hash          VARCHAR(64)   NOT NULL,
+    byte_offset          BIGINT        NOT NULL DEFAULT 0,
+    row_offset           BIGINT        NOT NULL DEFAULT 0,
+    utc_datetime_created TIMESTAMP(3)  NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+    utc_datetime_updated TIMESTAMP(3)  NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+
+    UNIQUE (pipeline_name, file_path)
+);
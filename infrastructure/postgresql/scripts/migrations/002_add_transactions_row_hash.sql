@@ -0,0 +1,4 @@
+/*Row hash of the transaction natural key, used to find the new transactions without comparing every column*/
+ALTER TABLE transactions ADD COLUMN IF NOT EXISTS row_hash BIGINT;
+
+CREATE UNIQUE INDEX IF NOT EXISTS transactions_row_hash_uidx ON transactions (row_hash);
@@ -0,0 +1,17 @@
+/*Case normalized natural key unique indexes of the dimension tables, used by the dimension loads through INSERT ... ON CONFLICT DO NOTHING*/
+/*The indexes can't be created over existing duplicated natural keys, which must be merged before running this migration*/
+CREATE UNIQUE INDEX IF NOT EXISTS regions_natural_key_uidx ON regions (COALESCE(LOWER(description), ''), COALESCE(LOWER(region_url), ''));
+
+CREATE UNIQUE INDEX IF NOT EXISTS locations_natural_key_uidx ON locations (COALESCE(region_id, 0), COALESCE(state_id, 0));
+
+CREATE UNIQUE INDEX IF NOT EXISTS property_types_natural_key_uidx ON property_types (COALESCE(LOWER(description), ''));
+
+CREATE UNIQUE INDEX IF NOT EXISTS laundry_options_natural_key_uidx ON laundry_options (COALESCE(LOWER(description), ''));
+
+CREATE UNIQUE INDEX IF NOT EXISTS parking_options_natural_key_uidx ON parking_options (COALESCE(LOWER(description), ''));
+
+CREATE UNIQUE INDEX IF NOT EXISTS building_types_natural_key_uidx ON building_types (COALESCE(LOWER(description), ''));
+
+CREATE UNIQUE INDEX IF NOT EXISTS directions_natural_key_uidx ON directions (COALESCE(LOWER(description), ''));
+
+CREATE UNIQUE INDEX IF NOT EXISTS cities_natural_key_uidx ON cities (COALESCE(LOWER(name), ''));
@@ -0,0 +1,25 @@
+/*Run log of the pipeline runs, used by the resumed runs to skip the steps and chunks a failed run already committed*/
+CREATE TABLE IF NOT EXISTS pipeline_runs (
+    pipeline_run_id      SERIAL       NOT NULL PRIMARY KEY,
+    pipeline_name        VARCHAR(100) NOT NULL,
+    input_fingerprint    VARCHAR(64)  NOT NULL,
+    status               VARCHAR(20)  NOT NULL,
+    utc_datetime_created TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+    utc_datetime_updated TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3)
+);
+
+CREATE INDEX IF NOT EXISTS pipeline_runs_input_idx ON pipeline_runs (pipeline_name, input_fingerprint);
+
+CREATE TABLE IF NOT EXISTS pipeline_run_steps (
+    pipeline_run_step_id SERIAL       NOT NULL PRIMARY KEY,
+    pipeline_run_id      INTEGER      NOT NULL REFERENCES pipeline_runs (pipeline_run_id),
+    step                 VARCHAR(100) NOT NULL,
+    chunk                INTEGER      NOT NULL,
+    status               VARCHAR(20)  NOT NULL,
+    source_rows          BIGINT       NOT NULL DEFAULT 0,
+    rows_written         BIGINT       NOT NULL DEFAULT 0,
+    utc_datetime_created TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+    utc_datetime_updated TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+
+    UNIQUE (pipeline_run_id, step, chunk)
+);
@@ -0,0 +1,8 @@
+/*Rows of the write batches that couldn't be loaded, kept as JSON along with the error they were rejected by*/
+CREATE TABLE IF NOT EXISTS load_rejects (
+    load_reject_id       SERIAL       NOT NULL PRIMARY KEY,
+    table_name           VARCHAR(100) NOT NULL,
+    error                TEXT         NOT NULL,
+    row_data             JSONB        NOT NULL,
+    utc_datetime_created TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3)
+);
@@ -1,50 +1,35 @@
-import sys
-import os
 import argparse
 
-import pandas as pd
-
-from extractors.abstractions.abstract_extractor import AbstractExtractor
-from extractors.housing_listing.laundry_options_extractor import LaundryOptionsExtractor
-from extractors.housing_listing.parking_options_extractor import ParkingOptionsExtractor
-from extractors.housing_listing.regions_extractor import RegionsExtractor
-from extractors.housing_listing.locations_extractor import LocationsExtractor
-from extractors.housing_listing.property_type_extractors import PropertyTypeExtractor
-from extractors.housing_listing.property_listing_extractor import PropertyListingExtractor
-from extractors.real_estate_transactions.building_types_extractor import BuildingTypesExtractor
-from extractors.real_estate_transactions.property_type_extractor import PropertyTypesExtractor as RealStatePropertyTypesExtractor
-from extractors.real_estate_transactions.directions_extractor import DirectionsExtractor
-from extractors.real_estate_transactions.cities_extractor import CitiesExtractor
-from extractors.real_estate_transactions.transactions_extractor import TransactionsExtractor
-
 from models.config.db_connection_config import DBConnectionConfig
+from models.config.load_config import LoadConfig
 
 from utils.log.custom_logger import CustomLogger
+from utils.registry.pipeline_registry import PipelineRegistry
 
+# The pipeline objects are dotted paths resolved when the pipeline runs, so only the extractors it uses are imported
 pipelines = {
     "housing_listing": {
         "input_file": "../data/usa_housing_listing/housing.csv",
+        "schema": "models.schemas.housing_listing_schema.housing_listing_schema",
+        "dimensions": "models.dimensions.housing_listing_dimensions.housing_listing_dimensions",
         "steps": {
-            1: LaundryOptionsExtractor,
-            2: ParkingOptionsExtractor,
-            3: RegionsExtractor,
-            4: LocationsExtractor,
-            5: PropertyTypeExtractor,
-            6: PropertyListingExtractor
+            1: "extractors.housing_listing.locations_extractor.LocationsExtractor",
+            2: "extractors.housing_listing.property_listing_extractor.PropertyListingExtractor"
         }
     },
     "real_estate_transactions": {
         "input_file": "../data/usa_real_state_transactions/real_estate_transactions.csv",
+        "schema": "models.schemas.real_estate_transactions_schema.real_estate_transactions_schema",
+        "dimensions": "models.dimensions.real_estate_transactions_dimensions.real_estate_transactions_dimensions",
         "steps": {
-            1: BuildingTypesExtractor,
-            2: RealStatePropertyTypesExtractor,
-            4: DirectionsExtractor,
-            5: CitiesExtractor,
-            6: TransactionsExtractor
+            1: "extractors.real_estate_transactions.transactions_extractor.TransactionsExtractor"
         }
     }
 }
 
+pipeline_registry = PipelineRegistry(pipelines=pipelines)
+
+
 if __name__ == "__main__":
 
     logger = CustomLogger()
@@ -59,11 +44,37 @@ if __name__ == "__main__":
     )
 
     argument_parser.add_argument("--pipeline", type=str, help="The target pipeline name within the allowed pipelines ['house_listing']")
+    argument_parser.add_argument("--input", type=str, nargs="+", default=None, help="The input files or glob patterns (quoted) read as a single stream, instead of the pipeline input file")
+    argument_parser.add_argument("--read_workers", type=int, default=1, help="The number of worker processes parsing the input files in parallel when there are several of them, ignored when reading in chunks")
     argument_parser.add_argument("--target_db_host", type=str, help="The target database host")
     argument_parser.add_argument("--target_db_port", type=str, help="The target database port")
     argument_parser.add_argument("--target_db_name", type=str, help="The target database name")
     argument_parser.add_argument("--target_db_username", type=str, help="The target database username")
     argument_parser.add_argument("--target_db_password", type=str, help="The target database password")
+    argument_parser.add_argument("--sink", type=str, choices=["postgres", "sqlite"], default="postgres", help="The target the pipeline loads into, the PostgreSQL target db or a local SQLite file")
+    argument_parser.add_argument("--sqlite_file", type=str, default="../data/real_estate.sqlite", help="The SQLite file loaded by the sqlite sink, created with the target db structure when it doesn't exist")
+    argument_parser.add_argument("--db_pool_size", type=int, default=5, help="The number of connections kept in the run scoped connection pool")
+    argument_parser.add_argument("--db_max_overflow", type=int, default=10, help="The number of connections allowed beyond the pool size")
+    argument_parser.add_argument("--single_transaction", action="store_true", help="Runs every pipeline step on one connection and one transaction, committing the run atomically")
+    argument_parser.add_argument("--max_workers", type=int, default=4, help="The maximum number of independent pipeline steps running concurrently")
+    argument_parser.add_argument("--batched_dimensions", action="store_true", help="Upserts every dimension of the pipeline in a single batch step, one statement and one transaction, instead of one step per dimension")
+    argument_parser.add_argument("--server_side_dedup", action="store_true", help="Loads each fact batch into a temporary staging table and inserts only the new rows server side, instead of reading the whole fact table")
+    argument_parser.add_argument("--parser_engine", type=str, choices=["c", "pyarrow"], default=None, help="The CSV parser engine, overriding the pipeline schema one (pyarrow requires the optional pyarrow package)")
+    argument_parser.add_argument("--chunk_size", "--chunk-size", type=int, default=None, help="Streams the input file in chunks of the given number of rows, keeping the memory usage bounded")
+    argument_parser.add_argument("--source_cache", action="store_true", help="Keeps a typed columnar cache of the parsed input file next to it, memory mapped by the next runs instead of parsing the file again (requires the optional pyarrow package)")
+    argument_parser.add_argument("--metrics_report", type=str, default=None, help="Writes the wall and CPU time, rows, DB round trips and bytes of each step to the given JSON file at the end of the run")
+    argument_parser.add_argument("--trace_memory", action="store_true", help="Adds the tracemalloc memory peak of each step to the metrics, slowing the run down")
+    argument_parser.add_argument("--duplicate_keep", type=str, choices=["first", "last"], default="first", help="Which occurrence of a business key repeated within the input (or chunk) is loaded")
+    argument_parser.add_argument("--write_batch_size", type=int, default=None, help="Writes the facts in batches of the given number of rows, each one committed on its own and retried alone after a transient error")
+    argument_parser.add_argument("--write_retries", type=int, default=3, help="The number of times a write batch failing with a transient error is retried")
+    argument_parser.add_argument("--write_retry_backoff", type=float, default=1.0, help="The seconds waited before retrying a write batch, doubled on every retry")
+    argument_parser.add_argument("--reject_failed_batches", action="store_true", help="Records the rows of the write batches that can't be written in the load_rejects table instead of failing the step")
+    argument_parser.add_argument("--fact_load_workers", type=int, default=1, help="The number of worker processes transforming and loading the property listing hash partitions, each one with its own DB connection")
+    argument_parser.add_argument("--overlapped", action="store_true", help="Reads and normalizes the next chunks on their own threads while the pipeline steps load the current one")
+    argument_parser.add_argument("--stage_queue_size", type=int, default=2, help="The number of chunks each overlapped stage can hold ahead of the next one, bounding the memory usage")
+    argument_parser.add_argument("--incremental", action="store_true", help="Skips the run when the input file is unchanged since the last run and only reads the appended rows when the file was appended to")
+    argument_parser.add_argument("--checkpoint", action="store_true", help="Logs the run and commits each step of each chunk in one transaction along with its checkpoint, so a failed run can be resumed (requires the 004 migration)")
+    argument_parser.add_argument("--resume", action="store_true", help="Resumes the last failed checkpointed run of the pipeline over the same input, skipping the steps and chunks it already committed, checkpointing the run as well")
 
     args = argument_parser.parse_args()
 
@@ -71,30 +82,66 @@ if __name__ == "__main__":
 
     logger.info(f"Running the following Target pipeline: {pipeline}")
 
-    if pipeline not in pipelines.keys():
-        raise ValueError(f"The {pipeline} pipeline is not valid, please chose of these: [{','.join(pipelines.keys())}]")
+    if not pipeline_registry.contains(name=pipeline):
+        raise ValueError(f"The {pipeline} pipeline is not valid, please chose of these: [{','.join(pipeline_registry.get_names())}]")
+
+    if args.read_workers <= 0:
+        raise ValueError("The number of read workers must be a positive number.")
+
+    if args.chunk_size is not None and args.chunk_size <= 0:
+        raise ValueError("The chunk size must be a positive number of rows.")
+
+    if args.write_batch_size is not None and args.write_batch_size <= 0:
+        raise ValueError("The write batch size must be a positive number of rows.")
+
+    if args.write_retries < 0 or args.write_retry_backoff < 0:
+        raise ValueError("The write retries and their backoff can't be negative.")
 
-    pipeline = pipelines[pipeline]
+    if args.fact_load_workers <= 0:
+        raise ValueError("The number of fact load workers must be a positive number.")
 
-    if not os.path.exists(pipeline["input_file"]):
-        raise Exception("The specified input file doesn't exists.")
+    if args.sink != "postgres" and (args.single_transaction or args.incremental):
+        raise ValueError("The single transaction and incremental runs are only supported by the postgres sink.")
 
-    df_source_data = pd.read_csv(filepath_or_buffer=pipeline["input_file"], sep=",")
+    if (args.checkpoint or args.resume) and (args.sink != "postgres" or args.single_transaction):
+        raise ValueError("The checkpointed and resumed runs are only supported by the postgres sink without a single transaction, which has no partial run to resume.")
+
+    if args.stage_queue_size <= 0:
+        raise ValueError("The stage queue size must be a positive number of chunks.")
+
+    if args.reject_failed_batches and not args.write_batch_size:
+        logger.warning("The failed batches are only retried and rejected by the batched writes, the facts are written without a write batch size.")
+
+    if args.overlapped and not args.chunk_size:
+        logger.warning("The input file is read as a single chunk, the overlapped stages have no other chunk to overlap with.")
 
     db_config = DBConnectionConfig(
         db_host=args.target_db_host,
         db_port=args.target_db_port,
         db_name=args.target_db_name,
         db_username=args.target_db_username,
-        db_password=args.target_db_password
-    )   
-
+        db_password=args.target_db_password,
+        pool_size=args.db_pool_size,
+        max_overflow=args.db_max_overflow
+    )
 
-    pipeline_steps = list(pipeline["steps"].keys())
-    pipeline_steps.sort()
+    load_config = LoadConfig(
+        server_side_dedup=args.server_side_dedup,
+        fact_load_workers=args.fact_load_workers,
+        duplicate_keep=args.duplicate_keep,
+        write_batch_size=args.write_batch_size,
+        write_retries=args.write_retries,
+        write_retry_backoff=args.write_retry_backoff,
+        reject_failed_batches=args.reject_failed_batches
+    )
 
-    for step in pipeline_steps:
-        success = pipeline["steps"][step](source_df=df_source_data,target_db_config=db_config, logger=logger).extract()
+    # The readers, sinks and extractors are only imported once the command line is valid
+    from pipeline_runner import run_pipeline
 
-        if not success:
-            raise Exception("There is a processing step failed.")
+    run_pipeline(
+        args=args,
+        pipeline=pipeline_registry.load(name=pipeline),
+        db_config=db_config,
+        load_config=load_config,
+        logger=logger
+    )
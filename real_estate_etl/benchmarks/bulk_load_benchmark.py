@@ -0,0 +1,112 @@
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+import sqlalchemy as sa
+
+from extractors.abstractions.abstract_extractor import AbstractExtractor
+from models.config.db_connection_config import DBConnectionConfig
+from utils.log.custom_logger import CustomLogger
+
+BENCHMARK_TABLE = "bulk_load_benchmark"
+
+
+def build_property_listing_sample(rows: int) -> pd.DataFrame:
+    """
+        A function that builds a synthetic property_listing shaped data frame, including long TEXT descriptions
+
+        returns:
+            pd.DataFrame: A pandas DataFrame with the property_listing table columns
+    """
+
+    random = np.random.default_rng(seed=42)
+
+    return pd.DataFrame({
+        "property_listing_id": np.arange(1, rows + 1, dtype="int64"),
+        "property_listing_url": [f"https://listing.craigslist.org/apa/d/{i}.html" for i in range(rows)],
+        "property_image_url": [f"https://images.craigslist.org/{i}_600x450.jpg" for i in range(rows)],
+        "property_description": ["Spacious apartment close to downtown, \"updated\" kitchen,\nnew floors. " * 20] * rows,
+        "property_location_longitude": random.uniform(-124.0, -67.0, rows).round(4),
+        "property_location_latitude": random.uniform(25.0, 49.0, rows).round(4),
+        "property_type_id": random.integers(1, 12, rows),
+        "property_square_feet": random.integers(300, 3000, rows).astype("float64"),
+        "property_price": random.integers(500, 5000, rows).astype("float64"),
+        "bedrooms": random.integers(0, 5, rows),
+        "bathrooms": random.integers(1, 4, rows),
+        "cats_allowed": random.integers(0, 2, rows).astype(bool),
+        "dogs_allowed": random.integers(0, 2, rows).astype(bool),
+        "smoking_allowed": random.integers(0, 2, rows).astype(bool),
+        "wheelchair_access": random.integers(0, 2, rows).astype(bool),
+        "comes_furnished": random.integers(0, 2, rows).astype(bool),
+        "electric_vehicle_charge": random.integers(0, 2, rows).astype(bool)
+    })
+
+
+def measure(load, df: pd.DataFrame) -> float:
+    """
+        A function that runs the given load function and returns the achieved rows per second
+
+        returns:
+            float: The loaded rows per second
+    """
+
+    started_at = time.perf_counter()
+    load(df)
+    elapsed = time.perf_counter() - started_at
+
+    return len(df.index) / elapsed
+
+
+if __name__ == "__main__":
+
+    logger = CustomLogger()
+
+    argument_parser = argparse.ArgumentParser(
+        description="Compares the DataFrame.to_sql load path against the COPY based bulk load path",
+        prefix_chars="-",
+        allow_abbrev=False,
+        add_help=True
+    )
+
+    argument_parser.add_argument("--rows", type=int, default=100000, help="The number of synthetic property listings to load")
+    argument_parser.add_argument("--target_db_host", type=str, help="The target database host")
+    argument_parser.add_argument("--target_db_port", type=str, help="The target database port")
+    argument_parser.add_argument("--target_db_name", type=str, help="The target database name")
+    argument_parser.add_argument("--target_db_username", type=str, help="The target database username")
+    argument_parser.add_argument("--target_db_password", type=str, help="The target database password")
+
+    args = argument_parser.parse_args()
+
+    extractor = AbstractExtractor(
+        source_df=None,
+        target_db_config=DBConnectionConfig(
+            db_host=args.target_db_host,
+            db_port=args.target_db_port,
+            db_name=args.target_db_name,
+            db_username=args.target_db_username,
+            db_password=args.target_db_password
+        ),
+        logger=logger
+    )
+
+    engine = extractor._get_db_engine()
+
+    df_sample = build_property_listing_sample(rows=args.rows)
+
+    with engine.begin() as connection:
+        connection.execute(sa.text(f"DROP TABLE IF EXISTS {BENCHMARK_TABLE}"))
+        connection.execute(sa.text(f"CREATE TABLE {BENCHMARK_TABLE} (LIKE property_listing INCLUDING DEFAULTS)"))
+
+    try:
+        to_sql_rows_per_second = measure(lambda df: df.to_sql(BENCHMARK_TABLE, con=engine, index=False, if_exists="append"), df_sample)
+
+        with engine.begin() as connection:
+            connection.execute(sa.text(f"TRUNCATE TABLE {BENCHMARK_TABLE}"))
+
+        copy_rows_per_second = measure(lambda df: extractor._bulk_load(df=df, table_name=BENCHMARK_TABLE), df_sample)
+    finally:
+        with engine.begin() as connection:
+            connection.execute(sa.text(f"DROP TABLE IF EXISTS {BENCHMARK_TABLE}"))
+
+    logger.info(f"bulk_load_benchmark rows={args.rows} to_sql={to_sql_rows_per_second:,.0f} rows/s copy={copy_rows_per_second:,.0f} rows/s speedup={copy_rows_per_second / to_sql_rows_per_second:.1f}x")
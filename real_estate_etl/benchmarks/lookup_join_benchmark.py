@@ -0,0 +1,156 @@
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic_data_generator import generate_housing_listing_block, generate_real_estate_transactions_block
+from models.schemas.housing_listing_schema import housing_listing_schema
+from models.schemas.real_estate_transactions_schema import real_estate_transactions_schema
+from transformers.lookup_joiner import LookupJoiner
+from transformers.source_normalizer import SourceNormalizer
+from utils.log.custom_logger import CustomLogger
+
+# The dimension lookups of each fact extractor, as (id column, source key columns, dimension key columns)
+LOOKUPS = {
+    "housing_listing": [
+        ("location_id", ["region", "region_url", "state"], ["region", "region_url", "state"]),
+        ("property_type_id", ["type"], ["type"]),
+        ("parking_option_id", ["parking_options"], ["parking_options"]),
+        ("laundry_option_id", ["laundry_options"], ["laundry_options"])
+    ],
+    "real_estate_transactions": [
+        ("city_id", ["Locality"], ["locality"]),
+        ("building_type_id", ["Property"], ["property"]),
+        ("property_type_id", ["Residential"], ["residential"]),
+        ("direction_id", ["Face"], ["face"])
+    ]
+}
+
+
+def build_source(pipeline: str, rows: int) -> pd.DataFrame:
+    """
+        A function that generates and normalizes a synthetic source data frame of the given pipeline
+
+        returns:
+            pd.DataFrame: The normalized pandas DataFrame
+    """
+
+    random = np.random.default_rng(seed=42)
+
+    if pipeline == "housing_listing":
+        df = generate_housing_listing_block(first_row=0, rows=rows, regions=400, states=50, types=12, duplicate_ratio=0.0, random=random)
+        schema = housing_listing_schema
+    else:
+        df = generate_real_estate_transactions_block(first_row=0, rows=rows, localities=170, types=8, duplicate_ratio=0.0, random=random)
+        schema = real_estate_transactions_schema
+
+    return SourceNormalizer(schema=schema).normalize(df=df)
+
+
+def build_dimension_keys(df: pd.DataFrame, id_column: str, left_on: list[str], right_on: list[str]) -> pd.DataFrame:
+    """
+        A function that builds the dimension keys data frame of a lookup from the distinct source keys, leaving
+        one of every ten keys out so the lookup also resolves missing ids
+
+        returns:
+            pd.DataFrame: A pandas DataFrame with the id and the dimension key columns
+    """
+
+    df_keys = df[left_on].drop_duplicates().astype(object).set_axis(right_on, axis="columns").reset_index(drop=True)
+    df_keys.insert(0, id_column, np.arange(1, len(df_keys.index) + 1, dtype="int64"))
+
+    return df_keys[df_keys[id_column] % 10 != 0]
+
+
+def merge_chain(df: pd.DataFrame, dimension_keys: list[tuple]) -> pd.DataFrame:
+    """
+        A function that attaches the dimension ids through chained left merges, the way the fact extractors did
+
+        returns:
+            pd.DataFrame: The pandas DataFrame with the dimension id columns
+    """
+
+    for df_keys, (id_column, left_on, right_on) in dimension_keys:
+        df = df.merge(df_keys, how="left", left_on=left_on, right_on=right_on, indicator=False)
+
+    return df
+
+
+def lookup_chain(df: pd.DataFrame, dimension_keys: list[tuple]) -> pd.DataFrame:
+    """
+        A function that attaches the dimension ids through the lookup joiner used by the fact extractors
+
+        returns:
+            pd.DataFrame: The pandas DataFrame with the dimension id columns
+    """
+
+    lookup_joiner = LookupJoiner()
+
+    for df_keys, (id_column, left_on, right_on) in dimension_keys:
+        df = lookup_joiner.join(df=df, df_keys=df_keys, id_column=id_column, left_on=left_on, right_on=right_on)
+
+    return df
+
+
+def measure(join, df: pd.DataFrame, dimension_keys: list[tuple]) -> tuple[pd.DataFrame, float, int]:
+    """
+        A function that runs the given join chain, returning its result along with the elapsed seconds and the
+        peak bytes allocated while it ran
+
+        returns:
+            tuple[pd.DataFrame, float, int]: The joined data frame, the elapsed seconds and the peak bytes
+    """
+
+    tracemalloc.start()
+    started_at = time.perf_counter()
+
+    df_joined = join(df, dimension_keys)
+
+    elapsed = time.perf_counter() - started_at
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return df_joined, elapsed, peak_bytes
+
+
+if __name__ == "__main__":
+
+    logger = CustomLogger()
+
+    argument_parser = argparse.ArgumentParser(
+        description="Compares the chained DataFrame.merge dimension lookups against the dictionary encoded lookup joins",
+        prefix_chars="-",
+        allow_abbrev=False,
+        add_help=True
+    )
+
+    argument_parser.add_argument("--rows", type=int, nargs="+", default=[100000, 1000000], help="The numbers of synthetic source rows to join")
+    argument_parser.add_argument("--pipeline", type=str, nargs="+", choices=list(LOOKUPS), default=list(LOOKUPS), help="The pipelines whose fact lookups are measured")
+
+    args = argument_parser.parse_args()
+
+    for pipeline in args.pipeline:
+        for rows in args.rows:
+            df_source = build_source(pipeline=pipeline, rows=rows)
+
+            dimension_keys = [
+                (build_dimension_keys(df=df_source, id_column=id_column, left_on=left_on, right_on=right_on), (id_column, left_on, right_on))
+                for id_column, left_on, right_on in LOOKUPS[pipeline]
+            ]
+
+            df_merged, merge_seconds, merge_peak_bytes = measure(merge_chain, df_source, dimension_keys)
+            df_looked_up, lookup_seconds, lookup_peak_bytes = measure(lookup_chain, df_source, dimension_keys)
+
+            id_columns = [id_column for id_column, _, _ in LOOKUPS[pipeline]]
+
+            if not np.array_equal(df_merged[id_columns].to_numpy(dtype="float64"), df_looked_up[id_columns].to_numpy(dtype="float64"), equal_nan=True):
+                raise AssertionError(f"The lookup joins of {pipeline} didn't resolve the same ids as the merges.")
+
+            logger.info(
+                f"lookup_join_benchmark pipeline={pipeline} rows={rows} "
+                f"merge={merge_seconds:.3f}s ({rows / merge_seconds:,.0f} rows/s, peak {merge_peak_bytes / 2 ** 20:,.1f} MiB) "
+                f"lookup={lookup_seconds:.3f}s ({rows / lookup_seconds:,.0f} rows/s, peak {lookup_peak_bytes / 2 ** 20:,.1f} MiB) "
+                f"speedup={merge_seconds / lookup_seconds:.1f}x"
+            )
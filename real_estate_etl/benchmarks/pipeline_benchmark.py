@@ -0,0 +1,274 @@
+import argparse
+import os
+import resource
+import threading
+import time
+
+from contextlib import contextmanager
+from typing import Iterator
+
+import sqlalchemy as sa
+
+from app import pipeline_registry
+from benchmarks.synthetic_data_generator import write_housing_listing_file, write_real_estate_transactions_file
+from models.config.db_connection_config import DBConnectionConfig
+from pipeline_runner import get_pipeline_steps
+from readers.source_file_reader import SourceFileReader
+from sinks.abstractions.abstract_sink import AbstractSink
+from sinks.postgres_sink import PostgresSink
+from sinks.sqlite_sink import SQLiteSink
+from transformers.source_normalizer import SourceNormalizer
+from utils.cache.dimension_cache import DimensionCache
+from utils.db.db_engine_registry import DBEngineRegistry
+from utils.log.custom_logger import CustomLogger
+from utils.scheduling.dag_scheduler import DAGScheduler
+
+SQLITE_INITIALIZATION_SCRIPTS = ["../infrastructure/sqlite/scripts/initialize_db_ddl.sql", "../infrastructure/postgresql/scripts/initialize_db_dml.sql"]
+
+class PeakRssSampler():
+
+    SAMPLING_INTERVAL = 0.005
+
+    def __init__(self) -> None:
+
+        self.__peak_rss = 0
+        self.__stop_event = threading.Event()
+        self.__thread = None
+
+    def __get_rss(self) -> int:
+        """
+            A private method that returns the current resident set size of the process, read from /proc on linux
+            and falling back to the process lifetime peak elsewhere
+
+            returns:
+                int: The resident set size in bytes
+        """
+
+        try:
+            with open("/proc/self/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError):
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    def __sample(self) -> None:
+        while not self.__stop_event.wait(self.SAMPLING_INTERVAL):
+            self.__peak_rss = max(self.__peak_rss, self.__get_rss())
+
+    def __enter__(self) -> "PeakRssSampler":
+        self.__peak_rss = self.__get_rss()
+        self.__thread = threading.Thread(target=self.__sample, daemon=True)
+        self.__thread.start()
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.__stop_event.set()
+        self.__thread.join()
+        self.__peak_rss = max(self.__peak_rss, self.__get_rss())
+
+    @property
+    def peak_rss(self) -> int:
+        return self.__peak_rss
+
+
+@contextmanager
+def measure_step(results: list[dict], pipeline: str, rows: int, step: str) -> Iterator[None]:
+    """
+        A function that measures the wall time and the peak resident set size of the wrapped step, appending
+        them with the achieved rows per second to the results
+    """
+
+    with PeakRssSampler() as rss_sampler:
+        started_at = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - started_at
+
+    results.append({
+        "pipeline": pipeline,
+        "rows": rows,
+        "step": step,
+        "seconds": elapsed,
+        "rows_per_second": rows / elapsed if elapsed else float("inf"),
+        "peak_rss_mb": rss_sampler.peak_rss / 1024 / 1024
+    })
+
+
+def reset_pipeline_tables(db_engine_registry: DBEngineRegistry, db_config: DBConnectionConfig, steps: list[type]) -> None:
+    """
+        A function that empties the tables written by the pipeline steps, so every measurement starts from the
+        same empty target db, the seeded states are kept
+    """
+
+    tables = ", ".join(sorted({table for step in steps for table in step.get_target_tables()}))
+
+    with db_engine_registry.begin(db_config=db_config) as connection:
+        connection.execute(sa.text(f"TRUNCATE TABLE {tables} RESTART IDENTITY CASCADE"))
+
+
+def create_sink(db_engine_registry: DBEngineRegistry, db_config: DBConnectionConfig, steps: list[type], sqlite_file: str = None) -> AbstractSink:
+    """
+        A function that returns an empty sink for a measurement, a new SQLite file when one is given, otherwise
+        the target db with the pipeline tables emptied
+
+        returns:
+            AbstractSink: The sink loaded by the measured steps
+    """
+
+    if sqlite_file is None:
+        reset_pipeline_tables(db_engine_registry=db_engine_registry, db_config=db_config, steps=steps)
+
+        return PostgresSink(target_db_config=db_config, db_engine_registry=db_engine_registry)
+
+    if os.path.exists(sqlite_file):
+        os.remove(sqlite_file)
+
+    return SQLiteSink(file_path=sqlite_file, initialization_scripts=SQLITE_INITIALIZATION_SCRIPTS)
+
+
+def benchmark_steps(pipeline_name: str, file_path: str, rows: int, db_config: DBConnectionConfig, logger: CustomLogger, sqlite_file: str = None) -> list[dict]:
+    """
+        A function that runs the read, the normalization and each extractor of the pipeline one after another
+        in their dependency order, measuring each of them
+
+        returns:
+            list[dict]: The measurements of each step
+    """
+
+    pipeline = pipeline_registry.load(name=pipeline_name)
+    steps = get_pipeline_steps(pipeline=pipeline)
+    results = []
+
+    db_engine_registry = DBEngineRegistry()
+    dimension_cache = DimensionCache()
+
+    sink = create_sink(db_engine_registry=db_engine_registry, db_config=db_config, steps=steps, sqlite_file=sqlite_file)
+
+    try:
+        with measure_step(results=results, pipeline=pipeline_name, rows=rows, step="read"):
+            df_source_data = next(SourceFileReader(file_path=file_path, schema=pipeline["schema"], logger=logger).read())
+
+        with measure_step(results=results, pipeline=pipeline_name, rows=rows, step="normalize"):
+            df_source_data = SourceNormalizer(schema=pipeline["schema"]).normalize(df=df_source_data)
+
+        def run_step(extractor_class: type) -> bool:
+            with measure_step(results=results, pipeline=pipeline_name, rows=rows, step=extractor_class.__name__):
+                return extractor_class(
+                    source_df=df_source_data,
+                    target_db_config=db_config,
+                    logger=logger,
+                    db_engine_registry=db_engine_registry,
+                    dimension_cache=dimension_cache,
+                    sink=sink
+                ).extract()
+
+        if not DAGScheduler(steps=steps, logger=logger, max_workers=1).run(run_step=run_step):
+            raise Exception(f"The {pipeline_name} pipeline failed while being benchmarked.")
+    finally:
+        sink.dispose()
+        db_engine_registry.dispose()
+
+    return results
+
+
+def benchmark_pipeline(pipeline_name: str, file_path: str, rows: int, db_config: DBConnectionConfig, max_workers: int, logger: CustomLogger, sqlite_file: str = None) -> list[dict]:
+    """
+        A function that runs the whole pipeline the way app.py does, reading, normalizing and running the steps
+        concurrently, measuring it as a single step
+
+        returns:
+            list[dict]: The measurement of the whole pipeline
+    """
+
+    pipeline = pipeline_registry.load(name=pipeline_name)
+    steps = get_pipeline_steps(pipeline=pipeline)
+    results = []
+
+    db_engine_registry = DBEngineRegistry()
+    dimension_cache = DimensionCache()
+
+    sink = create_sink(db_engine_registry=db_engine_registry, db_config=db_config, steps=steps, sqlite_file=sqlite_file)
+
+    try:
+        with measure_step(results=results, pipeline=pipeline_name, rows=rows, step="pipeline"):
+            df_source_data = next(SourceFileReader(file_path=file_path, schema=pipeline["schema"], logger=logger).read())
+            df_source_data = SourceNormalizer(schema=pipeline["schema"]).normalize(df=df_source_data)
+
+            def run_step(extractor_class: type) -> bool:
+                return extractor_class(
+                    source_df=df_source_data,
+                    target_db_config=db_config,
+                    logger=logger,
+                    db_engine_registry=db_engine_registry,
+                    dimension_cache=dimension_cache,
+                    sink=sink
+                ).extract()
+
+            if not DAGScheduler(steps=steps, logger=logger, max_workers=max_workers).run(run_step=run_step):
+                raise Exception(f"The {pipeline_name} pipeline failed while being benchmarked.")
+    finally:
+        sink.dispose()
+        db_engine_registry.dispose()
+
+    return results
+
+
+if __name__ == "__main__":
+
+    logger = CustomLogger()
+
+    argument_parser = argparse.ArgumentParser(
+        description="Measures each extractor and each whole pipeline over synthetic source files of growing sizes",
+        prefix_chars="-",
+        allow_abbrev=False,
+        add_help=True
+    )
+
+    argument_parser.add_argument("--pipeline", type=str, nargs="+", default=pipeline_registry.get_names(), choices=pipeline_registry.get_names(), help="The pipelines to benchmark")
+    argument_parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000], help="The synthetic file sizes to benchmark, from 10^4 to 10^7 rows")
+    argument_parser.add_argument("--data_folder", type=str, default="../data/benchmark", help="The folder the synthetic files are generated in")
+    argument_parser.add_argument("--regions", type=int, default=400, help="The number of distinct housing regions")
+    argument_parser.add_argument("--states", type=int, default=50, help="The number of distinct housing states")
+    argument_parser.add_argument("--types", type=int, default=12, help="The number of distinct housing and transaction property types")
+    argument_parser.add_argument("--localities", type=int, default=170, help="The number of distinct transaction localities")
+    argument_parser.add_argument("--duplicate_ratio", type=float, default=0.05, help="The ratio of rows that are copies of other rows")
+    argument_parser.add_argument("--max_workers", type=int, default=4, help="The maximum number of steps running concurrently in the whole pipeline runs")
+    argument_parser.add_argument("--sqlite_file", type=str, default=None, help="Loads into a new SQLite file at the given path instead of the target db, measuring the pipelines without a DB server in the loop")
+    argument_parser.add_argument("--target_db_host", type=str, help="The target database host")
+    argument_parser.add_argument("--target_db_port", type=str, help="The target database port")
+    argument_parser.add_argument("--target_db_name", type=str, help="The target database name, its pipeline tables are emptied by the benchmark")
+    argument_parser.add_argument("--target_db_username", type=str, help="The target database username")
+    argument_parser.add_argument("--target_db_password", type=str, help="The target database password")
+
+    args = argument_parser.parse_args()
+
+    db_config = DBConnectionConfig(
+        db_host=args.target_db_host,
+        db_port=args.target_db_port,
+        db_name=args.target_db_name,
+        db_username=args.target_db_username,
+        db_password=args.target_db_password
+    )
+
+    file_writers = {
+        "housing_listing": lambda file_path, rows: write_housing_listing_file(
+            file_path=file_path, rows=rows, regions=args.regions, states=args.states, types=args.types, duplicate_ratio=args.duplicate_ratio
+        ),
+        "real_estate_transactions": lambda file_path, rows: write_real_estate_transactions_file(
+            file_path=file_path, rows=rows, localities=args.localities, types=args.types, duplicate_ratio=args.duplicate_ratio
+        )
+    }
+
+    results = []
+
+    for rows in args.rows:
+        for pipeline_name in args.pipeline:
+            file_path = file_writers[pipeline_name](file_path=os.path.join(args.data_folder, f"{pipeline_name}_{rows}.csv"), rows=rows)
+
+            results += benchmark_steps(pipeline_name=pipeline_name, file_path=file_path, rows=rows, db_config=db_config, logger=logger, sqlite_file=args.sqlite_file)
+            results += benchmark_pipeline(pipeline_name=pipeline_name, file_path=file_path, rows=rows, db_config=db_config, max_workers=args.max_workers, logger=logger, sqlite_file=args.sqlite_file)
+
+    for result in results:
+        logger.info(
+            f"pipeline_benchmark pipeline={result['pipeline']} rows={result['rows']} step={result['step']} "
+            f"seconds={result['seconds']:.3f} rows/s={result['rows_per_second']:,.0f} peak_rss={result['peak_rss_mb']:,.1f}MB"
+        )
@@ -0,0 +1,78 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+from utils.log.custom_logger import CustomLogger
+
+# The command lines measured, from the help to a pipeline failing its argument validation before loading anything
+SCENARIOS = {
+    "help": ["--help"],
+    "invalid_pipeline": ["--pipeline", "unknown_pipeline"],
+    "invalid_arguments": ["--pipeline", "housing_listing", "--chunk_size", "0"]
+}
+
+HEAVY_MODULES = ["pandas", "sqlalchemy", "numpy"]
+
+
+def measure_startup(arguments: list[str], runs: int) -> list[float]:
+    """
+        A function that runs the app with the given arguments in new interpreter processes, measuring the wall
+        time of each process from its start to its exit
+
+        returns:
+            list[float]: The elapsed seconds of each run
+    """
+
+    elapsed_seconds = []
+
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        subprocess.run([sys.executable, "app.py", *arguments], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        elapsed_seconds.append(time.perf_counter() - started_at)
+
+    return elapsed_seconds
+
+
+def get_imported_heavy_modules(arguments: list[str]) -> list[str]:
+    """
+        A function that runs the app with the given arguments once with the import time tracing of the interpreter,
+        returning which of the heavy modules it imported
+
+        returns:
+            list[str]: The imported heavy module names
+    """
+
+    result = subprocess.run([sys.executable, "-X", "importtime", "app.py", *arguments], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False)
+
+    imported_modules = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")}
+
+    return [module for module in HEAVY_MODULES if module in imported_modules]
+
+
+if __name__ == "__main__":
+
+    logger = CustomLogger()
+
+    argument_parser = argparse.ArgumentParser(
+        description="Measures the startup time of the app command line, which modules it loads before running a step",
+        prefix_chars="-",
+        allow_abbrev=False,
+        add_help=True
+    )
+
+    argument_parser.add_argument("--runs", type=int, default=10, help="The number of processes started for each scenario")
+    argument_parser.add_argument("--scenario", type=str, nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS), help="The command lines measured")
+
+    args = argument_parser.parse_args()
+
+    for scenario in args.scenario:
+        elapsed_seconds = measure_startup(arguments=SCENARIOS[scenario], runs=args.runs)
+        heavy_modules = get_imported_heavy_modules(arguments=SCENARIOS[scenario])
+
+        logger.info(
+            f"startup_benchmark scenario={scenario} runs={args.runs} "
+            f"median={statistics.median(elapsed_seconds):.3f}s min={min(elapsed_seconds):.3f}s "
+            f"heavy_modules=[{', '.join(heavy_modules)}]"
+        )
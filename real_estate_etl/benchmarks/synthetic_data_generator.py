@@ -0,0 +1,265 @@
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.log.custom_logger import CustomLogger
+
+STATE_ACRONYMS = [
+    "al", "ak", "az", "ar", "ca", "co", "ct", "de", "dc", "fl", "ga", "hi", "id", "il", "in", "ia", "ks", "ky", "la",
+    "me", "md", "ma", "mi", "mn", "ms", "mo", "mt", "ne", "nv", "nh", "nj", "nm", "ny", "nc", "nd", "oh", "ok", "or",
+    "pa", "sc", "sd", "tn", "tx", "ut", "vt", "va", "wa", "wv", "wi", "wy"
+]
+
+HOUSING_TYPES = ["apartment", "house", "condo", "townhouse", "duplex", "manufactured", "cottage/cabin", "loft", "flat", "in-law", "land", "assisted living"]
+LAUNDRY_OPTIONS = ["w/d in unit", "w/d hookups", "laundry on site", "laundry in bldg", "no laundry on site"]
+PARKING_OPTIONS = ["carport", "attached garage", "detached garage", "off-street parking", "street parking", "no parking", "valet parking"]
+
+TRANSACTION_PROPERTIES = ["Single Family", "Two Family", "Three Family", "Four Family", "Condo", "Commercial", "Vacant Land"]
+TRANSACTION_RESIDENTIALS = ["Detached House", "Duplex", "Triplex", "Fourplex", "Condominium"]
+TRANSACTION_FACES = ["North", "South", "East", "West", "North East", "North West", "South East", "South West"]
+
+UNKNOWN_VALUE = "?"
+
+BLOCK_SIZE = 1000000
+
+
+def build_categories(base_categories: list[str], cardinality: int, prefix: str) -> np.ndarray:
+    """
+        A function that returns cardinality distinct category values, starting by the real ones and completing
+        them with generated ones when more are requested
+
+        returns:
+            np.ndarray: The category values
+    """
+
+    generated_categories = [f"{prefix} {number}" for number in range(max(cardinality - len(base_categories), 0))]
+
+    return np.array([*base_categories, *generated_categories][:cardinality], dtype=object)
+
+
+def add_duplicates(df: pd.DataFrame, duplicate_ratio: float, random: np.random.Generator) -> pd.DataFrame:
+    """
+        A function that replaces the given ratio of the rows with exact copies of other rows of the block, the way
+        the vendor files repeat listings and transactions
+
+        returns:
+            pd.DataFrame: The pandas DataFrame with the duplicated rows
+    """
+
+    duplicated_rows = int(len(df.index) * duplicate_ratio)
+
+    if duplicated_rows == 0:
+        return df
+
+    unique_rows = len(df.index) - duplicated_rows
+
+    df_duplicates = df.iloc[random.integers(0, unique_rows, duplicated_rows)]
+
+    return pd.concat([df.iloc[:unique_rows], df_duplicates], ignore_index=True).sample(frac=1, random_state=random)
+
+
+def generate_housing_listing_block(
+    first_row: int,
+    rows: int,
+    regions: int,
+    states: int,
+    types: int,
+    duplicate_ratio: float,
+    random: np.random.Generator
+) -> pd.DataFrame:
+    """
+        A function that generates a block of housing.csv rows, each region belonging to a single state like in
+        the craigslist listings
+
+        returns:
+            pd.DataFrame: A pandas DataFrame with the housing.csv columns
+    """
+
+    region_numbers = random.integers(0, regions, rows)
+    region_names = np.array([f"region {number}" for number in range(regions)], dtype=object)
+    region_states = np.array(STATE_ACRONYMS[:states], dtype=object)[np.arange(regions) % states]
+
+    listing_ids = pd.Series(np.arange(first_row, first_row + rows, dtype="int64") + 7000000000)
+    listing_region_urls = pd.Series(region_names[region_numbers]).str.replace(" ", "", regex=False)
+
+    descriptions = np.array([
+        "Beautiful unit close to downtown.",
+        "Spacious, bright and \"recently\" renovated.\nPets welcome!",
+        "Quiet neighborhood, near schools, parks and shopping.",
+        ""
+    ], dtype=object)
+
+    return add_duplicates(
+        df=pd.DataFrame({
+            "id": listing_ids,
+            "url": "https://" + listing_region_urls + ".craigslist.org/apa/d/" + listing_ids.astype(str) + ".html",
+            "region": region_names[region_numbers],
+            "region_url": "https://" + listing_region_urls + ".craigslist.org",
+            "price": random.integers(300, 6000, rows),
+            "type": build_categories(HOUSING_TYPES, types, "type")[random.integers(0, types, rows)],
+            "sqfeet": random.integers(200, 4000, rows),
+            "beds": random.integers(0, 6, rows),
+            "baths": random.choice([1.0, 1.5, 2.0, 2.5, 3.0], rows),
+            "cats_allowed": random.integers(0, 2, rows),
+            "dogs_allowed": random.integers(0, 2, rows),
+            "smoking_allowed": random.integers(0, 2, rows),
+            "wheelchair_access": random.integers(0, 2, rows),
+            "electric_vehicle_charge": random.integers(0, 2, rows),
+            "comes_furnished": random.integers(0, 2, rows),
+            "laundry_options": np.array(LAUNDRY_OPTIONS, dtype=object)[random.integers(0, len(LAUNDRY_OPTIONS), rows)],
+            "parking_options": np.array(PARKING_OPTIONS, dtype=object)[random.integers(0, len(PARKING_OPTIONS), rows)],
+            "image_url": "https://images.craigslist.org/" + listing_ids.astype(str) + "_600x450.jpg",
+            "description": descriptions[random.integers(0, len(descriptions), rows)],
+            "lat": random.uniform(25.0, 49.0, rows).round(4),
+            "long": random.uniform(-124.0, -67.0, rows).round(4),
+            "state": region_states[region_numbers]
+        }),
+        duplicate_ratio=duplicate_ratio,
+        random=random
+    )
+
+
+def generate_real_estate_transactions_block(
+    first_row: int,
+    rows: int,
+    localities: int,
+    types: int,
+    duplicate_ratio: float,
+    random: np.random.Generator
+) -> pd.DataFrame:
+    """
+        A function that generates a block of real_estate_transactions.csv rows, including the unknown "?" values
+        present in the vendor file
+
+        returns:
+            pd.DataFrame: A pandas DataFrame with the real_estate_transactions.csv columns
+    """
+
+    transaction_dates = pd.Timestamp("2009-01-01") + pd.to_timedelta((first_row + np.arange(rows)) % 5000, unit="D")
+    estimated_values = random.integers(50000, 2000000, rows).astype("float64")
+
+    locality_names = np.array([UNKNOWN_VALUE, *[f"Locality {number}" for number in range(localities)]], dtype=object)
+
+    return add_duplicates(
+        df=pd.DataFrame({
+            "Date": transaction_dates.strftime("%Y-%m-%d"),
+            "Year": transaction_dates.year,
+            "Locality": locality_names[random.integers(0, len(locality_names), rows)],
+            "Estimated Value": estimated_values,
+            "Sale Price": (estimated_values * random.uniform(0.8, 1.3, rows)).round(1),
+            "Property": build_categories([UNKNOWN_VALUE, *TRANSACTION_PROPERTIES], types, "Property")[random.integers(0, types, rows)],
+            "Residential": build_categories([UNKNOWN_VALUE, *TRANSACTION_RESIDENTIALS], types, "Residential")[random.integers(0, types, rows)],
+            "num_rooms": random.integers(1, 8, rows),
+            "num_bathrooms": random.integers(1, 5, rows),
+            "carpet_area": random.uniform(400.0, 5000.0, rows).round(2),
+            "property_tax_rate": random.choice([1.025953, 1.0351, 1.1, 1.2], rows),
+            "Face": np.array(TRANSACTION_FACES, dtype=object)[random.integers(0, len(TRANSACTION_FACES), rows)]
+        }),
+        duplicate_ratio=duplicate_ratio,
+        random=random
+    )
+
+
+def write_synthetic_file(generate_block, file_path: str, rows: int, seed: int = 42, **generator_options) -> str:
+    """
+        A function that writes a synthetic source file block by block, so files of tens of millions of rows
+        are generated with a bounded memory usage
+
+        returns:
+            str: The written file path
+    """
+
+    random = np.random.default_rng(seed=seed)
+
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+
+    for first_row in range(0, rows, BLOCK_SIZE):
+        df_block = generate_block(first_row=first_row, rows=min(BLOCK_SIZE, rows - first_row), random=random, **generator_options)
+        df_block.to_csv(file_path, index=False, mode="w" if first_row == 0 else "a", header=first_row == 0)
+
+    return file_path
+
+
+def write_housing_listing_file(file_path: str, rows: int, regions: int = 400, states: int = 50, types: int = 12, duplicate_ratio: float = 0.0, seed: int = 42) -> str:
+    """
+        A function that writes a synthetic housing.csv file
+
+        returns:
+            str: The written file path
+    """
+
+    return write_synthetic_file(
+        generate_housing_listing_block,
+        file_path=file_path,
+        rows=rows,
+        seed=seed,
+        regions=regions,
+        states=min(states, len(STATE_ACRONYMS)),
+        types=types,
+        duplicate_ratio=duplicate_ratio
+    )
+
+
+def write_real_estate_transactions_file(file_path: str, rows: int, localities: int = 170, types: int = 8, duplicate_ratio: float = 0.0, seed: int = 42) -> str:
+    """
+        A function that writes a synthetic real_estate_transactions.csv file
+
+        returns:
+            str: The written file path
+    """
+
+    return write_synthetic_file(
+        generate_real_estate_transactions_block,
+        file_path=file_path,
+        rows=rows,
+        seed=seed,
+        localities=localities,
+        types=types,
+        duplicate_ratio=duplicate_ratio
+    )
+
+
+if __name__ == "__main__":
+
+    logger = CustomLogger()
+
+    argument_parser = argparse.ArgumentParser(
+        description="Generates synthetic housing.csv and real_estate_transactions.csv files",
+        prefix_chars="-",
+        allow_abbrev=False,
+        add_help=True
+    )
+
+    argument_parser.add_argument("--rows", type=int, default=10000, help="The number of rows of each generated file")
+    argument_parser.add_argument("--output_folder", type=str, default="../data/synthetic", help="The folder the files are generated in")
+    argument_parser.add_argument("--regions", type=int, default=400, help="The number of distinct housing regions")
+    argument_parser.add_argument("--states", type=int, default=50, help="The number of distinct housing states")
+    argument_parser.add_argument("--types", type=int, default=12, help="The number of distinct housing and transaction property types")
+    argument_parser.add_argument("--localities", type=int, default=170, help="The number of distinct transaction localities")
+    argument_parser.add_argument("--duplicate_ratio", type=float, default=0.0, help="The ratio of rows that are copies of other rows")
+    argument_parser.add_argument("--seed", type=int, default=42, help="The random generator seed")
+
+    args = argument_parser.parse_args()
+
+    housing_file = write_housing_listing_file(
+        file_path=os.path.join(args.output_folder, "housing.csv"),
+        rows=args.rows,
+        regions=args.regions,
+        states=args.states,
+        types=args.types,
+        duplicate_ratio=args.duplicate_ratio,
+        seed=args.seed
+    )
+
+    transactions_file = write_real_estate_transactions_file(
+        file_path=os.path.join(args.output_folder, "real_estate_transactions.csv"),
+        rows=args.rows,
+        localities=args.localities,
+        types=args.types,
+        duplicate_ratio=args.duplicate_ratio,
+        seed=args.seed
+    )
+
+    logger.info(f"synthetic_data_generator The files {housing_file} and {transactions_file} were generated with {args.rows} rows each.")
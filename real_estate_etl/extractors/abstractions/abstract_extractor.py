@@ -1,39 +1,254 @@
+from contextlib import contextmanager
+from typing import Iterator
+
 import sqlalchemy as sa
 import pandas as pd
 
 from notification.pager_duty_notifier import PagerDutyNotifier
 from models.config.db_connection_config import DBConnectionConfig
+from models.config.dimension_spec import DimensionSpec
+from models.config.load_config import LoadConfig
+from models.config.source_schema import SourceSchema
+from readers.source_file_reader import SourceFileReader
+from sinks.abstractions.abstract_sink import AbstractSink
+from sinks.postgres_sink import PostgresSink
+from utils.cache.dimension_cache import DimensionCache
+from utils.db.batch_writer import BatchWriter
+from utils.db.db_engine_registry import DBEngineRegistry
+from utils.log.custom_logger import CustomLogger
+from utils.metrics.run_metrics import RunMetrics
 
 class AbstractExtractor():
 
-    def __init__(self, target_db_config: DBConnectionConfig):
+    target_table: str = None
+    depends_on: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        source_df: pd.DataFrame,
+        target_db_config: DBConnectionConfig,
+        logger: CustomLogger,
+        load_config: LoadConfig = None,
+        db_engine_registry: DBEngineRegistry = None,
+        dimension_cache: DimensionCache = None,
+        run_metrics: RunMetrics = None,
+        sink: AbstractSink = None
+    ) -> None:
         self._notifier = PagerDutyNotifier()
-        
+
+        self._logger = logger
+        self._source_df = source_df
+
         self._target_db_config = target_db_config
-        self._db_engine = None
+        self._load_config = load_config or LoadConfig()
+        self._db_engine_registry = db_engine_registry or DBEngineRegistry()
+        self._dimension_cache = dimension_cache or DimensionCache()
+        self._run_metrics = run_metrics or RunMetrics()
+        self._sink = sink or PostgresSink(target_db_config=target_db_config, db_engine_registry=self._db_engine_registry, run_metrics=self._run_metrics)
+
+    @classmethod
+    def get_target_tables(cls) -> tuple[str, ...]:
+        """
+            A method that returns the tables written by the extractor, the ones its dependent steps wait for
+
+            returns:
+                tuple[str, ...]: The target table names
+        """
+
+        return (cls.target_table,)
 
     def _get_db_engine(self) -> sa.Engine:
         """
-            A protected method that returns a SQL Alachemy PostgreSQL Connection
+            A protected method that returns the run scoped SQL Alchemy PostgreSQL engine
 
             returns:
                 sa.Engine: A sqlalchemy db engine object
         """
 
-        if not self._db_engine:
-            self._db_engine = sa.create_engine(
-                url=f"postgresql://{self._target_db_config.db_username}:{self._target_db_config.db_password}@{self._target_db_config.db_host}:{self._target_db_config.db_port}/{self._target_db_config.db_name}"
-            )    
+        return self._db_engine_registry.get_engine(db_config=self._target_db_config)
+
+
+    @contextmanager
+    def _begin(self) -> Iterator[sa.Connection]:
+        """
+            A protected method that yields a sink connection within a transaction, being the run connection when
+            the pipeline runs as a single transaction
+
+            returns:
+                Iterator[sa.Connection]: A sqlalchemy connection within a transaction
+        """
+
+        with self._sink.begin() as connection:
+            yield connection
+
+
+    def _read_sql(self, sql: str | sa.TextClause, parse_dates: list[str] = None, params: dict = None) -> pd.DataFrame:
+        """
+            A protected method that returns the result of the given query, binding the given parameters
+
+            returns:
+                pd.DataFrame: A pandas DataFrame containing the query result
+        """
+
+        return self._sink.read_sql(sql=sql, parse_dates=parse_dates, params=params)
+
+
+    def _get_dimension_keys(self, table_name: str, sql: str, columns: dict[str, str] = None) -> pd.DataFrame:
+        """
+            A protected method that returns the natural key to surrogate id pairs of a dimension from the run
+            dimension cache, falling back to the given lookup query when the dimension wasn't loaded in this run
+
+            params:
+                table_name (str): The dimension table name
+                sql (str): The lookup query used when the dimension isn't cached
+                columns (dict[str, str]): The renaming applied to the cached columns to match the query columns
+
+            returns:
+                pd.DataFrame: A pandas DataFrame containing the dimension ids and their lowered natural keys
+        """
+
+        df_keys = self._dimension_cache.get(table_name)
+
+        if df_keys is None:
+            return self._read_sql(sql=sql)
+
+        return df_keys.rename(columns=columns or {})
+
+
+    def _read_csv(self, file_path: str, sep: str = ",", schema: SourceSchema = None):
+        """
+            A protected method that returns a pandas data frame for the given file, typed and pruned by the given schema
+        """
+
+        return next(SourceFileReader(file_path=file_path, sep=sep, schema=schema, logger=self._logger).read())
+
+
+    def _deduplicate(self, df: pd.DataFrame, key_columns: list[str], required_columns: list[str] = None) -> pd.DataFrame:
+        """
+            A protected method that drops the rows missing any of the required columns and then the rows repeating
+            the business key columns, keeping the first or the last occurrence of each key by the load config
+            duplicate keep policy, comparing only the key columns instead of every column of the rows
+
+            params:
+                df (pd.DataFrame): The data frame to deduplicate
+                key_columns (list[str]): The business key columns identifying a row
+                required_columns (list[str]): The columns a row can't be loaded without
+
+            returns:
+                pd.DataFrame: The deduplicated pandas DataFrame
+        """
+
+        if required_columns:
+            df = df.dropna(subset=required_columns)
+
+        return df.drop_duplicates(subset=key_columns, keep=self._load_config.duplicate_keep)
+
+
+    def _get_existing_keys(self, table_name: str, column: str, keys: pd.Series) -> pd.Series:
+        """
+            A protected method that returns which of the given keys already exist in the given column of the table
+
+            returns:
+                pd.Series: The existing keys
+        """
+
+        return self._sink.get_existing_keys(table_name=table_name, column=column, keys=keys)
+
+
+    def _bulk_load(self, df: pd.DataFrame, table_name: str) -> None:
+        """
+            A protected method that bulk loads a data frame into the given table of the sink, through PostgreSQL
+            COPY FROM STDIN on the default sink, in batches committed and retried on their own when the load
+            config sets a write batch size
+
+            params:
+                df (pd.DataFrame): The data frame whose columns match the target table columns
+                table_name (str): The target table name
+        """
+
+        if not self._load_config.write_batch_size:
+            self._sink.bulk_load(df=df, table_name=table_name)
+            return
+
+        def load_batch(df_batch: pd.DataFrame) -> int:
+            self._sink.bulk_load(df=df_batch, table_name=table_name, batch=True)
+            return len(df_batch.index)
+
+        self.__get_batch_writer().write(df=df, table_name=table_name, load=load_batch)
+
+
+    def _upsert_returning(self, df: pd.DataFrame, table_name: str, id_column: str, key_columns: dict[str, str]) -> pd.DataFrame:
+        """
+            A protected method that inserts the data frame natural keys missing in the given dimension table of the
+            sink and returns the ids of every one of them
+
+            params:
+                df (pd.DataFrame): The data frame containing the natural key columns
+                table_name (str): The target dimension table name
+                id_column (str): The dimension surrogate id column
+                key_columns (dict[str, str]): The natural key columns and their SQL types
+
+            returns:
+                pd.DataFrame: A pandas DataFrame with the id, the natural key columns and an inserted flag for
+                    each source key
+        """
+
+        return self._sink.upsert_returning(df=df, table_name=table_name, id_column=id_column, key_columns=key_columns)
+
 
-        return self._db_engine
- 
+    def _upsert_dimensions_returning(self, dimensions: list[tuple[DimensionSpec, pd.DataFrame]]) -> list[pd.DataFrame]:
+        """
+            A protected method that upserts the natural keys of every given dimension as a single sink batch
+
+            params:
+                dimensions (list[tuple[DimensionSpec, pd.DataFrame]]): The dimension specs along with the data
+                    frames containing their natural key columns
 
-    def _read_csv(self, file_path: str, sep: str = ","):
+            returns:
+                list[pd.DataFrame]: The id, natural key columns and inserted flag data frame of each dimension,
+                    in the given order
         """
-            A protected method that returns a pandas data frame for the given file
+
+        return self._sink.upsert_dimensions_returning(dimensions=dimensions)
+
+
+    def _bulk_load_new_rows(self, df: pd.DataFrame, table_name: str, key_columns: list[str] = None) -> int:
         """
-        
-        return pd.read_csv(filepath_or_buffer=file_path, sep=sep)
+            A protected method that loads only the data frame rows whose key columns don't exist yet in the given
+            table of the sink, through a temporary staging table, so the cost follows the batch size instead of the
+            target table size, in batches committed and retried on their own when the load config sets a write
+            batch size
+
+            params:
+                df (pd.DataFrame): The data frame whose columns match the target table columns
+                table_name (str): The target table name
+                key_columns (list[str]): The columns identifying an existing row in the target table, when not
+                    given the unique indexes of the target table alone decide
+
+            returns:
+                int: The number of inserted rows
+        """
+
+        if not self._load_config.write_batch_size:
+            return self._sink.bulk_load_new_rows(df=df, table_name=table_name, key_columns=key_columns)
+
+        return self.__get_batch_writer().write(
+            df=df,
+            table_name=table_name,
+            load=lambda df_batch: self._sink.bulk_load_new_rows(df=df_batch, table_name=table_name, key_columns=key_columns, batch=True)
+        )
+
+
+    def __get_batch_writer(self) -> BatchWriter:
+        """
+            A private method that returns the writer splitting the loads of the extractor into batches
+
+            returns:
+                BatchWriter: The batch writer over the extractor sink
+        """
+
+        return BatchWriter(sink=self._sink, load_config=self._load_config, logger=self._logger, run_metrics=self._run_metrics)
+
 
     def extract(self):
         raise NotImplementedError("The method extract was not implemented")
\ No newline at end of file
@@ -0,0 +1,99 @@
+import pandas as pd
+
+from extractors.abstractions.abstract_extractor import AbstractExtractor
+from models.config.dimension_spec import DimensionSpec
+
+class DimensionExtractor(AbstractExtractor):
+
+    dimensions: tuple[DimensionSpec, ...] = ()
+    depends_on = ()
+
+    @classmethod
+    def for_dimensions(cls, *dimensions: DimensionSpec) -> type:
+        """
+            A method that returns the pipeline step extracting the given dimensions, named by the dimension step
+            name or after the dimension table when it extracts a single one (like LaundryOptionsExtractor), the
+            dimensions being upserted together in one batch by the sink otherwise
+
+            returns:
+                type: A DimensionExtractor subclass bound to the given dimensions
+        """
+
+        if len(dimensions) == 1 and dimensions[0].step_name:
+            name = dimensions[0].step_name
+        elif len(dimensions) == 1:
+            name = "".join(word.capitalize() for word in dimensions[0].table_name.split("_")) + "Extractor"
+        else:
+            name = "DimensionsExtractor"
+
+        return type(name, (cls,), {"dimensions": tuple(dimensions), "target_table": dimensions[0].table_name})
+
+    @classmethod
+    def get_target_tables(cls) -> tuple[str, ...]:
+        """
+            A method that returns the dimension tables written by the step
+
+            returns:
+                tuple[str, ...]: The target table names
+        """
+
+        return tuple(dimension.table_name for dimension in cls.dimensions)
+
+    def __get_source_keys(self, dimension: DimensionSpec) -> pd.DataFrame:
+        """
+            A private method that returns the distinct natural keys of the dimension present in the source, without
+            the missing and sentinel values and with its capitalized columns capitalized
+
+            returns:
+                pd.DataFrame: A pandas DataFrame with the dimension natural key columns
+        """
+
+        df_source_keys = (
+            self._source_df[list(dimension.source_columns)]
+                .drop_duplicates()
+                .dropna()
+                .rename(columns=dimension.source_columns)
+        )
+
+        if dimension.sentinel_values:
+            df_source_keys = df_source_keys[~df_source_keys.isin(dimension.sentinel_values).any(axis="columns")]
+
+        return df_source_keys.assign(**{
+            column: df_source_keys[column].str.capitalize()
+            for column in dimension.capitalized_columns
+        })
+
+    def extract(self):
+        """
+            A method that extracts the dimensions of the step from the source, upserting all of them through a
+            single sink batch and caching their ids for the fact extractors
+
+            returns:
+                bool: A boolean flag indicating if the extraction was successfully executed
+        """
+
+        step_name = type(self).__name__
+        descriptions = [dimension.table_name.replace("_", " ") for dimension in self.dimensions]
+
+        self._logger.info(f"{step_name}.extract Starting {', '.join(descriptions)} Extraction")
+
+        try:
+            dfs_keys = self._upsert_dimensions_returning(dimensions=[
+                (dimension, self.__get_source_keys(dimension=dimension))
+                for dimension in self.dimensions
+            ])
+        except:
+            self._notifier.notify()
+            return False
+
+        for dimension, description, df_keys in zip(self.dimensions, descriptions, dfs_keys):
+            self._dimension_cache.update(table_name=dimension.table_name, df_keys=df_keys, id_column=dimension.id_column, key_columns=list(dimension.key_columns))
+
+            records_appended = int(df_keys["inserted"].sum())
+
+            if records_appended > 0:
+                self._logger.info(f"{step_name}.extract {records_appended} records were added to the {description}.")
+            else:
+                self._logger.info(f"{step_name}.extract There are no records to add to the {description}.")
+
+        return True
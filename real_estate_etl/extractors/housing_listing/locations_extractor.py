@@ -1,23 +1,11 @@
 import pandas as pd
 
-from utils.log.custom_logger import CustomLogger
-from models.config.db_connection_config import DBConnectionConfig
 from extractors.abstractions.abstract_extractor import AbstractExtractor
 
 class LocationsExtractor(AbstractExtractor):
 
-    def __init__(
-        self, 
-        source_df: pd.DataFrame,
-        target_db_config: DBConnectionConfig,
-        logger: CustomLogger
-    ) -> None:
-        
-        super().__init__(target_db_config=target_db_config)
-        
-        self._logger = logger
-        self._source_df = source_df
-
+    target_table = "locations"
+    depends_on = ("regions", "states")
 
     def __get_existing_regions(self) -> pd.DataFrame:
         """
@@ -27,7 +15,7 @@ class LocationsExtractor(AbstractExtractor):
                 pd.DataFrame: A pandas DataFrame containing the existing regions
         """
 
-        return pd.read_sql(sql="SELECT * FROM regions", con=self._get_db_engine())
+        return self._read_sql(sql="SELECT * FROM regions")
     
 
     def __get_existing_states(self) -> pd.DataFrame:
@@ -38,19 +26,19 @@ class LocationsExtractor(AbstractExtractor):
                 pd.DataFrame: A pandas DataFrame containing the existing states
         """
 
-        return pd.read_sql(sql="SELECT * FROM states", con=self._get_db_engine())
+        return self._read_sql(sql="SELECT * FROM states")
     
 
-    def __get_existing_locations(self) -> pd.DataFrame:
+    def __update_locations_cache(self, df_locations: pd.DataFrame, df_source_location_keys: pd.DataFrame) -> None:
         """
-            A private method that returns the existing locations in the target db
-
-            returns
-                pd.DataFrame: A pandas DataFrame containing the existing locations
+            A private method that caches the location ids by the region, region url and state keys used by the
+            property listing, for the locations present in the source
         """
 
-        return pd.read_sql(sql="SELECT * FROM locations", con=self._get_db_engine())
-    
+        df_location_keys = df_locations.merge(df_source_location_keys, how="inner", on=["region_id", "state_id"])
+
+        self._dimension_cache.update(table_name="locations", df_keys=df_location_keys, id_column="location_id", key_columns=["region", "region_url", "state"])
+
     def extract(self):
         """
             A method that extracts the locations from a housing_listing file
@@ -67,13 +55,12 @@ class LocationsExtractor(AbstractExtractor):
                 .dropna()
         )
 
-        df_source_locations["region"] = df_source_locations["region"].str.lower()
-        df_source_locations["region_url"] = df_source_locations["region_url"].str.lower()
-        df_source_locations["state"] = df_source_locations["state"].str.lower()
+        df_existing_regions = self._dimension_cache.get("regions")
 
-        df_existing_regions = self.__get_existing_regions()[["region_id","description", "region_url"]]
-        df_existing_regions["description"] = df_existing_regions["description"].str.lower()
-        df_existing_regions["region_url"] = df_existing_regions["region_url"].str.lower()
+        if df_existing_regions is None:
+            df_existing_regions = self.__get_existing_regions()[["region_id","description", "region_url"]]
+            df_existing_regions["description"] = df_existing_regions["description"].str.lower()
+            df_existing_regions["region_url"] = df_existing_regions["region_url"].str.lower()
 
         df_existing_states = self.__get_existing_states()[["state_id","acronym"]]
         df_existing_states["acronym"] = df_existing_states["acronym"].str.lower()
@@ -81,27 +68,23 @@ class LocationsExtractor(AbstractExtractor):
         df_source_locations = df_source_locations.merge(df_existing_regions, how="left", left_on=["region", "region_url"], right_on=["description","region_url"])
         df_source_locations = df_source_locations.merge(df_existing_states, how="left", left_on="state", right_on="acronym")
 
-        df_source_locations = df_source_locations[["region_id", "state_id"]]
+        df_source_location_keys = df_source_locations[["region", "region_url", "state", "region_id", "state_id"]]
 
-        df_existing_locations = self.__get_existing_locations()[["region_id", "state_id"]]
+        df_source_locations = df_source_locations[["region_id", "state_id"]]
 
-        df_new_locations = df_source_locations.merge(df_existing_locations, how="outer", indicator=True)
-        df_new_locations = df_new_locations[(df_new_locations["_merge"] == 'left_only')].drop('_merge', axis="columns")
-        df_new_locations = df_new_locations[["region_id", "state_id"]]
+        try:
+            df_locations = self._upsert_returning(df=df_source_locations, table_name='locations', id_column="location_id", key_columns={"region_id": "INTEGER", "state_id": "INTEGER"})
+        except:
+            self._notifier.notify()
+            return False
 
-        records_to_append = len(df_new_locations.index)
+        self.__update_locations_cache(df_locations=df_locations, df_source_location_keys=df_source_location_keys)
 
-        if records_to_append > 0:
-            self._logger.info(f"LocationsExtractor.extract There are {records_to_append} records to add to the locations.")
+        records_appended = int(df_locations["inserted"].sum())
 
-            try:
-                df_new_locations.to_sql('locations', con=self._get_db_engine(), index=False, if_exists='append')
-            except:
-                self._notifier.notify()
-                return False
-            
-            self._logger.info("The locations were successfully added.")
+        if records_appended > 0:
+            self._logger.info(f"LocationsExtractor.extract {records_appended} records were added to the locations.")
         else:
             self._logger.info("LocationsExtractor.extract There are no records to add to the locations.")
 
-        return True
\ No newline at end of file
+        return True
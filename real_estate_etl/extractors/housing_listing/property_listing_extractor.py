@@ -1,33 +1,42 @@
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 
-from utils.log.custom_logger import CustomLogger
-from models.config.db_connection_config import DBConnectionConfig
 from extractors.abstractions.abstract_extractor import AbstractExtractor
+from models.config.db_connection_config import DBConnectionConfig
+from models.config.load_config import LoadConfig
+from transformers.lookup_joiner import LookupJoiner
+from utils.db.db_engine_registry import DBEngineRegistry
+from utils.log.custom_logger import CustomLogger
+from utils.metrics.run_metrics import RunMetrics
+from utils.partitioning.hash_partitioner import HashPartitioner
 
 
 class PropertyListingExtractor(AbstractExtractor):
 
-    def __init__(
-        self, 
-        source_df: pd.DataFrame,
-        target_db_config: DBConnectionConfig,
-        logger: CustomLogger
-    ) -> None:
-        
-        super().__init__(target_db_config=target_db_config)
-        
-        self._logger = logger
-        self._source_df = source_df
+    target_table = "property_listing"
+    depends_on = ("locations", "property_types", "parking_options", "laundry_options")
+
+    KEY_COLUMNS = ["id"]
+    REQUIRED_COLUMNS = [
+        "id", "type", "sqfeet", "price", "beds", "baths",
+        "cats_allowed", "dogs_allowed", "smoking_allowed", "wheelchair_access", "electric_vehicle_charge", "comes_furnished"
+    ]
 
-    def __get_existing_property_listing(self) -> pd.DataFrame:
+    def __get_existing_property_listing(self, property_listing_ids: pd.Series) -> pd.DataFrame:
         """
-            A private method that returns the existing listed properties
+            A private method that returns which of the given listed properties ids already exist, so a partition
+            only looks up its own ids
 
             returns
-                pd.DataFrame: A pandas DataFrame containing the existing listed properties
+                pd.DataFrame: A pandas DataFrame containing the existing listed properties ids
         """
 
-        return pd.read_sql(sql="SELECT * FROM property_listing", con=self._get_db_engine())
+        df_existing_property_listing = self._get_existing_keys(table_name="property_listing", column="property_listing_id", keys=property_listing_ids.astype("int64"))
+
+        return df_existing_property_listing.to_frame()
     
 
     def __get_existing_property_types(self) -> pd.DataFrame:
@@ -38,7 +47,11 @@ class PropertyListingExtractor(AbstractExtractor):
                 pd.DataFrame: A pandas DataFrame containing the existing property types
         """
 
-        return pd.read_sql(sql="SELECT property_type_id, LOWER(description) AS type FROM property_types", con=self._get_db_engine())
+        return self._get_dimension_keys(
+            table_name="property_types",
+            sql="SELECT property_type_id, LOWER(description) AS type FROM property_types",
+            columns={"description": "type"}
+        )
     
 
     def __get_existing_locations(self) -> pd.DataFrame:
@@ -61,7 +74,7 @@ class PropertyListingExtractor(AbstractExtractor):
                 ON states.state_id = locations.state_id
         """
 
-        return pd.read_sql(sql=query, con=self._get_db_engine())
+        return self._get_dimension_keys(table_name="locations", sql=query)
     
 
     def __get_existing_parking_options(self) -> pd.DataFrame:
@@ -72,7 +85,11 @@ class PropertyListingExtractor(AbstractExtractor):
                 pd.DataFrame: A pandas DataFrame containing the existing parking options
         """
 
-        return pd.read_sql(sql="SELECT parking_option_id, LOWER(description) AS parking_options FROM parking_options", con=self._get_db_engine())
+        return self._get_dimension_keys(
+            table_name="parking_options",
+            sql="SELECT parking_option_id, LOWER(description) AS parking_options FROM parking_options",
+            columns={"description": "parking_options"}
+        )
     
 
     def __get_existing_laundry_options(self) -> pd.DataFrame:
@@ -83,12 +100,34 @@ class PropertyListingExtractor(AbstractExtractor):
                 pd.DataFrame: A pandas DataFrame containing the existing laundry options
         """
 
-        return pd.read_sql(sql="SELECT laundry_option_id, LOWER(description) AS laundry_options FROM laundry_options", con=self._get_db_engine())
+        return self._get_dimension_keys(
+            table_name="laundry_options",
+            sql="SELECT laundry_option_id, LOWER(description) AS laundry_options FROM laundry_options",
+            columns={"description": "laundry_options"}
+        )
     
 
+    def __get_dimension_keys(self) -> dict[str, pd.DataFrame]:
+        """
+            A private method that returns the natural keys and ids of every dimension referenced by the property
+            listing, looked up once and shared by every partition
+
+            returns:
+                dict[str, pd.DataFrame]: The dimension keys pandas DataFrames by dimension table name
+        """
+
+        return {
+            "locations": self.__get_existing_locations(),
+            "property_types": self.__get_existing_property_types(),
+            "parking_options": self.__get_existing_parking_options(),
+            "laundry_options": self.__get_existing_laundry_options()
+        }
+
+
     def extract(self):
         """
-            A method that extracts the the property listing from a housing_listing file
+            A method that extracts the the property listing from a housing_listing file, transforming and loading
+            it in hash partitions by worker processes when more than one fact load worker is configured
 
             returns:
                 bool: A boolean flag indicating if the extraction was successfully executed
@@ -96,57 +135,106 @@ class PropertyListingExtractor(AbstractExtractor):
 
         self._logger.info("PropertyListingExtractor.extract Starting Property Listing Extraction")
 
-        df_source_property_listing = (
-            self._source_df
-                .drop_duplicates()
-                .dropna()
-        )
+        dimension_keys = self.__get_dimension_keys()
+
+        workers = self._load_config.fact_load_workers
+
+        if workers > 1 and not self._sink.supports_worker_processes():
+            self._logger.warning("PropertyListingExtractor.extract The target can't be shared with worker processes (like a single transaction run), loading the property listing in process.")
+            workers = 1
+
+        if workers == 1:
+            return self._transform_and_load(dimension_keys=dimension_keys)
+
+        return self.__transform_and_load_partitions(dimension_keys=dimension_keys, workers=workers)
+
+
+    def __transform_and_load_partitions(self, dimension_keys: dict[str, pd.DataFrame], workers: int) -> bool:
+        """
+            A private method that hash partitions the source listings by their id and sends the transformation and
+            load of each partition to a pool of worker processes, each one loading through its own DB connection
+
+            returns:
+                bool: A boolean flag indicating if every partition was successfully loaded
+        """
+
+        df_partitions = HashPartitioner(partitions=workers).partition(df=self._source_df, columns=["id"])
+
+        self._logger.info(f"PropertyListingExtractor.extract Loading the property listing in {len(df_partitions)} partitions by {workers} worker processes.")
+
+        # The spawned workers don't inherit the locks held by the threads running the other pipeline steps
+        with ProcessPoolExecutor(max_workers=min(workers, len(df_partitions)), mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = [
+                executor.submit(
+                    load_property_listing_partition,
+                    partition_number=partition_number,
+                    df_partition=df_partition,
+                    dimension_keys=dimension_keys,
+                    target_db_config=self._target_db_config,
+                    load_config=self._load_config
+                )
+                for partition_number, df_partition in enumerate(df_partitions, start=1)
+            ]
+
+            partitions_succeeded = True
+
+            for future in futures:
+                try:
+                    partition_succeeded, counters = future.result()
+                except:
+                    self._notifier.notify()
+                    partitions_succeeded = False
+                    continue
 
-        df_source_property_listing["region"] = df_source_property_listing["region"].str.lower()
-        df_source_property_listing["region_url"] = df_source_property_listing["region_url"].str.lower()
-        df_source_property_listing["state"] = df_source_property_listing["state"].str.lower()
-        df_source_property_listing["type"] = df_source_property_listing["type"].str.lower()
-        df_source_property_listing["parking_options"] = df_source_property_listing["parking_options"].str.lower()
+                self._run_metrics.add(**counters)
+                partitions_succeeded = partitions_succeeded and partition_succeeded
+
+        return partitions_succeeded
+
+
+    def _transform_and_load(self, dimension_keys: dict[str, pd.DataFrame]) -> bool:
+        """
+            A protected method that resolves the dimension ids of the source listings and loads the ones that don't
+            exist yet, being run over the whole source or over a single partition of it by a worker process
+
+            returns:
+                bool: A boolean flag indicating if the load was successfully executed
+        """
+
+        df_source_property_listing = self._deduplicate(df=self._source_df, key_columns=self.KEY_COLUMNS, required_columns=self.REQUIRED_COLUMNS)
 
         df_source_property_listing = df_source_property_listing.astype(
             dict.fromkeys(["cats_allowed", "dogs_allowed", "smoking_allowed", "wheelchair_access", "electric_vehicle_charge", "comes_furnished"], bool)
         )
 
-        df_existing_locations = self.__get_existing_locations()
-        
-        df_source_property_listing = df_source_property_listing.merge(
-            df_existing_locations, 
-            how="left", 
-            left_on=["region", "region_url", "state"], 
-            right_on=["region", "region_url", "state"], 
-            indicator=False
-        )
+        lookup_joiner = LookupJoiner()
 
-        df_existing_property_types = self.__get_existing_property_types()
-
-        df_source_property_listing = df_source_property_listing.merge(
-            df_existing_property_types, 
-            how="left", 
-            on="type", 
-            indicator=False
+        df_source_property_listing = lookup_joiner.join(
+            df=df_source_property_listing,
+            df_keys=dimension_keys["locations"],
+            id_column="location_id",
+            left_on=["region", "region_url", "state"]
         )
 
-        df_existing_parking_options = self.__get_existing_parking_options()
-
-        df_source_property_listing = df_source_property_listing.merge(
-            df_existing_parking_options, 
-            how="left", 
-            on="parking_options", 
-            indicator=False
+        df_source_property_listing = lookup_joiner.join(
+            df=df_source_property_listing,
+            df_keys=dimension_keys["property_types"],
+            id_column="property_type_id",
+            left_on=["type"]
         )
 
-        df_existing_laundry_options = self.__get_existing_laundry_options()
+        df_source_property_listing = lookup_joiner.join(
+            df=df_source_property_listing,
+            df_keys=dimension_keys["parking_options"],
+            id_column="parking_option_id",
+            left_on=["parking_options"]
+        )
 
-        df_source_property_listing = df_source_property_listing.merge(
-            df_existing_laundry_options, 
-            how="left", 
-            on="laundry_options", 
-            indicator=False
+        df_source_property_listing = lookup_joiner.join(
+            df=df_source_property_listing,
+            df_keys=dimension_keys["laundry_options"],
+            id_column="laundry_option_id",
+            left_on=["laundry_options"]
         )
 
         df_columns_to_use = [
@@ -155,16 +243,7 @@ class PropertyListingExtractor(AbstractExtractor):
             "comes_furnished", "laundry_option_id", "parking_option_id", "image_url", "description", "lat", "long"
         ]
 
-        df_source_property_listing = df_source_property_listing[df_columns_to_use]
-
-        df_existing_property_listing = self.__get_existing_property_listing()[["property_listing_id"]]
-
-        df_new_property_listing = df_source_property_listing.merge(df_existing_property_listing, how="outer", left_on="id", right_on="property_listing_id", indicator=True)
-        
-        df_new_property_listing = df_new_property_listing[(df_new_property_listing["_merge"] == 'left_only')].drop('_merge', axis="columns")
-        df_new_property_listing = df_new_property_listing[df_columns_to_use]
-
-        df_new_property_listing = df_new_property_listing.rename(columns={
+        df_source_property_listing = df_source_property_listing[df_columns_to_use].rename(columns={
             "id": "property_listing_id",
             "url": "property_listing_url",
             "image_url": "property_image_url",
@@ -178,13 +257,21 @@ class PropertyListingExtractor(AbstractExtractor):
             "baths": "bathrooms"
         })
 
+        if self._load_config.server_side_dedup:
+            return self.__load_new_property_listing_through_staging(df_source_property_listing)
+
+        df_existing_property_listing = self.__get_existing_property_listing(property_listing_ids=df_source_property_listing["property_listing_id"])
+
+        df_new_property_listing = df_source_property_listing.merge(df_existing_property_listing, how="outer", on="property_listing_id", indicator=True)
+        df_new_property_listing = df_new_property_listing[(df_new_property_listing["_merge"] == 'left_only')].drop('_merge', axis="columns")
+
         records_to_append = len(df_new_property_listing.index)
 
         if records_to_append > 0:
             self._logger.info(f"PropertyListingExtractor.extract There are {records_to_append} records to add to the property listing.")
 
             try:
-                df_new_property_listing.to_sql('property_listing', con=self._get_db_engine(), index=False, if_exists='append')
+                self._bulk_load(df=df_new_property_listing, table_name='property_listing')
             except:
                 self._notifier.notify()
                 return False
@@ -194,3 +281,63 @@ class PropertyListingExtractor(AbstractExtractor):
             self._logger.info("PropertyListingExtractor.extract There are no records to add to the property listings.")
 
         return True
+
+
+    def __load_new_property_listing_through_staging(self, df_property_listing: pd.DataFrame) -> bool:
+        """
+            A private method that loads the property listing batch through a staging table, letting the
+            target db insert only the listings that don't exist yet
+
+            returns:
+                bool: A boolean flag indicating if the load was successfully executed
+        """
+
+        self._logger.info(f"PropertyListingExtractor.extract Loading {len(df_property_listing.index)} records through the property listing staging table.")
+
+        try:
+            records_appended = self._bulk_load_new_rows(df=df_property_listing, table_name='property_listing', key_columns=["property_listing_id"])
+        except:
+            self._notifier.notify()
+            return False
+
+        self._logger.info(f"PropertyListingExtractor.extract {records_appended} records were added to the property listings.")
+
+        return True
+
+
+def load_property_listing_partition(
+    partition_number: int,
+    df_partition: pd.DataFrame,
+    dimension_keys: dict[str, pd.DataFrame],
+    target_db_config: DBConnectionConfig,
+    load_config: LoadConfig
+) -> tuple[bool, dict[str, int]]:
+    """
+        A function that transforms and loads a property listing partition within a worker process, on its own DB
+        engine, returning the load outcome along with its counters to be added to the run metrics
+
+        returns:
+            tuple[bool, dict[str, int]]: The partition load success flag and its metrics counters
+    """
+
+    run_metrics = RunMetrics()
+    db_engine_registry = DBEngineRegistry(run_metrics=run_metrics)
+
+    extractor = PropertyListingExtractor(
+        source_df=df_partition,
+        target_db_config=target_db_config,
+        logger=CustomLogger(),
+        load_config=load_config,
+        db_engine_registry=db_engine_registry,
+        run_metrics=run_metrics
+    )
+
+    try:
+        with run_metrics.measure_step(step="PropertyListingExtractor.partition", chunk=partition_number) as step_metrics:
+            step_metrics.success = extractor._transform_and_load(dimension_keys=dimension_keys)
+    finally:
+        db_engine_registry.dispose()
+
+    counters = ["db_rows_read", "rows_written", "rows_rejected", "write_retries", "db_round_trips", "bytes_sent", "bytes_received"]
+
+    return step_metrics.success, {counter: getattr(step_metrics, counter) for counter in counters}
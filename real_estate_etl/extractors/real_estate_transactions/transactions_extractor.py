@@ -1,23 +1,20 @@
 import pandas as pd
 
-from utils.log.custom_logger import CustomLogger
-from models.config.db_connection_config import DBConnectionConfig
 from extractors.abstractions.abstract_extractor import AbstractExtractor
+from transformers.lookup_joiner import LookupJoiner
+from utils.hashing.row_hasher import RowHasher
 
 class TransactionsExtractor(AbstractExtractor):
 
-    def __init__(
-        self, 
-        source_df: pd.DataFrame,
-        target_db_config: DBConnectionConfig,
-        logger: CustomLogger
-    ) -> None:
-        
-        super().__init__(target_db_config=target_db_config)
-        
-        self._logger = logger
-        self._source_df = source_df
+    target_table = "transactions"
+    depends_on = ("building_types", "property_types", "directions", "cities")
 
+    ROW_HASH_COLUMNS = [
+        "transaction_date","property_estimated_value","property_city_id","property_sales_value","building_type_id",
+        "property_type_id","bedrooms","bathrooms","property_carpet_area","property_tax_rate","property_face_direction_id"
+    ]
+
+    REQUIRED_COLUMNS = ["Date", "Sale Price", "Face"]
 
     def __get_existing_building_types(self) -> pd.DataFrame:
         """
@@ -27,7 +24,11 @@ class TransactionsExtractor(AbstractExtractor):
                 pd.DataFrame: A pandas DataFrame containing the existing building types
         """
 
-        return pd.read_sql(sql="SELECT building_type_id, LOWER(description) AS Property FROM building_types", con=self._get_db_engine())
+        return self._get_dimension_keys(
+            table_name="building_types",
+            sql="SELECT building_type_id, LOWER(description) AS Property FROM building_types",
+            columns={"description": "property"}
+        )
 
 
     def __get_existing_cities(self) -> pd.DataFrame:
@@ -38,7 +39,11 @@ class TransactionsExtractor(AbstractExtractor):
                 pd.DataFrame: A pandas DataFrame containing the existing cities
         """
 
-        return pd.read_sql(sql="SELECT city_id, LOWER(name) AS Locality FROM cities", con=self._get_db_engine())
+        return self._get_dimension_keys(
+            table_name="cities",
+            sql="SELECT city_id, LOWER(name) AS Locality FROM cities",
+            columns={"name": "locality"}
+        )
     
 
     def __get_existing_directions(self) -> pd.DataFrame:
@@ -49,7 +54,11 @@ class TransactionsExtractor(AbstractExtractor):
                 pd.DataFrame: A pandas DataFrame containing the existing directions
         """
 
-        return pd.read_sql(sql="SELECT direction_id, LOWER(description) AS Face FROM directions", con=self._get_db_engine())
+        return self._get_dimension_keys(
+            table_name="directions",
+            sql="SELECT direction_id, LOWER(description) AS Face FROM directions",
+            columns={"description": "face"}
+        )
     
 
     def __get_existing_property_types(self) -> pd.DataFrame:
@@ -60,18 +69,23 @@ class TransactionsExtractor(AbstractExtractor):
                 pd.DataFrame: A pandas DataFrame containing the existing property types
         """
 
-        return pd.read_sql(sql="SELECT property_type_id, LOWER(description) AS Residential FROM property_types", con=self._get_db_engine())
+        return self._get_dimension_keys(
+            table_name="property_types",
+            sql="SELECT property_type_id, LOWER(description) AS Residential FROM property_types",
+            columns={"description": "residential"}
+        )
     
 
-    def __get_existing_transactions(self) -> pd.DataFrame:
+    def __get_existing_row_hashes(self, row_hashes: pd.Series) -> set[int]:
         """
-            A private method that returns the existing property transactions in the target db
+            A private method that returns which of the given row hashes already exist in the target db, looking
+            them up through the transactions row hash unique index
 
             returns
-                pd.DataFrame: A pandas DataFrame containing the existing property transactions
+                set[int]: The row hashes of the existing property transactions
         """
 
-        return pd.read_sql(sql="SELECT * FROM transactions", con=self._get_db_engine())
+        return set(self._get_existing_keys(table_name="transactions", column="row_hash", keys=row_hashes))
     
 
     def extract(self):
@@ -84,55 +98,40 @@ class TransactionsExtractor(AbstractExtractor):
 
         self._logger.info("TransactionsExtractor.extract Starting Property Transactions Extraction")
 
-        df_source_property_transactions = (
-            self._source_df
-                .drop_duplicates()
-                .dropna()
-        )
-
-        df_source_property_transactions["Locality"] = df_source_property_transactions["Locality"].str.lower()
-        df_source_property_transactions["Property"] = df_source_property_transactions["Property"].str.lower()
-        df_source_property_transactions["Residential"] = df_source_property_transactions["Residential"].str.lower()
-        df_source_property_transactions["Face"] = df_source_property_transactions["Face"].str.lower()
+        df_source_property_transactions = self._source_df.dropna(subset=self.REQUIRED_COLUMNS)
 
-        df_existing_cities = self.__get_existing_cities()
+        lookup_joiner = LookupJoiner()
 
-        df_source_property_transactions = df_source_property_transactions.merge(
-            df_existing_cities, 
-            how="left", 
-            left_on="Locality",
-            right_on="locality",
-            indicator=False
+        df_source_property_transactions = lookup_joiner.join(
+            df=df_source_property_transactions,
+            df_keys=self.__get_existing_cities(),
+            id_column="city_id",
+            left_on=["Locality"],
+            right_on=["locality"]
         )
 
-        df_existing_building_types = self.__get_existing_building_types()
-
-        df_source_property_transactions = df_source_property_transactions.merge(
-            df_existing_building_types, 
-            how="left", 
-            left_on="Property",
-            right_on="property",
-            indicator=False
+        df_source_property_transactions = lookup_joiner.join(
+            df=df_source_property_transactions,
+            df_keys=self.__get_existing_building_types(),
+            id_column="building_type_id",
+            left_on=["Property"],
+            right_on=["property"]
         )
 
-        df_existing_property_types = self.__get_existing_property_types()
-
-        df_source_property_transactions = df_source_property_transactions.merge(
-            df_existing_property_types, 
-            how="left", 
-            left_on="Residential",
-            right_on="residential",
-            indicator=False
+        df_source_property_transactions = lookup_joiner.join(
+            df=df_source_property_transactions,
+            df_keys=self.__get_existing_property_types(),
+            id_column="property_type_id",
+            left_on=["Residential"],
+            right_on=["residential"]
         )
 
-        df_get_existing_directions = self.__get_existing_directions()
-
-        df_source_property_transactions = df_source_property_transactions.merge(
-            df_get_existing_directions, 
-            how="left", 
-            left_on="Face",
-            right_on="face",
-            indicator=False
+        df_source_property_transactions = lookup_joiner.join(
+            df=df_source_property_transactions,
+            df_keys=self.__get_existing_directions(),
+            id_column="direction_id",
+            left_on=["Face"],
+            right_on=["face"]
         )
 
         df_original_columns_to_use = [
@@ -140,10 +139,7 @@ class TransactionsExtractor(AbstractExtractor):
             "Face", "city_id", "building_type_id", "property_type_id", "direction_id"
         ]
 
-        df_new_columns_to_use = [
-            "transaction_date","property_estimated_value","property_city_id","property_sales_value","building_type_id",
-            "property_type_id","bedrooms","bathrooms","property_carpet_area","property_tax_rate","property_face_direction_id"
-        ]
+        df_new_columns_to_use = self.ROW_HASH_COLUMNS
 
         df_source_property_transactions = df_source_property_transactions[df_original_columns_to_use]
         df_source_property_transactions = df_source_property_transactions.rename(columns={
@@ -157,11 +153,20 @@ class TransactionsExtractor(AbstractExtractor):
             "city_id": "property_city_id"
         })
 
-        df_existing_transactions = self.__get_existing_transactions()[df_new_columns_to_use]
+        # The transactions have no source id, their business key is the row hash of the target columns
+        df_source_property_transactions = self._deduplicate(
+            df=df_source_property_transactions[df_new_columns_to_use].assign(
+                row_hash=RowHasher().hash_rows(df=df_source_property_transactions, columns=df_new_columns_to_use)
+            ),
+            key_columns=["row_hash"]
+        )
+
+        if self._load_config.server_side_dedup:
+            return self.__load_new_transactions_through_staging(df_property_transactions=df_source_property_transactions)
+
+        existing_row_hashes = self.__get_existing_row_hashes(row_hashes=df_source_property_transactions["row_hash"])
 
-        df_new_property_transactions = df_source_property_transactions.merge(df_existing_transactions, how="outer", on=df_new_columns_to_use, indicator=True)
-        df_new_property_transactions = df_new_property_transactions[(df_new_property_transactions["_merge"] == 'left_only')].drop('_merge', axis="columns")
-        df_new_property_transactions = df_new_property_transactions[df_new_columns_to_use]
+        df_new_property_transactions = df_source_property_transactions[~df_source_property_transactions["row_hash"].isin(existing_row_hashes)]
 
         records_to_append = len(df_new_property_transactions.index)
 
@@ -169,7 +174,7 @@ class TransactionsExtractor(AbstractExtractor):
             self._logger.info(f"TransactionsExtractor.extract There are {records_to_append} records to add to the transactions.")
 
             try:
-                df_new_property_transactions.to_sql('transactions', con=self._get_db_engine(), index=False, if_exists='append')
+                self._bulk_load(df=df_new_property_transactions, table_name='transactions')
             except:
                 self._notifier.notify()
                 return False
@@ -178,4 +183,26 @@ class TransactionsExtractor(AbstractExtractor):
         else:
             self._logger.info("TransactionsExtractor.extract There are no records to add to the property transactions.")
 
-        return True
\ No newline at end of file
+        return True
+
+
+    def __load_new_transactions_through_staging(self, df_property_transactions: pd.DataFrame) -> bool:
+        """
+            A private method that loads the property transactions batch through a staging table, letting the
+            row hash unique index of the target db skip the transactions that already exist
+
+            returns:
+                bool: A boolean flag indicating if the load was successfully executed
+        """
+
+        self._logger.info(f"TransactionsExtractor.extract Loading {len(df_property_transactions.index)} records through the transactions staging table.")
+
+        try:
+            records_appended = self._bulk_load_new_rows(df=df_property_transactions, table_name='transactions')
+        except:
+            self._notifier.notify()
+            return False
+
+        self._logger.info(f"TransactionsExtractor.extract {records_appended} records were added to the property transactions.")
+
+        return True
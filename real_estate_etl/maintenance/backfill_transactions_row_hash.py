@@ -0,0 +1,92 @@
+import argparse
+
+import pandas as pd
+
+from extractors.real_estate_transactions.transactions_extractor import TransactionsExtractor
+from models.config.db_connection_config import DBConnectionConfig
+from sinks.postgres_sink import PostgresSink
+from utils.db.db_engine_registry import DBEngineRegistry
+from utils.hashing.row_hasher import RowHasher
+from utils.log.custom_logger import CustomLogger
+
+STAGING_TABLE = "staging_transactions_row_hash"
+
+
+def get_transactions_row_hashes(sink: PostgresSink) -> pd.DataFrame:
+    """
+        A function that computes the row hash of the transactions loaded before the row hash column existed,
+        leaving out the hashes already taken, so the duplicated transactions keep a NULL row hash instead of
+        breaking the unique index
+
+        returns:
+            pd.DataFrame: A pandas DataFrame with the transaction ids and their row hashes
+    """
+
+    columns = ", ".join(TransactionsExtractor.ROW_HASH_COLUMNS)
+
+    df_transactions = sink.read_sql(
+        sql=f"SELECT transaction_id, {columns} FROM transactions WHERE row_hash IS NULL ORDER BY transaction_id",
+        parse_dates=["transaction_date"]
+    )
+
+    df_existing_row_hashes = sink.read_sql(sql="SELECT row_hash FROM transactions WHERE row_hash IS NOT NULL")
+
+    df_row_hashes = df_transactions[["transaction_id"]].assign(
+        row_hash=RowHasher().hash_rows(df=df_transactions, columns=TransactionsExtractor.ROW_HASH_COLUMNS)
+    )
+
+    df_row_hashes = df_row_hashes.drop_duplicates(subset=["row_hash"], keep="first")
+
+    return df_row_hashes[~df_row_hashes["row_hash"].isin(df_existing_row_hashes["row_hash"])]
+
+
+if __name__ == "__main__":
+
+    logger = CustomLogger()
+
+    argument_parser = argparse.ArgumentParser(
+        description="Fills the row hash of the transactions loaded before the row hash migration",
+        prefix_chars="-",
+        allow_abbrev=False,
+        add_help=True
+    )
+
+    argument_parser.add_argument("--target_db_host", type=str, help="The target database host")
+    argument_parser.add_argument("--target_db_port", type=str, help="The target database port")
+    argument_parser.add_argument("--target_db_name", type=str, help="The target database name")
+    argument_parser.add_argument("--target_db_username", type=str, help="The target database username")
+    argument_parser.add_argument("--target_db_password", type=str, help="The target database password")
+
+    args = argument_parser.parse_args()
+
+    db_config = DBConnectionConfig(
+        db_host=args.target_db_host,
+        db_port=args.target_db_port,
+        db_name=args.target_db_name,
+        db_username=args.target_db_username,
+        db_password=args.target_db_password
+    )
+
+    db_engine_registry = DBEngineRegistry()
+
+    sink = PostgresSink(target_db_config=db_config, db_engine_registry=db_engine_registry)
+
+    try:
+        with db_engine_registry.run_transaction(db_config=db_config) as connection:
+            df_row_hashes = get_transactions_row_hashes(sink=sink)
+
+            connection.exec_driver_sql(f"CREATE TEMP TABLE {STAGING_TABLE} (transaction_id INTEGER PRIMARY KEY, row_hash BIGINT) ON COMMIT DROP")
+
+            sink.bulk_load(df=df_row_hashes, table_name=STAGING_TABLE)
+
+            result = connection.exec_driver_sql(f"""
+                UPDATE transactions
+                   SET row_hash = staging.row_hash,
+                       utc_datetime_updated = CURRENT_TIMESTAMP(3)
+                  FROM {STAGING_TABLE} AS staging
+                 WHERE transactions.transaction_id = staging.transaction_id
+            """)
+
+            logger.info(f"backfill_transactions_row_hash {result.rowcount} transactions had their row hash filled.")
+    finally:
+        db_engine_registry.dispose()
@@ -8,3 +8,7 @@ class DBConnectionConfig:
     db_name: str
     db_username: str
     db_password: str
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30
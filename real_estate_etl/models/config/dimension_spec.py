@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+
+@dataclass
+class DimensionSpec:
+
+    table_name: str
+    id_column: str
+    source_columns: dict[str, str]
+    key_columns: dict[str, str] = field(default_factory=dict)
+    capitalized_columns: list[str] = field(default_factory=list)
+    sentinel_values: list[str] = field(default_factory=list)
+    # The pipeline step name, kept by the dimensions whose step was named otherwise than after its table
+    step_name: str = None
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+@dataclass
+class LoadConfig:
+
+    server_side_dedup: bool = False
+    fact_load_workers: int = 1
+    duplicate_keep: str = "first"
+    write_batch_size: int = None
+    write_retries: int = 3
+    write_retry_backoff: float = 1.0
+    reject_failed_batches: bool = False
@@ -0,0 +1,10 @@
+from dataclasses import dataclass, field
+
+@dataclass
+class SourceSchema:
+
+    usecols: list[str] = None
+    dtype: dict[str, str] = field(default_factory=dict)
+    parse_dates: list[str] = field(default_factory=list)
+    normalized_columns: list[str] = field(default_factory=list)
+    engine: str = "c"
@@ -0,0 +1,33 @@
+from models.config.dimension_spec import DimensionSpec
+
+housing_listing_dimensions = [
+    DimensionSpec(
+        table_name="laundry_options",
+        id_column="laundry_option_id",
+        source_columns={"laundry_options": "description"},
+        key_columns={"description": "VARCHAR"},
+        capitalized_columns=["description"]
+    ),
+    DimensionSpec(
+        table_name="parking_options",
+        id_column="parking_option_id",
+        source_columns={"parking_options": "description"},
+        key_columns={"description": "VARCHAR"},
+        capitalized_columns=["description"]
+    ),
+    DimensionSpec(
+        table_name="regions",
+        id_column="region_id",
+        source_columns={"region": "description", "region_url": "region_url"},
+        key_columns={"description": "VARCHAR", "region_url": "VARCHAR"},
+        capitalized_columns=["description"]
+    ),
+    DimensionSpec(
+        table_name="property_types",
+        id_column="property_type_id",
+        source_columns={"type": "description"},
+        key_columns={"description": "VARCHAR"},
+        capitalized_columns=["description"],
+        step_name="PropertyTypeExtractor"
+    )
+]
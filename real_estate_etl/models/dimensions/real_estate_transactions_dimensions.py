@@ -0,0 +1,39 @@
+from models.config.dimension_spec import DimensionSpec
+
+# The vendor file marks the unknown values with "?", they aren't dimension members
+UNKNOWN_VALUES = ["?"]
+
+real_estate_transactions_dimensions = [
+    DimensionSpec(
+        table_name="building_types",
+        id_column="building_type_id",
+        source_columns={"Property": "description"},
+        key_columns={"description": "VARCHAR"},
+        capitalized_columns=["description"],
+        sentinel_values=UNKNOWN_VALUES
+    ),
+    DimensionSpec(
+        table_name="property_types",
+        id_column="property_type_id",
+        source_columns={"Residential": "description"},
+        key_columns={"description": "VARCHAR"},
+        capitalized_columns=["description"],
+        sentinel_values=UNKNOWN_VALUES
+    ),
+    DimensionSpec(
+        table_name="directions",
+        id_column="direction_id",
+        source_columns={"Face": "description"},
+        key_columns={"description": "VARCHAR"},
+        capitalized_columns=["description"],
+        sentinel_values=UNKNOWN_VALUES
+    ),
+    DimensionSpec(
+        table_name="cities",
+        id_column="city_id",
+        source_columns={"Locality": "name"},
+        key_columns={"name": "VARCHAR"},
+        capitalized_columns=["name"],
+        sentinel_values=UNKNOWN_VALUES
+    )
+]
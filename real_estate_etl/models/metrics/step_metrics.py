@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+@dataclass
+class StepMetrics:
+
+    step: str
+    chunk: int = None
+
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+
+    source_rows: int = 0
+    db_rows_read: int = 0
+    rows_written: int = 0
+    rows_rejected: int = 0
+    write_retries: int = 0
+
+    db_round_trips: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+    tracemalloc_peak_bytes: int = None
+    success: bool = None
@@ -0,0 +1,33 @@
+from models.config.source_schema import SourceSchema
+
+housing_listing_schema = SourceSchema(
+    usecols=[
+        "id", "url", "region", "region_url", "price", "type", "sqfeet", "beds", "baths",
+        "cats_allowed", "dogs_allowed", "smoking_allowed", "wheelchair_access", "electric_vehicle_charge", "comes_furnished",
+        "laundry_options", "parking_options", "image_url", "description", "lat", "long", "state"
+    ],
+    dtype={
+        "id": "int64",
+        "url": "object",
+        "region": "category",
+        "region_url": "category",
+        "type": "category",
+        "beds": "Int16",
+        "baths": "float32",
+        "cats_allowed": "boolean",
+        "dogs_allowed": "boolean",
+        "smoking_allowed": "boolean",
+        "wheelchair_access": "boolean",
+        "electric_vehicle_charge": "boolean",
+        "comes_furnished": "boolean",
+        "laundry_options": "category",
+        "parking_options": "category",
+        "image_url": "object",
+        "description": "object",
+        "lat": "float64",
+        "long": "float64",
+        "state": "category"
+    },
+    normalized_columns=["region", "region_url", "state", "type", "laundry_options", "parking_options"],
+    engine="pyarrow"
+)
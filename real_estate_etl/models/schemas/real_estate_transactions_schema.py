@@ -0,0 +1,19 @@
+from models.config.source_schema import SourceSchema
+
+real_estate_transactions_schema = SourceSchema(
+    usecols=[
+        "Date", "Locality", "Estimated Value", "Sale Price", "Property", "Residential",
+        "num_rooms", "num_bathrooms", "carpet_area", "property_tax_rate", "Face"
+    ],
+    dtype={
+        "Locality": "category",
+        "Property": "category",
+        "Residential": "category",
+        "num_rooms": "Int8",
+        "num_bathrooms": "Int8",
+        "Face": "category"
+    },
+    parse_dates=["Date"],
+    normalized_columns=["Locality", "Property", "Residential", "Face"],
+    engine="pyarrow"
+)
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+@dataclass
+class SourceFileState:
+
+    pipeline_name: str
+    file_path: str
+    file_size: int
+    file_mtime_ns: int
+    prefix_size: int
+    prefix_hash: str
+
+    byte_offset: int = 0
+    row_offset: int = 0
@@ -0,0 +1,249 @@
+import argparse
+import contextlib
+
+import pandas as pd
+
+from extractors.dimensions.dimension_extractor import DimensionExtractor
+
+from models.config.db_connection_config import DBConnectionConfig
+from models.config.load_config import LoadConfig
+
+from readers.multi_file_reader import MultiFileReader
+from readers.source_file_cache import SourceFileCache
+from readers.source_file_reader import SourceFileReader
+
+from sinks.postgres_sink import PostgresSink
+from sinks.sqlite_sink import SQLiteSink
+
+from transformers.source_normalizer import SourceNormalizer
+
+from utils.cache.dimension_cache import DimensionCache
+from utils.db.db_engine_registry import DBEngineRegistry
+from utils.scheduling.dag_scheduler import DAGScheduler
+from utils.scheduling.stage_pipeline import StagePipeline
+from utils.state.run_log import RunLog
+from utils.state.source_file_tracker import SourceFileTracker
+
+from utils.log.custom_logger import CustomLogger
+from utils.metrics.run_metrics import RunMetrics
+
+
+def get_pipeline_steps(pipeline: dict, batched_dimensions: bool = False) -> list[type]:
+    """
+        A function that returns the steps of the pipeline, a dimension extractor for each declared dimension (or a
+        single one upserting every declared dimension in one batch) followed by the pipeline steps in their order
+
+        returns:
+            list[type]: The pipeline steps extractor classes
+    """
+
+    if batched_dimensions:
+        dimension_steps = [DimensionExtractor.for_dimensions(*pipeline["dimensions"])]
+    else:
+        dimension_steps = [DimensionExtractor.for_dimensions(dimension) for dimension in pipeline["dimensions"]]
+
+    return [*dimension_steps, *(pipeline["steps"][step] for step in sorted(pipeline["steps"]))]
+
+
+def run_pipeline(args: argparse.Namespace, pipeline: dict, db_config: DBConnectionConfig, load_config: LoadConfig, logger: CustomLogger) -> None:
+    """
+        A function that runs the loaded pipeline over its input files with the validated command line arguments,
+        step by step and chunk by chunk, being imported by the app only once the command line is validated so
+        the readers, sinks and extractors aren't imported by the help or an invalid command line
+    """
+
+    input_files = MultiFileReader.resolve(patterns=args.input or [pipeline["input_file"]])
+
+    if not input_files:
+        raise Exception("The specified input file doesn't exists.")
+
+    if len(input_files) > 1 and (args.incremental or args.source_cache):
+        raise ValueError("The incremental runs and the source cache are only supported for a single input file.")
+
+    if args.incremental and SourceFileReader.get_compression(input_files[0]) is not None:
+        raise ValueError("The incremental runs resume from a byte offset of the input file, which must not be compressed.")
+
+    max_workers = args.max_workers
+
+    if args.single_transaction and max_workers > 1:
+        logger.warning("The single transaction run shares one connection between the steps, running them sequentially.")
+        max_workers = 1
+
+    pipeline_steps = get_pipeline_steps(pipeline=pipeline, batched_dimensions=args.batched_dimensions)
+
+    scheduler = DAGScheduler(
+        steps=pipeline_steps,
+        logger=logger,
+        max_workers=max_workers
+    )
+
+    run_metrics = RunMetrics(trace_memory=args.trace_memory)
+
+    db_engine_registry = DBEngineRegistry(run_metrics=run_metrics)
+    dimension_cache = DimensionCache()
+
+    if args.sink == "sqlite":
+        sink = SQLiteSink(
+            file_path=args.sqlite_file,
+            initialization_scripts=["../infrastructure/sqlite/scripts/initialize_db_ddl.sql", "../infrastructure/postgresql/scripts/initialize_db_dml.sql"],
+            run_metrics=run_metrics
+        )
+    else:
+        sink = PostgresSink(target_db_config=db_config, db_engine_registry=db_engine_registry, run_metrics=run_metrics)
+
+    source_file_tracker = SourceFileTracker(
+        pipeline_name=args.pipeline,
+        file_path=input_files[0],
+        target_db_config=db_config,
+        db_engine_registry=db_engine_registry
+    )
+
+    source_file_state = source_file_tracker.get_fingerprint() if args.incremental or args.source_cache else None
+    byte_offset = 0
+    row_offset = 0
+
+    if args.incremental:
+        saved_source_file_state = source_file_tracker.get_saved_state()
+
+        if saved_source_file_state is None:
+            logger.info("The input file was never processed by this pipeline, reading it entirely.")
+        elif source_file_tracker.is_unchanged(saved_state=saved_source_file_state, fingerprint=source_file_state):
+            logger.info("The input file is unchanged since the last run, there is nothing to process.")
+            db_engine_registry.dispose()
+            return
+        elif source_file_tracker.is_appended(saved_state=saved_source_file_state, fingerprint=source_file_state):
+            byte_offset = saved_source_file_state.byte_offset
+            row_offset = saved_source_file_state.row_offset
+            logger.info(f"The input file was appended to since the last run, resuming from byte {byte_offset} after {row_offset} rows.")
+        else:
+            logger.info("The input file was rewritten since the last run, reading it entirely.")
+
+    run_log = None
+
+    if args.checkpoint or args.resume:
+        run_log = RunLog(pipeline_name=args.pipeline, target_db_config=db_config, db_engine_registry=db_engine_registry)
+
+        if run_log.start(input_fingerprint=RunLog.get_input_fingerprint(file_paths=input_files, chunk_size=args.chunk_size), resume=args.resume):
+            logger.info(f"Resuming the run {run_log.run_id}, skipping the steps and chunks it already committed.")
+        elif args.resume:
+            logger.info("There is no failed run of the pipeline over the same input to resume, running it entirely.")
+
+    source_file_cache = None
+
+    if args.source_cache and not SourceFileCache.is_available():
+        logger.warning("The pyarrow package is not installed, the input file will be parsed without the columnar cache.")
+    elif args.source_cache:
+        source_file_cache = SourceFileCache(file_path=input_files[0], fingerprint=source_file_state, schema=pipeline["schema"])
+
+    if len(input_files) == 1:
+        source_reader = SourceFileReader(
+            file_path=input_files[0],
+            sep=",",
+            chunk_size=args.chunk_size,
+            schema=pipeline["schema"],
+            engine=args.parser_engine,
+            byte_offset=byte_offset,
+            cache=source_file_cache,
+            logger=logger
+        )
+    else:
+        source_reader = MultiFileReader(
+            file_paths=input_files,
+            sep=",",
+            chunk_size=args.chunk_size,
+            schema=pipeline["schema"],
+            engine=args.parser_engine,
+            workers=args.read_workers,
+            logger=logger
+        )
+
+    source_normalizer = SourceNormalizer(schema=pipeline["schema"])
+
+    step_names = [step.__name__ for step in pipeline_steps]
+
+    def is_chunk_completed(chunk_number: int) -> bool:
+        return run_log is not None and run_log.is_chunk_completed(steps=step_names, chunk=chunk_number)
+
+    run_succeeded = False
+
+    try:
+        with db_engine_registry.run_transaction(db_config=db_config) if args.single_transaction else contextlib.nullcontext():
+
+            def normalize_chunk(chunk: tuple[int, pd.DataFrame]) -> tuple[int, pd.DataFrame]:
+                chunk_number, df_source_data = chunk
+
+                if df_source_data.empty or is_chunk_completed(chunk_number=chunk_number):
+                    return chunk
+
+                with run_metrics.measure_step(step="normalize", chunk=chunk_number, source_rows=len(df_source_data.index)):
+                    return chunk_number, source_normalizer.normalize(df=df_source_data)
+
+            source_chunks = enumerate(run_metrics.measure_iterator(step="read", iterable=source_reader.read()), start=1)
+
+            if args.overlapped:
+                source_chunks = StagePipeline(stages=[normalize_chunk], queue_size=args.stage_queue_size).run(source=source_chunks)
+            else:
+                source_chunks = map(normalize_chunk, source_chunks)
+
+            with contextlib.closing(source_chunks) if args.overlapped else contextlib.nullcontext():
+                for chunk_number, df_source_data in source_chunks:
+
+                    if df_source_data.empty:
+                        continue
+
+                    if is_chunk_completed(chunk_number=chunk_number):
+                        logger.info(f"Skipping the chunk {chunk_number}, it was committed by the resumed run")
+                        row_offset += len(df_source_data.index)
+                        continue
+
+                    if args.chunk_size:
+                        logger.info(f"Processing chunk {chunk_number} with {len(df_source_data.index)} rows")
+
+                    def run_step(extractor_class: type) -> bool:
+                        if run_log is not None and run_log.is_completed(step=extractor_class.__name__, chunk=chunk_number):
+                            # The skipped dimensions aren't cached, the fact steps look their keys up in the target db
+                            logger.info(f"Skipping the {extractor_class.__name__} step of the chunk {chunk_number}, it was committed by the resumed run")
+                            return True
+
+                        with run_metrics.measure_step(step=extractor_class.__name__, chunk=chunk_number, source_rows=len(df_source_data.index)) as step_metrics:
+                            with run_log.checkpoint(step_metrics=step_metrics) if run_log is not None else contextlib.nullcontext():
+                                step_metrics.success = extractor_class(
+                                    source_df=df_source_data,
+                                    target_db_config=db_config,
+                                    logger=logger,
+                                    load_config=load_config,
+                                    db_engine_registry=db_engine_registry,
+                                    dimension_cache=dimension_cache,
+                                    run_metrics=run_metrics,
+                                    sink=sink
+                                ).extract()
+
+                        return step_metrics.success
+
+                    if not scheduler.run(run_step=run_step):
+                        raise Exception("There is a processing step failed.")
+
+                    row_offset += len(df_source_data.index)
+
+            if args.incremental:
+                source_file_state.byte_offset = source_file_state.file_size
+                source_file_state.row_offset = row_offset
+                source_file_tracker.save_state(state=source_file_state)
+
+        run_succeeded = True
+    finally:
+        if run_log is not None:
+            run_log.finish(success=run_succeeded)
+
+        sink.dispose()
+        db_engine_registry.dispose()
+
+        if args.metrics_report:
+            run_metrics.write_report(
+                file_path=args.metrics_report,
+                pipeline=args.pipeline,
+                success=run_succeeded,
+                arguments={argument: value for argument, value in vars(args).items() if argument != "target_db_password"}
+            )
+
+            logger.info(f"The run metrics were written to {args.metrics_report}")
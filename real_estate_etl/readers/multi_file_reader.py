@@ -0,0 +1,167 @@
+import glob
+import multiprocessing
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterator
+
+import pandas as pd
+
+from models.config.source_schema import SourceSchema
+from readers.source_file_reader import SourceFileReader
+from utils.log.custom_logger import CustomLogger
+
+
+class MultiFileReader():
+
+    def __init__(
+        self,
+        file_paths: list[str],
+        sep: str = ",",
+        chunk_size: int = None,
+        schema: SourceSchema = None,
+        engine: str = None,
+        workers: int = 1,
+        logger: CustomLogger = None
+    ) -> None:
+
+        if workers <= 0:
+            raise ValueError("The number of read workers must be a positive number.")
+
+        self._file_paths = file_paths
+        self._sep = sep
+        self._chunk_size = chunk_size
+        self._schema = schema or SourceSchema()
+        self._engine = engine
+        self._workers = workers
+        self._logger = logger
+
+    @staticmethod
+    def resolve(patterns: list[str]) -> list[str]:
+        """
+            A method that expands the given file paths and glob patterns into the existing files they match,
+            each pattern matches being sorted by name so the daily or regional parts are read in order
+
+            returns:
+                list[str]: The distinct matched file paths
+        """
+
+        file_paths = []
+
+        for pattern in patterns:
+            for file_path in sorted(glob.glob(pattern)):
+                if file_path not in file_paths:
+                    file_paths.append(file_path)
+
+        return file_paths
+
+    def __read_in_process(self) -> Iterator[pd.DataFrame]:
+        """
+            A private method that reads the files one after another in the current process, streaming the chunks
+            of each one
+
+            returns:
+                Iterator[pd.DataFrame]: An iterator over the pandas DataFrames read from every file
+        """
+
+        for file_path in self._file_paths:
+            yield from SourceFileReader(file_path=file_path, sep=self._sep, chunk_size=self._chunk_size, schema=self._schema, engine=self._engine, logger=self._logger).read()
+
+    def __read_in_workers(self) -> Iterator[pd.DataFrame]:
+        """
+            A private method that parses the whole files on a pool of worker processes, keeping at most one file
+            per worker in flight ahead of the caller, yielding the data frame of each file in the files order
+
+            returns:
+                Iterator[pd.DataFrame]: An iterator over the pandas DataFrames read from every file
+        """
+
+        # The spawned workers don't inherit the locks held by the threads running the pipeline steps
+        executor = ProcessPoolExecutor(max_workers=min(self._workers, len(self._file_paths)), mp_context=multiprocessing.get_context("spawn"))
+
+        pending_file_paths = iter(self._file_paths)
+        futures: list[Future] = []
+
+        def submit_next_file() -> None:
+            file_path = next(pending_file_paths, None)
+
+            if file_path is not None:
+                futures.append(executor.submit(read_source_file, file_path=file_path, sep=self._sep, schema=self._schema, engine=self._engine))
+
+        try:
+            for _ in range(self._workers):
+                submit_next_file()
+
+            while futures:
+                df = futures.pop(0).result()
+
+                submit_next_file()
+
+                yield df
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def read(self) -> Iterator[pd.DataFrame]:
+        """
+            A method that reads every file typed and pruned by the schema as a single stream, yielding the chunks
+            of each file when a chunk size is set or a single data frame concatenating every file otherwise, the
+            files being parsed in parallel by worker processes when more than one read worker is configured and
+            the files aren't read in chunks (a worker returns a whole file, the chunks are streamed in process so
+            the memory usage stays bounded)
+
+            returns:
+                Iterator[pd.DataFrame]: An iterator over the pandas DataFrames read from every file
+        """
+
+        workers = 1 if self._chunk_size else self._workers
+
+        if workers < self._workers:
+            self.__log_warning("MultiFileReader.read The files are read in chunks, streaming them in process instead of parsing whole files by read workers.")
+
+        self.__log(f"MultiFileReader.read Reading {len(self._file_paths)} files with {workers} read workers.")
+
+        dfs = self.__read_in_process() if workers == 1 or len(self._file_paths) == 1 else self.__read_in_workers()
+
+        if self._chunk_size:
+            yield from dfs
+            return
+
+        yield self.__concat(dfs=list(dfs))
+
+    def __concat(self, dfs: list[pd.DataFrame]) -> pd.DataFrame:
+        """
+            A private method that concatenates the data frames of every file, turning back into categoricals the
+            schema categorical columns whose categories differed between the files
+
+            returns:
+                pd.DataFrame: The concatenated pandas DataFrame
+        """
+
+        if len(dfs) == 1:
+            return dfs[0]
+
+        df = pd.concat(dfs, ignore_index=True)
+
+        return df.astype({
+            column: "category"
+            for column, dtype in self._schema.dtype.items()
+            if dtype == "category" and column in df.columns
+        })
+
+    def __log(self, message: str):
+        if self._logger:
+            self._logger.info(message)
+
+    def __log_warning(self, message: str):
+        if self._logger:
+            self._logger.warning(message)
+
+
+def read_source_file(file_path: str, sep: str, schema: SourceSchema, engine: str) -> pd.DataFrame:
+    """
+        A function that parses a whole source file within a worker process, returning it to the parent process
+
+        returns:
+            pd.DataFrame: The pandas DataFrame read from the file
+    """
+
+    return next(SourceFileReader(file_path=file_path, sep=sep, schema=schema, engine=engine).read())
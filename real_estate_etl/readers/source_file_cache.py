@@ -0,0 +1,113 @@
+import hashlib
+import importlib.util
+import os
+
+from typing import Iterator
+
+import pandas as pd
+
+from models.config.source_schema import SourceSchema
+from models.state.source_file_state import SourceFileState
+
+class SourceFileCache():
+
+    CACHE_FOLDER = ".cache"
+    CACHE_EXTENSION = "arrow"
+
+    def __init__(self, file_path: str, fingerprint: SourceFileState, schema: SourceSchema = None) -> None:
+
+        self._file_path = file_path
+        self._fingerprint = fingerprint
+        self._schema = schema or SourceSchema()
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+            A method that returns if the optional pyarrow package, needed to write and read the cache, is installed
+
+            returns:
+                bool: A boolean flag indicating if the cache can be used
+        """
+
+        return importlib.util.find_spec("pyarrow") is not None
+
+    def __get_cache_key(self) -> str:
+        """
+            A private method that derives the cache key from the source file fingerprint and the schema it is
+            parsed with, so a changed file or schema never reads a stale cache
+
+            returns:
+                str: The cache key
+        """
+
+        key = f"{self._fingerprint.file_size}:{self._fingerprint.file_mtime_ns}:{self._fingerprint.prefix_hash}:{self._schema!r}"
+
+        return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    def __get_cache_path(self, cache_key: str) -> str:
+        """
+            A private method that returns the path of the cache file kept in a folder next to the source file
+
+            returns:
+                str: The cache file path
+        """
+
+        folder, file_name = os.path.split(self._file_path)
+
+        return os.path.join(folder, self.CACHE_FOLDER, f"{file_name}.{cache_key}.{self.CACHE_EXTENSION}")
+
+    def exists(self) -> bool:
+        """
+            A method that returns if there is a cache for the current source file fingerprint
+
+            returns:
+                bool: A boolean flag indicating if the cache can be read
+        """
+
+        return os.path.exists(self.__get_cache_path(cache_key=self.__get_cache_key()))
+
+    def read(self, columns: list[str] = None, chunk_size: int = None) -> Iterator[pd.DataFrame]:
+        """
+            A method that memory maps the cache and reads only the given columns, yielding them in slices of
+            chunk_size rows when it is set, so only the sliced pages are brought into memory
+
+            returns:
+                Iterator[pd.DataFrame]: An iterator over the typed pandas DataFrames read from the cache
+        """
+
+        from pyarrow import feather
+
+        table = feather.read_table(self.__get_cache_path(cache_key=self.__get_cache_key()), columns=columns, memory_map=True)
+
+        if not chunk_size:
+            yield table.to_pandas()
+            return
+
+        for offset in range(0, table.num_rows, chunk_size):
+            yield table.slice(offset, chunk_size).to_pandas()
+
+    def write(self, df: pd.DataFrame) -> None:
+        """
+            A method that writes the parsed and typed source data frame as an uncompressed Arrow IPC file, which
+            can be memory mapped, replacing the caches of previous fingerprints of the same source file
+        """
+
+        import pyarrow as pa
+        from pyarrow import feather
+
+        cache_path = self.__get_cache_path(cache_key=self.__get_cache_key())
+
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+        cache_folder, cache_file_name = os.path.split(cache_path)
+        source_file_name = os.path.basename(self._file_path)
+
+        for file_name in os.listdir(cache_folder):
+            if file_name != cache_file_name and file_name.startswith(f"{source_file_name}.") and file_name.endswith(f".{self.CACHE_EXTENSION}"):
+                os.remove(os.path.join(cache_folder, file_name))
+
+        temporary_cache_path = f"{cache_path}.tmp"
+
+        feather.write_feather(pa.Table.from_pandas(df, preserve_index=False), temporary_cache_path, compression="uncompressed")
+
+        os.replace(temporary_cache_path, cache_path)
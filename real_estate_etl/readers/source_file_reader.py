@@ -0,0 +1,227 @@
+import bz2
+import csv
+import gzip
+import importlib.util
+import io
+import os
+
+from typing import BinaryIO, Iterator
+
+import pandas as pd
+
+from models.config.source_schema import SourceSchema
+from readers.source_file_cache import SourceFileCache
+from utils.log.custom_logger import CustomLogger
+
+
+class SourceFileReader():
+
+    COMPRESSIONS = {".gz": "gzip", ".bz2": "bz2", ".zst": "zstd", ".zstd": "zstd"}
+    ZSTD_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        file_path: str,
+        sep: str = ",",
+        chunk_size: int = None,
+        schema: SourceSchema = None,
+        engine: str = None,
+        byte_offset: int = 0,
+        cache: SourceFileCache = None,
+        logger: CustomLogger = None
+    ) -> None:
+
+        self._file_path = file_path
+        self._sep = sep
+        self._chunk_size = chunk_size
+        self._schema = schema or SourceSchema()
+        self._engine = engine or self._schema.engine
+        self._byte_offset = byte_offset
+        self._cache = cache
+        self._logger = logger
+
+    @staticmethod
+    def get_compression(file_path: str) -> str | None:
+        """
+            A method that returns the compression of the given file by its extension
+
+            returns:
+                str | None: The compression name (gzip, bz2 or zstd), None for an uncompressed file
+        """
+
+        return SourceFileReader.COMPRESSIONS.get(os.path.splitext(file_path)[1].lower())
+
+    def __open(self) -> BinaryIO:
+        """
+            A private method that opens the source file as a binary stream, decompressing it on the fly while
+            it is read when it is compressed, so a compressed file is never decompressed to disk (the zstd
+            streams are read through the optional pyarrow package)
+
+            returns:
+                BinaryIO: The source file binary stream
+        """
+
+        compression = self.get_compression(self._file_path)
+
+        if compression == "gzip":
+            return gzip.open(self._file_path, "rb")
+
+        if compression == "bz2":
+            return bz2.open(self._file_path, "rb")
+
+        if compression == "zstd":
+            if importlib.util.find_spec("pyarrow") is None:
+                raise ValueError("Reading zstd compressed files requires the optional pyarrow package.")
+
+            import pyarrow
+
+            return pyarrow.input_stream(self._file_path, compression="zstd", buffer_size=self.ZSTD_BUFFER_SIZE)
+
+        return open(self._file_path, "rb")
+
+    def __get_engine(self) -> str:
+        """
+            A private method that returns the parser engine to use, falling back to the C parser when pyarrow
+            isn't installed or when reading in chunks, which the pyarrow parser doesn't support
+
+            returns:
+                str: The pandas read_csv parser engine
+        """
+
+        if self._engine != "pyarrow":
+            return self._engine
+
+        if importlib.util.find_spec("pyarrow") is None:
+            self.__log("SourceFileReader.read The pyarrow package is not installed, falling back to the C parser.", warning=True)
+            return "c"
+
+        if self._chunk_size:
+            self.__log("SourceFileReader.read The pyarrow parser doesn't support chunked reads, using the C parser.")
+            return "c"
+
+        return "pyarrow"
+
+    def __log(self, message: str, warning: bool = False):
+        if not self._logger:
+            return
+
+        if warning:
+            self._logger.warning(message)
+        else:
+            self._logger.info(message)
+
+    def __get_header(self) -> list[str]:
+        """
+            A private method that reads the column names from the source file header, needed when resuming
+            from a byte offset past it
+
+            returns:
+                list[str]: The source file column names
+        """
+
+        with io.TextIOWrapper(self.__open(), newline="") as source_file:
+            return next(csv.reader(source_file, delimiter=self._sep))
+
+    def read(self) -> Iterator[pd.DataFrame]:
+        """
+            A method that reads the source file typed and pruned by its schema, yielding it in bounded chunks
+            when a chunk size is set or as a single data frame otherwise, when a byte offset is set only the
+            rows after it are read
+
+            When there is a cache for the whole file it is read instead of parsing the file, otherwise a whole
+            file parsed in a single data frame is written to the cache for the next runs
+
+            returns:
+                Iterator[pd.DataFrame]: An iterator over the pandas DataFrames read from the source file
+        """
+
+        use_cache = self._cache is not None and not self._byte_offset
+
+        if use_cache and self._cache.exists():
+            self.__log("SourceFileReader.read Reading the source file from its columnar cache.")
+            yield from self._cache.read(columns=self._schema.usecols, chunk_size=self._chunk_size)
+            return
+
+        if use_cache and not self._chunk_size:
+            df = next(self.__read_from_file())
+            self._cache.write(df=df)
+            yield df
+            return
+
+        yield from self.__read_from_file()
+
+    def __read_from_file(self) -> Iterator[pd.DataFrame]:
+        """
+            A private method that parses the source file from the byte offset, skipping the header when the
+            offset is past it, streaming the decompression of a compressed file along with the parsing
+
+            returns:
+                Iterator[pd.DataFrame]: An iterator over the pandas DataFrames parsed from the source file
+        """
+
+        column_names = self.__get_header() if self._byte_offset else None
+
+        with self.__open() as source_file:
+            if self._byte_offset:
+                source_file.seek(self._byte_offset)
+
+            yield from self.__read(source_file=source_file, column_names=column_names)
+
+    def __read(self, source_file: BinaryIO, column_names: list[str] = None) -> Iterator[pd.DataFrame]:
+        """
+            A private method that parses the source file from its current position, using the given column
+            names instead of a header line when they are set
+
+            returns:
+                Iterator[pd.DataFrame]: An iterator over the pandas DataFrames parsed from the source file
+        """
+
+        engine = self.__get_engine()
+
+        if engine == "pyarrow":
+            yield self.__read_with_pyarrow(source_file=source_file, column_names=column_names)
+            return
+
+        read_csv_options = {
+            "filepath_or_buffer": source_file,
+            "header": None if column_names else "infer",
+            "names": column_names,
+            "sep": self._sep,
+            "usecols": self._schema.usecols,
+            "dtype": self._schema.dtype or None,
+            "parse_dates": self._schema.parse_dates or None,
+            "engine": engine
+        }
+
+        if not self._chunk_size:
+            yield pd.read_csv(**read_csv_options)
+            return
+
+        with pd.read_csv(**read_csv_options, chunksize=self._chunk_size) as chunks:
+            for df_chunk in chunks:
+                yield df_chunk
+
+    def __read_with_pyarrow(self, source_file: BinaryIO, column_names: list[str] = None) -> pd.DataFrame:
+        """
+            A private method that reads the whole source file with the multithreaded pyarrow CSV parser, which
+            unlike the pandas pyarrow engine accepts the line breaks present in quoted values like descriptions
+
+            returns:
+                pd.DataFrame: A pandas DataFrame typed by the source schema
+        """
+
+        from pyarrow import csv as pyarrow_csv
+
+        table = pyarrow_csv.read_csv(
+            source_file,
+            read_options=pyarrow_csv.ReadOptions(column_names=column_names),
+            parse_options=pyarrow_csv.ParseOptions(delimiter=self._sep, newlines_in_values=True),
+            convert_options=pyarrow_csv.ConvertOptions(include_columns=self._schema.usecols or [], strings_can_be_null=True)
+        )
+
+        df = table.to_pandas().astype(self._schema.dtype)
+
+        for column in self._schema.parse_dates:
+            df[column] = pd.to_datetime(df[column])
+
+        return df
@@ -0,0 +1,191 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+import sqlalchemy as sa
+
+from models.config.dimension_spec import DimensionSpec
+from utils.metrics.run_metrics import RunMetrics
+
+class AbstractSink():
+
+    def __init__(self, run_metrics: RunMetrics = None) -> None:
+
+        self._run_metrics = run_metrics or RunMetrics()
+
+    @contextmanager
+    def begin(self) -> Iterator[sa.Connection]:
+        """
+            A method that yields a connection to the target within a transaction committed on exit
+
+            returns:
+                Iterator[sa.Connection]: A sqlalchemy connection within a transaction
+        """
+
+        raise NotImplementedError("The method begin was not implemented")
+
+    def supports_worker_processes(self) -> bool:
+        """
+            A method that returns if worker processes can load into the target through their own connections
+
+            returns:
+                bool: A boolean flag indicating if the target can be loaded by worker processes
+        """
+
+        return False
+
+    def read_sql(self, sql: str | sa.TextClause, parse_dates: list[str] = None, params: dict = None) -> pd.DataFrame:
+        """
+            A method that returns the result of the given query, binding the given parameters
+
+            returns:
+                pd.DataFrame: A pandas DataFrame containing the query result
+        """
+
+        with self.begin() as connection:
+            df = pd.read_sql(sql=sql, con=connection, parse_dates=parse_dates, params=params)
+
+        self._run_metrics.add(db_rows_read=len(df.index), bytes_received=int(df.memory_usage(index=False, deep=True).sum()))
+
+        return df
+
+    def get_existing_keys(self, table_name: str, column: str, keys: pd.Series) -> pd.Series:
+        """
+            A method that returns which of the given keys already exist in the given column of the table
+
+            returns:
+                pd.Series: The existing keys
+        """
+
+        raise NotImplementedError("The method get_existing_keys was not implemented")
+
+    def bulk_load(self, df: pd.DataFrame, table_name: str, batch: bool = False) -> None:
+        """
+            A method that appends the data frame rows to the given table within a single transaction, rolled back
+            alone when the rows are a write batch
+        """
+
+        raise NotImplementedError("The method bulk_load was not implemented")
+
+    def bulk_load_new_rows(self, df: pd.DataFrame, table_name: str, key_columns: list[str] = None, batch: bool = False) -> int:
+        """
+            A method that appends only the data frame rows whose key columns don't exist yet in the given table,
+            leaving the unique indexes of the table alone to decide when no key columns are given, rolled back
+            alone when the rows are a write batch
+
+            returns:
+                int: The number of inserted rows
+        """
+
+        raise NotImplementedError("The method bulk_load_new_rows was not implemented")
+
+    def upsert_returning(self, df: pd.DataFrame, table_name: str, id_column: str, key_columns: dict[str, str]) -> pd.DataFrame:
+        """
+            A method that inserts the data frame natural keys missing in the given dimension table and returns the
+            ids of every one of them
+
+            params:
+                df (pd.DataFrame): The data frame containing the natural key columns
+                table_name (str): The target dimension table name
+                id_column (str): The dimension surrogate id column
+                key_columns (dict[str, str]): The natural key columns and their SQL types
+
+            returns:
+                pd.DataFrame: A pandas DataFrame with the id, the natural key columns and an inserted flag for
+                    each source key
+        """
+
+        raise NotImplementedError("The method upsert_returning was not implemented")
+
+    def upsert_dimensions_returning(self, dimensions: list[tuple[DimensionSpec, pd.DataFrame]]) -> list[pd.DataFrame]:
+        """
+            A method that upserts the natural keys of every given dimension, one dimension after another unless
+            the sink batches them
+
+            params:
+                dimensions (list[tuple[DimensionSpec, pd.DataFrame]]): The dimension specs along with the data
+                    frames containing their natural key columns
+
+            returns:
+                list[pd.DataFrame]: The id, natural key columns and inserted flag data frame of each dimension,
+                    in the given order
+        """
+
+        return [
+            self.upsert_returning(df=df, table_name=dimension.table_name, id_column=dimension.id_column, key_columns=dimension.key_columns)
+            for dimension, df in dimensions
+        ]
+
+    def is_transient_error(self, error: Exception) -> bool:
+        """
+            A method that returns if the given write error is transient, like a dropped connection, so writing the
+            same rows again can succeed
+
+            returns:
+                bool: A boolean flag indicating if the write can be retried
+        """
+
+        return isinstance(error, sa.exc.DBAPIError) and error.connection_invalidated
+
+    def is_bound_connection_lost(self, error: Exception) -> bool:
+        """
+            A method that returns if the given write error lost the connection the run or step transaction is
+            bound to, so neither the write can be retried nor its rows rejected on it, the step has to fail and
+            be resumed instead
+
+            returns:
+                bool: A boolean flag indicating if the write failed by losing its bound connection
+        """
+
+        return False
+
+    def reject_rows(self, df: pd.DataFrame, table_name: str, error: str) -> None:
+        """
+            A method that records the data frame rows that couldn't be written to the given table in the load
+            rejects table, as JSON along with the error
+        """
+
+        raise NotImplementedError("The method reject_rows was not implemented")
+
+    def dispose(self) -> None:
+        """
+            A method that releases the connections held by the sink
+        """
+
+    def _get_key_expression(self, column: str, sql_type: str) -> str:
+        """
+            A protected method that returns the case and null normalized expression of a natural key column, being
+            the same expression indexed by the dimension natural key unique indexes
+
+            returns:
+                str: The SQL expression of the natural key column
+        """
+
+        if sql_type.upper() in ("SMALLINT", "INTEGER", "BIGINT"):
+            return f"COALESCE({column}, 0)"
+
+        return f"COALESCE(LOWER({column}), '')"
+
+    def _round_integer_columns(self, df: pd.DataFrame, integer_columns: set[str]) -> pd.DataFrame:
+        """
+            A protected method that rounds half away from zero the float columns targeting integer columns into
+            nullable integers, the way PostgreSQL assigns a numeric to an integer column (ids brought by left
+            merges become floats, and half bathrooms target a SMALLINT column)
+
+            returns:
+                pd.DataFrame: A pandas DataFrame whose integer targeted columns hold integers
+        """
+
+        float_integer_columns = [
+            column for column in df.select_dtypes(include="float").columns
+            if column in integer_columns
+        ]
+
+        if not float_integer_columns:
+            return df
+
+        return df.assign(**{
+            column: (np.sign(df[column]) * np.floor(df[column].abs() + 0.5)).astype("Int64")
+            for column in float_integer_columns
+        })
@@ -0,0 +1,430 @@
+import io
+
+from contextlib import contextmanager
+from typing import Iterator
+
+import pandas as pd
+import psycopg2
+import sqlalchemy as sa
+
+from models.config.db_connection_config import DBConnectionConfig
+from models.config.dimension_spec import DimensionSpec
+from sinks.abstractions.abstract_sink import AbstractSink
+from utils.db.db_engine_registry import DBEngineRegistry
+from utils.metrics.run_metrics import RunMetrics
+
+class PostgresSink(AbstractSink):
+
+    COPY_BATCH_SIZE = 50000
+    COPY_NULL = "\\N"
+
+    # The SQLSTATE classes and codes of the errors a write can succeed after, the connection exceptions, the
+    # transaction rollbacks (serialization failures and deadlocks), the insufficient resources, the operator
+    # interventions (like a statement timeout or a server restart) and the lock timeouts
+    TRANSIENT_SQLSTATE_CLASSES = ("08", "40", "53", "57")
+    TRANSIENT_SQLSTATES = ("55P03",)
+
+    # The SQLSTATE class and codes of the errors losing the connection, the connection exceptions and the server
+    # shutdowns terminating the session
+    CONNECTION_SQLSTATE_CLASSES = ("08",)
+    CONNECTION_SQLSTATES = ("57P01", "57P02", "57P03")
+
+    def __init__(self, target_db_config: DBConnectionConfig, db_engine_registry: DBEngineRegistry = None, run_metrics: RunMetrics = None) -> None:
+
+        super().__init__(run_metrics=run_metrics)
+
+        self._target_db_config = target_db_config
+        self._db_engine_registry = db_engine_registry or DBEngineRegistry()
+
+    @contextmanager
+    def begin(self) -> Iterator[sa.Connection]:
+        """
+            A method that yields a connection within a transaction, being the run connection when the pipeline
+            runs as a single transaction
+
+            returns:
+                Iterator[sa.Connection]: A sqlalchemy connection within a transaction
+        """
+
+        with self._db_engine_registry.begin(db_config=self._target_db_config) as connection:
+            yield connection
+
+    @contextmanager
+    def __begin_write(self, batch: bool) -> Iterator[sa.Connection]:
+        """
+            A private method that yields the connection a write runs on, a savepoint of the run or step transaction
+            (or a transaction of its own when there is none) for a write batch so it is rolled back alone, the sink
+            transaction otherwise
+
+            returns:
+                Iterator[sa.Connection]: A sqlalchemy connection within a transaction
+        """
+
+        with self._db_engine_registry.begin_batch(db_config=self._target_db_config) if batch else self.begin() as connection:
+            yield connection
+
+    def supports_worker_processes(self) -> bool:
+        """
+            A method that returns if worker processes can load into the target db, which they can't while the run
+            is bound to a single transaction
+
+            returns:
+                bool: A boolean flag indicating if the target db can be loaded by worker processes
+        """
+
+        return not self._db_engine_registry.in_run_transaction()
+
+    def get_existing_keys(self, table_name: str, column: str, keys: pd.Series) -> pd.Series:
+        """
+            A method that returns which of the given keys already exist in the given column of the table, looking
+            them up as a single array parameter through the column index
+
+            returns:
+                pd.Series: The existing keys
+        """
+
+        df_existing_keys = self.read_sql(
+            sql=sa.text(f"SELECT {column} FROM {table_name} WHERE {column} = ANY(:keys)"),
+            params={"keys": keys.drop_duplicates().tolist()}
+        )
+
+        return df_existing_keys[column]
+
+    def bulk_load(self, df: pd.DataFrame, table_name: str, batch: bool = False) -> None:
+        """
+            A method that bulk loads a data frame into the given table, streaming its rows
+            through PostgreSQL COPY FROM STDIN in batches of COPY_BATCH_SIZE rows within a single transaction
+
+            params:
+                df (pd.DataFrame): The data frame whose columns match the target table columns
+                table_name (str): The target table name
+                batch (bool): If the rows are a write batch rolled back alone when it fails
+        """
+
+        with self.__begin_write(batch=batch) as connection:
+            self.__copy(connection=connection, df=df, table_name=table_name)
+
+        self._run_metrics.add(rows_written=len(df.index))
+
+    def upsert_returning(self, df: pd.DataFrame, table_name: str, id_column: str, key_columns: dict[str, str]) -> pd.DataFrame:
+        """
+            A method that inserts the data frame natural keys missing in the given dimension table and
+            returns the ids of every one of them in a single round trip, through an INSERT ... ON CONFLICT DO
+            NOTHING RETURNING over the natural key unique index joined to the already existing keys
+
+            params:
+                df (pd.DataFrame): The data frame containing the natural key columns
+                table_name (str): The target dimension table name
+                id_column (str): The dimension surrogate id column
+                key_columns (dict[str, str]): The natural key columns and their SQL types
+
+            returns:
+                pd.DataFrame: A pandas DataFrame with the id, the natural key columns and an inserted flag for
+                    each source key
+        """
+
+        return self.__upsert_many_returning(upserts=[(df, table_name, id_column, key_columns)])[0]
+
+    def upsert_dimensions_returning(self, dimensions: list[tuple[DimensionSpec, pd.DataFrame]]) -> list[pd.DataFrame]:
+        """
+            A method that upserts the natural keys of every given dimension through a single statement chaining
+            one INSERT ... ON CONFLICT DO NOTHING RETURNING per dimension, so the whole batch takes one round
+            trip and one transaction
+
+            params:
+                dimensions (list[tuple[DimensionSpec, pd.DataFrame]]): The dimension specs along with the data
+                    frames containing their natural key columns
+
+            returns:
+                list[pd.DataFrame]: The id, natural key columns and inserted flag data frame of each dimension,
+                    in the given order
+        """
+
+        return self.__upsert_many_returning(upserts=[
+            (df, dimension.table_name, dimension.id_column, dimension.key_columns)
+            for dimension, df in dimensions
+        ])
+
+    def __upsert_many_returning(self, upserts: list[tuple[pd.DataFrame, str, str, dict[str, str]]]) -> list[pd.DataFrame]:
+        """
+            A private method that builds and runs the statement upserting the natural keys of the given dimension
+            tables, each one through its own source and inserted CTEs, their returned and existing keys being
+            brought back as a JSON array along with the dimension number
+
+            returns:
+                list[pd.DataFrame]: The id, natural key columns and inserted flag data frame of each upsert
+        """
+
+        ctes = []
+        selects = []
+        params = {}
+        sorted_dfs = []
+
+        for number, (df, table_name, id_column, key_columns) in enumerate(upserts):
+            # The keys are inserted sorted so the generated ids don't depend on the source rows order
+            df = df[list(key_columns)].sort_values(by=list(key_columns), ignore_index=True)
+            sorted_dfs.append(df)
+
+            if df.empty:
+                continue
+
+            columns = ", ".join(key_columns)
+            arrays = ", ".join(f"CAST(:dimension_{number}_{column} AS {sql_type}[])" for column, sql_type in key_columns.items())
+            key_conditions = " AND ".join(
+                f"{self._get_key_expression(f'target.{column}', sql_type)} = {self._get_key_expression(f'source_{number}.{column}', sql_type)}"
+                for column, sql_type in key_columns.items()
+            )
+
+            ctes.append(f"""
+                source_{number} ({columns}) AS (
+                    SELECT * FROM UNNEST({arrays})
+                ),
+                inserted_{number} AS (
+                    INSERT INTO {table_name} ({columns})
+                         SELECT {columns} FROM source_{number}
+                    ON CONFLICT DO NOTHING
+                      RETURNING {id_column}, {columns}
+                )
+            """)
+
+            selects.append(f"""
+                SELECT {number} AS dimension, {id_column} AS id, JSON_BUILD_ARRAY({columns}) AS natural_keys, TRUE AS inserted FROM inserted_{number}
+                 UNION ALL
+                SELECT {number}, target.{id_column}, JSON_BUILD_ARRAY({", ".join(f"target.{column}" for column in key_columns)}), FALSE
+                  FROM {table_name} AS target
+                  JOIN source_{number} ON {key_conditions}
+            """)
+
+            params.update({
+                f"dimension_{number}_{column}": df[column].astype(object).where(df[column].notna(), None).tolist()
+                for column in key_columns
+            })
+
+        rows = []
+
+        if selects:
+            sql = sa.text(f"WITH {', '.join(ctes)} {' UNION ALL '.join(selects)}")
+
+            with self.begin() as connection:
+                rows = connection.execute(sql, params).all()
+
+                if self.__has_missing_keys(rows=rows, upserts=upserts, sorted_dfs=sorted_dfs):
+                    # The keys inserted by a concurrent load after this statement snapshot conflict without being
+                    # visible to it, running the statement again returns them as existing keys
+                    rows = connection.execute(sql, params).all()
+
+        dfs_keys = []
+
+        for number, (_, _, id_column, key_columns) in enumerate(upserts):
+            dimension_rows = [row for row in rows if row.dimension == number]
+
+            df_keys = pd.DataFrame([[row.id, *row.natural_keys, row.inserted] for row in dimension_rows], columns=[id_column, *key_columns, "inserted"])
+
+            self._run_metrics.add(
+                rows_written=int(df_keys["inserted"].sum()),
+                db_rows_read=int((~df_keys["inserted"].astype(bool)).sum()),
+                bytes_received=int(df_keys.memory_usage(index=False, deep=True).sum())
+            )
+
+            dfs_keys.append(df_keys)
+
+        return dfs_keys
+
+    def __has_missing_keys(self, rows: list, upserts: list[tuple[pd.DataFrame, str, str, dict[str, str]]], sorted_dfs: list[pd.DataFrame]) -> bool:
+        """
+            A private method that returns if the upsert statement rows miss the id of any distinct natural key of
+            the upserted data frames
+
+            returns:
+                bool: A boolean flag indicating if any dimension returned fewer ids than distinct natural keys
+        """
+
+        for number, ((_, _, _, key_columns), df) in enumerate(zip(upserts, sorted_dfs)):
+            returned_ids = {row.id for row in rows if row.dimension == number}
+
+            if len(returned_ids) < self.__count_distinct_keys(df=df, key_columns=key_columns):
+                return True
+
+        return False
+
+    def __count_distinct_keys(self, df: pd.DataFrame, key_columns: dict[str, str]) -> int:
+        """
+            A private method that counts the distinct natural keys of the data frame the way the natural key unique
+            indexes compare them
+
+            returns:
+                int: The number of distinct natural keys
+        """
+
+        df_keys = pd.DataFrame({
+            column: df[column].astype(object).where(df[column].notna(), None).map(lambda value: str(value).lower() if isinstance(value, str) else value)
+            for column in key_columns
+        })
+
+        return len(df_keys.drop_duplicates().index)
+
+    def bulk_load_new_rows(self, df: pd.DataFrame, table_name: str, key_columns: list[str] = None, batch: bool = False) -> int:
+        """
+            A method that bulk loads a data frame into a temporary staging table and inserts only
+            the rows whose key columns don't exist yet in the given table, so the cost follows the batch size
+            instead of the target table size
+
+            params:
+                df (pd.DataFrame): The data frame whose columns match the target table columns
+                table_name (str): The target table name
+                key_columns (list[str]): The columns identifying an existing row in the target table, when not
+                    given the unique indexes of the target table alone decide through ON CONFLICT DO NOTHING
+                batch (bool): If the rows are a write batch rolled back alone when it fails
+
+            returns:
+                int: The number of inserted rows
+        """
+
+        staging_table = f"staging_{table_name}"
+        columns = ", ".join(f'"{column}"' for column in df.columns)
+        key_conditions = " AND ".join(
+            f'(target."{column}" = staging."{column}" OR (target."{column}" IS NULL AND staging."{column}" IS NULL))'
+            for column in key_columns or []
+        )
+        new_rows_condition = f"WHERE NOT EXISTS (SELECT 1 FROM {table_name} AS target WHERE {key_conditions})" if key_conditions else ""
+
+        with self.__begin_write(batch=batch) as connection:
+            connection.exec_driver_sql(f"CREATE TEMP TABLE {staging_table} ON COMMIT DROP AS SELECT {columns} FROM {table_name} WITH NO DATA")
+
+            self.__copy(connection=connection, df=df, table_name=staging_table)
+
+            connection.exec_driver_sql(f"ANALYZE {staging_table}")
+
+            result = connection.exec_driver_sql(f"""
+                INSERT INTO {table_name} ({columns})
+                     SELECT {columns}
+                       FROM {staging_table} AS staging
+                      {new_rows_condition}
+                ON CONFLICT DO NOTHING
+            """)
+
+            connection.exec_driver_sql(f"DROP TABLE {staging_table}")
+
+        self._run_metrics.add(rows_written=result.rowcount)
+
+        return result.rowcount
+
+    def is_transient_error(self, error: Exception) -> bool:
+        """
+            A method that returns if the given write error is transient, by the SQLSTATE PostgreSQL raised it with,
+            a lost connection being transient only when the write doesn't run on a connection bound to the run or
+            step transaction, which is lost along with it, the COPY errors being raised by the psycopg2 cursor
+            without the sqlalchemy wrapping
+
+            returns:
+                bool: A boolean flag indicating if the write can be retried
+        """
+
+        if self.__is_connection_error(error=error):
+            return not self._db_engine_registry.in_bound_transaction()
+
+        if isinstance(error, sa.exc.DBAPIError):
+            error = error.orig
+
+        if not isinstance(error, psycopg2.Error) or error.pgcode is None:
+            return False
+
+        return error.pgcode[:2] in self.TRANSIENT_SQLSTATE_CLASSES or error.pgcode in self.TRANSIENT_SQLSTATES
+
+    def is_bound_connection_lost(self, error: Exception) -> bool:
+        """
+            A method that returns if the given write error lost the connection the run or step transaction is
+            bound to, rolling the whole transaction back, so the step has to fail and be resumed instead
+
+            returns:
+                bool: A boolean flag indicating if the write failed by losing its bound connection
+        """
+
+        return self._db_engine_registry.in_bound_transaction() and self.__is_connection_error(error=error)
+
+    def __is_connection_error(self, error: Exception) -> bool:
+        """
+            A private method that returns if the given error lost the connection, being invalidated by sqlalchemy,
+            raised with a connection SQLSTATE or raised without reaching the server
+
+            returns:
+                bool: A boolean flag indicating if the connection was lost
+        """
+
+        if isinstance(error, sa.exc.DBAPIError):
+            if error.connection_invalidated:
+                return True
+
+            error = error.orig
+
+        if not isinstance(error, psycopg2.Error):
+            return False
+
+        sqlstate = error.pgcode
+
+        if sqlstate is None:
+            return isinstance(error, (psycopg2.OperationalError, psycopg2.InterfaceError))
+
+        return sqlstate[:2] in self.CONNECTION_SQLSTATE_CLASSES or sqlstate in self.CONNECTION_SQLSTATES
+
+    def reject_rows(self, df: pd.DataFrame, table_name: str, error: str) -> None:
+        """
+            A method that records the data frame rows that couldn't be written to the given table in the
+            load_rejects table, sent as a single JSON array and committed along with the write batches
+        """
+
+        with self.__begin_write(batch=True) as connection:
+            connection.execute(
+                sa.text("""
+                    INSERT INTO load_rejects (table_name, error, row_data)
+                         SELECT :table_name, :error, value
+                           FROM JSONB_ARRAY_ELEMENTS(CAST(:rows AS JSONB))
+                """),
+                {"table_name": table_name, "error": error, "rows": df.to_json(orient="records", date_format="iso")}
+            )
+
+    def __copy(self, connection: sa.Connection, df: pd.DataFrame, table_name: str) -> None:
+        """
+            A private method that streams the data frame rows into the given table through COPY FROM STDIN,
+            serializing them in batches of COPY_BATCH_SIZE rows into an in-memory csv buffer
+        """
+
+        columns = ", ".join(f'"{column}"' for column in df.columns)
+        copy_statement = f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{self.COPY_NULL}')"
+
+        integer_columns = self.__get_integer_columns(connection=connection, table_name=table_name)
+
+        cursor = connection.connection.cursor()
+
+        try:
+            for start in range(0, len(df.index), self.COPY_BATCH_SIZE):
+                buffer = io.StringIO()
+                self._round_integer_columns(df.iloc[start:start + self.COPY_BATCH_SIZE], integer_columns=integer_columns).to_csv(buffer, index=False, header=False, na_rep=self.COPY_NULL)
+                self._run_metrics.add(db_round_trips=1, bytes_sent=buffer.tell())
+                buffer.seek(0)
+
+                cursor.copy_expert(sql=copy_statement, file=buffer)
+        finally:
+            cursor.close()
+
+    def __get_integer_columns(self, connection: sa.Connection, table_name: str) -> set[str]:
+        """
+            A private method that returns the integer typed columns of the given table
+
+            returns:
+                set[str]: The names of the SMALLINT, INTEGER and BIGINT columns of the table
+        """
+
+        result = connection.execute(
+            sa.text("""
+                SELECT attname
+                  FROM pg_attribute
+                 WHERE attrelid = CAST(:table_name AS regclass)
+                   AND atttypid IN (CAST('int2' AS regtype), CAST('int4' AS regtype), CAST('int8' AS regtype))
+                   AND attnum > 0
+                   AND NOT attisdropped
+            """),
+            {"table_name": table_name}
+        )
+
+        return {row.attname for row in result}
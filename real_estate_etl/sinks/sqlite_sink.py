@@ -0,0 +1,315 @@
+import json
+import os
+import threading
+
+from contextlib import contextmanager
+from typing import Iterator
+
+import pandas as pd
+import sqlalchemy as sa
+
+from models.config.dimension_spec import DimensionSpec
+from sinks.abstractions.abstract_sink import AbstractSink
+from utils.metrics.run_metrics import RunMetrics
+
+class SQLiteSink(AbstractSink):
+
+    INSERT_BATCH_SIZE = 50000
+
+    # The SQLite errors a write can succeed after, raised when another connection holds the file lock
+    TRANSIENT_ERROR_NAMES = ("SQLITE_BUSY", "SQLITE_LOCKED")
+
+    def __init__(self, file_path: str, initialization_scripts: list[str] = None, run_metrics: RunMetrics = None) -> None:
+
+        super().__init__(run_metrics=run_metrics)
+
+        self._file_path = file_path
+        self._initialization_scripts = initialization_scripts or []
+
+        self.__engine = None
+        self.__lock = threading.RLock()
+
+    def __get_engine(self) -> sa.Engine:
+        """
+            A private method that returns the engine of the SQLite file, creating the file and running the
+            initialization scripts over it when it doesn't exist yet
+
+            returns:
+                sa.Engine: A sqlalchemy db engine object
+        """
+
+        if self.__engine is not None:
+            return self.__engine
+
+        is_new_file = not os.path.exists(self._file_path)
+
+        os.makedirs(os.path.dirname(self._file_path) or ".", exist_ok=True)
+
+        # A single connection shared by the pipeline steps threads, SQLite serializes the writers anyway
+        self.__engine = sa.create_engine(
+            url=f"sqlite:///{self._file_path}",
+            connect_args={"check_same_thread": False},
+            poolclass=sa.pool.StaticPool
+        )
+
+        self._run_metrics.instrument_engine(engine=self.__engine)
+
+        if is_new_file:
+            with self.__engine.begin() as connection:
+                for script_path in self._initialization_scripts:
+                    with open(script_path) as script:
+                        connection.connection.executescript(script.read())
+
+        return self.__engine
+
+    @contextmanager
+    def begin(self) -> Iterator[sa.Connection]:
+        """
+            A method that yields the SQLite file connection within a transaction committed on exit, one step at
+            a time
+
+            returns:
+                Iterator[sa.Connection]: A sqlalchemy connection within a transaction
+        """
+
+        with self.__lock:
+            with self.__get_engine().begin() as connection:
+                yield connection
+
+    def get_existing_keys(self, table_name: str, column: str, keys: pd.Series) -> pd.Series:
+        """
+            A method that returns which of the given keys already exist in the given column of the table, looking
+            them up as a single JSON array parameter
+
+            returns:
+                pd.Series: The existing keys
+        """
+
+        df_existing_keys = self.read_sql(
+            sql=sa.text(f"SELECT {column} FROM {table_name} WHERE {column} IN (SELECT value FROM json_each(:keys))"),
+            params={"keys": json.dumps(keys.drop_duplicates().tolist())}
+        )
+
+        return df_existing_keys[column]
+
+    def __get_integer_columns(self, connection: sa.Connection, table_name: str) -> set[str]:
+        """
+            A private method that returns the integer typed columns of the given table
+
+            returns:
+                set[str]: The names of the SMALLINT, INTEGER and BIGINT columns of the table
+        """
+
+        result = connection.exec_driver_sql(f"PRAGMA table_info({table_name})")
+
+        return {row.name for row in result if row.type.upper() in ("SMALLINT", "INTEGER", "BIGINT")}
+
+    def __insert(self, connection: sa.Connection, df: pd.DataFrame, table_name: str, integer_columns: set[str]) -> None:
+        """
+            A private method that inserts the data frame rows into the given table in batches of INSERT_BATCH_SIZE
+            rows through executemany
+        """
+
+        columns = ", ".join(f'"{column}"' for column in df.columns)
+        parameters = ", ".join("?" for _ in df.columns)
+        insert_statement = f"INSERT INTO {table_name} ({columns}) VALUES ({parameters})"
+
+        for start in range(0, len(df.index), self.INSERT_BATCH_SIZE):
+            df_batch = self._round_integer_columns(df.iloc[start:start + self.INSERT_BATCH_SIZE], integer_columns=integer_columns)
+            df_batch = df_batch.assign(**{
+                column: df_batch[column].dt.strftime("%Y-%m-%d %H:%M:%S")
+                for column in df_batch.select_dtypes(include="datetime").columns
+            })
+            df_batch = df_batch.astype(object).where(df_batch.notna(), None)
+
+            connection.exec_driver_sql(insert_statement, list(df_batch.itertuples(index=False, name=None)))
+
+    def bulk_load(self, df: pd.DataFrame, table_name: str, batch: bool = False) -> None:
+        """
+            A method that appends the data frame rows to the given table of the SQLite file within a single
+            transaction, every write of the SQLite file being committed on its own transaction
+
+            params:
+                df (pd.DataFrame): The data frame whose columns match the target table columns
+                table_name (str): The target table name
+                batch (bool): If the rows are a write batch rolled back alone when it fails
+        """
+
+        with self.begin() as connection:
+            self.__insert(connection=connection, df=df, table_name=table_name, integer_columns=self.__get_integer_columns(connection=connection, table_name=table_name))
+
+        self._run_metrics.add(rows_written=len(df.index))
+
+    def bulk_load_new_rows(self, df: pd.DataFrame, table_name: str, key_columns: list[str] = None, batch: bool = False) -> int:
+        """
+            A method that loads the data frame into a temporary staging table and inserts only the rows whose key
+            columns don't exist yet in the given table, the ones conflicting with its unique indexes being ignored
+
+            params:
+                df (pd.DataFrame): The data frame whose columns match the target table columns
+                table_name (str): The target table name
+                key_columns (list[str]): The columns identifying an existing row in the target table, when not
+                    given the unique indexes of the target table alone decide
+                batch (bool): If the rows are a write batch rolled back alone when it fails
+
+            returns:
+                int: The number of inserted rows
+        """
+
+        staging_table = f"staging_{table_name}"
+        columns = ", ".join(f'"{column}"' for column in df.columns)
+        key_conditions = " AND ".join(f'target."{column}" IS staging."{column}"' for column in key_columns or [])
+        new_rows_condition = f"WHERE NOT EXISTS (SELECT 1 FROM {table_name} AS target WHERE {key_conditions})" if key_conditions else ""
+
+        with self.begin() as connection:
+            integer_columns = self.__get_integer_columns(connection=connection, table_name=table_name)
+
+            connection.exec_driver_sql(f"CREATE TEMP TABLE {staging_table} AS SELECT {columns} FROM {table_name} WHERE 0")
+
+            self.__insert(connection=connection, df=df, table_name=staging_table, integer_columns=integer_columns)
+
+            result = connection.exec_driver_sql(f"""
+                INSERT OR IGNORE INTO {table_name} ({columns})
+                     SELECT {columns}
+                       FROM {staging_table} AS staging
+                      {new_rows_condition}
+            """)
+
+            connection.exec_driver_sql(f"DROP TABLE {staging_table}")
+
+        self._run_metrics.add(rows_written=result.rowcount)
+
+        return result.rowcount
+
+    def upsert_returning(self, df: pd.DataFrame, table_name: str, id_column: str, key_columns: dict[str, str]) -> pd.DataFrame:
+        """
+            A method that inserts the data frame natural keys missing in the given dimension table and returns the
+            ids of every one of them, through a staging table of the keys joined to the dimension before and after
+            an INSERT OR IGNORE over the natural key unique index, within one transaction holding the SQLite file
+            write lock
+
+            params:
+                df (pd.DataFrame): The data frame containing the natural key columns
+                table_name (str): The target dimension table name
+                id_column (str): The dimension surrogate id column
+                key_columns (dict[str, str]): The natural key columns and their SQL types
+
+            returns:
+                pd.DataFrame: A pandas DataFrame with the id, the natural key columns and an inserted flag for
+                    each source key
+        """
+
+        with self.begin() as connection:
+            return self.__upsert_returning(connection=connection, df=df, table_name=table_name, id_column=id_column, key_columns=key_columns)
+
+    def upsert_dimensions_returning(self, dimensions: list[tuple[DimensionSpec, pd.DataFrame]]) -> list[pd.DataFrame]:
+        """
+            A method that upserts the natural keys of every given dimension one after another within a single
+            transaction holding the SQLite file write lock
+
+            params:
+                dimensions (list[tuple[DimensionSpec, pd.DataFrame]]): The dimension specs along with the data
+                    frames containing their natural key columns
+
+            returns:
+                list[pd.DataFrame]: The id, natural key columns and inserted flag data frame of each dimension,
+                    in the given order
+        """
+
+        with self.begin() as connection:
+            return [
+                self.__upsert_returning(connection=connection, df=df, table_name=dimension.table_name, id_column=dimension.id_column, key_columns=dimension.key_columns)
+                for dimension, df in dimensions
+            ]
+
+    def __upsert_returning(self, connection: sa.Connection, df: pd.DataFrame, table_name: str, id_column: str, key_columns: dict[str, str]) -> pd.DataFrame:
+        """
+            A private method that upserts the natural keys of a dimension on the given connection, through a
+            staging table of the keys joined to the dimension before and after an INSERT OR IGNORE
+
+            returns:
+                pd.DataFrame: A pandas DataFrame with the id, the natural key columns and an inserted flag for
+                    each source key
+        """
+
+        if df.empty:
+            return pd.DataFrame(columns=[id_column, *key_columns, "inserted"])
+
+        staging_table = f"staging_{table_name}_keys"
+        columns = ", ".join(key_columns)
+        key_conditions = " AND ".join(
+            f"{self._get_key_expression(f'target.{column}', sql_type)} = {self._get_key_expression(f'source.{column}', sql_type)}"
+            for column, sql_type in key_columns.items()
+        )
+        keys_query = f"""
+            SELECT target.{id_column}, {", ".join(f"target.{column}" for column in key_columns)}
+              FROM {table_name} AS target
+              JOIN {staging_table} AS source ON {key_conditions}
+        """
+
+        # The keys are inserted sorted so the generated ids don't depend on the source rows order
+        df = df[list(key_columns)].sort_values(by=list(key_columns), ignore_index=True)
+
+        connection.exec_driver_sql(f"CREATE TEMP TABLE {staging_table} AS SELECT {columns} FROM {table_name} WHERE 0")
+
+        self.__insert(connection=connection, df=df, table_name=staging_table, integer_columns={column for column, sql_type in key_columns.items() if sql_type.upper() in ("SMALLINT", "INTEGER", "BIGINT")})
+
+        existing_ids = {row[0] for row in connection.exec_driver_sql(keys_query)}
+
+        connection.exec_driver_sql(f"INSERT OR IGNORE INTO {table_name} ({columns}) SELECT {columns} FROM {staging_table} ORDER BY rowid")
+
+        df_keys = pd.DataFrame(connection.exec_driver_sql(keys_query).all(), columns=[id_column, *key_columns])
+
+        connection.exec_driver_sql(f"DROP TABLE {staging_table}")
+
+        df_keys["inserted"] = ~df_keys[id_column].isin(existing_ids)
+
+        self._run_metrics.add(
+            rows_written=int(df_keys["inserted"].sum()),
+            db_rows_read=int((~df_keys["inserted"]).sum()),
+            bytes_received=int(df_keys.memory_usage(index=False, deep=True).sum())
+        )
+
+        return df_keys
+
+    def is_transient_error(self, error: Exception) -> bool:
+        """
+            A method that returns if the given write error is transient, being the file lock errors raised while
+            another process writes the SQLite file
+
+            returns:
+                bool: A boolean flag indicating if the write can be retried
+        """
+
+        if not isinstance(error, sa.exc.DBAPIError):
+            return False
+
+        error_name = getattr(error.orig, "sqlite_errorname", "")
+
+        return error.connection_invalidated or error_name.startswith(self.TRANSIENT_ERROR_NAMES)
+
+    def reject_rows(self, df: pd.DataFrame, table_name: str, error: str) -> None:
+        """
+            A method that records the data frame rows that couldn't be written to the given table in the
+            load_rejects table, sent as a single JSON array
+        """
+
+        with self.begin() as connection:
+            connection.execute(
+                sa.text("""
+                    INSERT INTO load_rejects (table_name, error, row_data)
+                         SELECT :table_name, :error, value
+                           FROM json_each(:rows)
+                """),
+                {"table_name": table_name, "error": error, "rows": df.to_json(orient="records", date_format="iso")}
+            )
+
+    def dispose(self) -> None:
+        """
+            A method that closes the SQLite file connection
+        """
+
+        with self.__lock:
+            if self.__engine is not None:
+                self.__engine.dispose()
+                self.__engine = None
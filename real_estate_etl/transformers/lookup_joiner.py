@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+
+
+class LookupJoiner():
+
+    def __get_key_codes(self, left: pd.Series, right: pd.Series) -> tuple[np.ndarray, np.ndarray, int]:
+        """
+            A private method that dictionary encodes a key column of both sides against the distinct values of the
+            dimension side, looking up only the categories of a categorical column and remapping its row codes, a
+            missing value matching a missing dimension value the way a merge does
+
+            returns:
+                tuple[np.ndarray, np.ndarray, int]: The left codes (-1 when the value isn't a dimension key), the
+                    right codes and the number of distinct dimension values
+        """
+
+        right_codes, right_uniques = pd.factorize(right, use_na_sentinel=False)
+        right_index = pd.Index(right_uniques)
+
+        if isinstance(left.dtype, pd.CategoricalDtype):
+            category_codes = np.append(right_index.get_indexer(left.cat.categories), -1)
+            left_codes = category_codes[left.cat.codes.to_numpy()]
+        else:
+            left_codes = right_index.get_indexer(left)
+
+        missing_code = int(np.flatnonzero(right_index.isna())[0]) if right_index.hasnans else -1
+        left_codes = np.where(left.isna().to_numpy(), missing_code, left_codes)
+
+        return left_codes, right_codes, len(right_index)
+
+    def lookup(self, df: pd.DataFrame, df_keys: pd.DataFrame, id_column: str, left_on: list[str], right_on: list[str] = None) -> np.ndarray:
+        """
+            A method that looks up the dimension id of each data frame row through a hash index of the dimension
+            keys combined into a single integer code, without copying the data frame, the ids being floats holding
+            NaN for the rows without a dimension key like the ones brought by a left merge
+
+            params:
+                df (pd.DataFrame): The data frame containing the key columns
+                df_keys (pd.DataFrame): The dimension keys data frame containing the id and the key columns
+                id_column (str): The dimension id column name
+                left_on (list[str]): The key columns of the data frame
+                right_on (list[str]): The key columns of the dimension keys, the left ones when not given
+
+            returns:
+                np.ndarray: The dimension id of each data frame row
+        """
+
+        right_on = right_on or left_on
+
+        # The dimension keys are unique, keeping the first one like the dimension cache does otherwise
+        df_keys = df_keys.drop_duplicates(subset=right_on, keep="first")
+
+        left_combined_codes = np.zeros(len(df.index), dtype="int64")
+        right_combined_codes = np.zeros(len(df_keys.index), dtype="int64")
+        left_missing = np.zeros(len(df.index), dtype=bool)
+
+        for left_column, right_column in zip(left_on, right_on):
+            left_codes, right_codes, cardinality = self.__get_key_codes(left=df[left_column], right=df_keys[right_column])
+
+            left_missing |= left_codes == -1
+            left_combined_codes = left_combined_codes * cardinality + left_codes
+            right_combined_codes = right_combined_codes * cardinality + right_codes
+
+        positions = pd.Index(right_combined_codes).get_indexer(left_combined_codes)
+        positions[left_missing] = -1
+
+        ids = df_keys[id_column].to_numpy()
+
+        if (positions == -1).any():
+            return np.append(ids.astype("float64"), np.nan)[positions]
+
+        return ids[positions]
+
+    def join(self, df: pd.DataFrame, df_keys: pd.DataFrame, id_column: str, left_on: list[str], right_on: list[str] = None) -> pd.DataFrame:
+        """
+            A method that adds the dimension id column to a shallow copy of the data frame, replacing a left merge
+            that would copy every column of the data frame to attach a single one
+
+            returns:
+                pd.DataFrame: The data frame with the dimension id column
+        """
+
+        df = df.copy(deep=False)
+        df[id_column] = self.lookup(df=df, df_keys=df_keys, id_column=id_column, left_on=left_on, right_on=right_on)
+
+        return df
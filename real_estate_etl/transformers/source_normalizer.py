@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from models.config.source_schema import SourceSchema
+
+
+class SourceNormalizer():
+
+    def __init__(self, schema: SourceSchema) -> None:
+
+        self._schema = schema
+
+    def __to_lowered_categorical(self, series: pd.Series) -> pd.Series:
+        """
+            A private method that turns a column into a categorical of lowered values, lowering only its distinct
+            values and remapping the row codes, so categories differing only by case share the same code
+
+            returns:
+                pd.Series: A categorical pandas Series with the lowered values
+        """
+
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype("category")
+
+        if series.cat.categories.empty:
+            return series
+
+        lowered_categories = pd.Index(series.cat.categories.astype(str).str.lower())
+        canonical_categories = lowered_categories.unique()
+
+        category_codes = canonical_categories.get_indexer(lowered_categories)
+        row_codes = series.cat.codes.to_numpy()
+
+        return pd.Series(
+            pd.Categorical.from_codes(np.where(row_codes == -1, -1, category_codes[row_codes]), categories=canonical_categories),
+            index=series.index,
+            name=series.name
+        )
+
+    def normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+            A method that runs the single normalization pass shared by every extractor, turning the schema
+            key columns into lowered categorical codes
+
+            returns:
+                pd.DataFrame: The normalized pandas DataFrame
+        """
+
+        return df.assign(**{
+            column: self.__to_lowered_categorical(df[column])
+            for column in self._schema.normalized_columns
+            if column in df.columns
+        })
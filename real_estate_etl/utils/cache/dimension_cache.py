@@ -0,0 +1,48 @@
+import threading
+
+import pandas as pd
+
+class DimensionCache():
+
+    def __init__(self) -> None:
+
+        self.__dimensions = {}
+        self.__lock = threading.Lock()
+
+    def update(self, table_name: str, df_keys: pd.DataFrame, id_column: str, key_columns: list[str]) -> None:
+        """
+            A method that adds the natural key to surrogate id pairs of a dimension to the cache, the natural key
+            columns are lowered so the fact extractors can look them up regardless of the stored case
+
+            params:
+                table_name (str): The dimension table name
+                df_keys (pd.DataFrame): The data frame containing the surrogate id and the natural key columns
+                id_column (str): The surrogate id column name
+                key_columns (list[str]): The natural key column names
+        """
+
+        df_keys = df_keys[[id_column, *key_columns]].copy()
+
+        for column in key_columns:
+            if not pd.api.types.is_numeric_dtype(df_keys[column]):
+                df_keys[column] = df_keys[column].str.lower()
+
+        with self.__lock:
+            if table_name in self.__dimensions:
+                df_keys = pd.concat([self.__dimensions[table_name], df_keys], ignore_index=True)
+
+            self.__dimensions[table_name] = df_keys.drop_duplicates(subset=key_columns, keep="first").reset_index(drop=True)
+
+    def get(self, table_name: str) -> pd.DataFrame | None:
+        """
+            A method that returns the cached natural key to surrogate id pairs of a dimension
+
+            returns:
+                pd.DataFrame | None: A pandas DataFrame with the surrogate id and the lowered natural key columns,
+                    or None when the dimension wasn't loaded in this run
+        """
+
+        with self.__lock:
+            df_keys = self.__dimensions.get(table_name)
+
+        return None if df_keys is None else df_keys.copy()
@@ -0,0 +1,85 @@
+import time
+
+from typing import Callable
+
+import pandas as pd
+
+from models.config.load_config import LoadConfig
+from sinks.abstractions.abstract_sink import AbstractSink
+from utils.log.custom_logger import CustomLogger
+from utils.metrics.run_metrics import RunMetrics
+
+class BatchWriter():
+
+    def __init__(self, sink: AbstractSink, load_config: LoadConfig, logger: CustomLogger = None, run_metrics: RunMetrics = None) -> None:
+
+        self._sink = sink
+        self._load_config = load_config
+        self._logger = logger
+        self._run_metrics = run_metrics or RunMetrics()
+
+    def write(self, df: pd.DataFrame, table_name: str, load: Callable[[pd.DataFrame], int]) -> int:
+        """
+            A method that writes the data frame in batches of the load config write batch size, each one rolled
+            back alone when it fails, retrying a batch failing with a transient error with an exponential backoff
+            and, when the failed batches are rejected, recording the rows of a batch that can't be written in the
+            load rejects table instead of failing the whole write, unless the batch lost the connection the run or
+            step transaction is bound to, failing the step so it can be resumed
+
+            params:
+                df (pd.DataFrame): The data frame whose columns match the target table columns
+                table_name (str): The target table name
+                load (Callable[[pd.DataFrame], int]): The function writing a batch, returning its written rows
+
+            returns:
+                int: The number of written rows
+        """
+
+        batch_size = self._load_config.write_batch_size or max(len(df.index), 1)
+
+        rows_written = 0
+
+        for batch_number, start in enumerate(range(0, len(df.index), batch_size), start=1):
+            rows_written += self.__write_batch(df_batch=df.iloc[start:start + batch_size], table_name=table_name, batch_number=batch_number, load=load)
+
+        return rows_written
+
+    def __write_batch(self, df_batch: pd.DataFrame, table_name: str, batch_number: int, load: Callable[[pd.DataFrame], int]) -> int:
+        """
+            A private method that writes a batch, waiting the retry backoff doubled on every attempt before writing
+            it again after a transient error, the batch being rejected (or the error raised) once it fails with a
+            permanent error or runs out of retries, the error being always raised when the bound connection is lost
+
+            returns:
+                int: The number of written rows, none when the batch was rejected
+        """
+
+        retries = 0
+
+        while True:
+            try:
+                return load(df_batch)
+            except Exception as error:
+                if retries < self._load_config.write_retries and self._sink.is_transient_error(error=error):
+                    backoff_seconds = self._load_config.write_retry_backoff * 2 ** retries
+                    retries += 1
+
+                    self.__log_warning(f"BatchWriter.write The batch {batch_number} of {table_name} failed with a transient error, retrying it in {backoff_seconds:.1f}s ({retries}/{self._load_config.write_retries}): {error}")
+                    self._run_metrics.add(write_retries=1)
+
+                    time.sleep(backoff_seconds)
+                    continue
+
+                if not self._load_config.reject_failed_batches or self._sink.is_bound_connection_lost(error=error):
+                    raise
+
+                self.__log_warning(f"BatchWriter.write Rejecting the {len(df_batch.index)} rows of the batch {batch_number} of {table_name}: {error}")
+
+                self._sink.reject_rows(df=df_batch, table_name=table_name, error=str(error))
+                self._run_metrics.add(rows_rejected=len(df_batch.index))
+
+                return 0
+
+    def __log_warning(self, message: str):
+        if self._logger:
+            self._logger.warning(message)
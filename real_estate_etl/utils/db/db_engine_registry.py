@@ -0,0 +1,182 @@
+import threading
+
+from contextlib import contextmanager
+from typing import Iterator
+
+import sqlalchemy as sa
+
+from models.config.db_connection_config import DBConnectionConfig
+from utils.metrics.run_metrics import RunMetrics
+
+class DBEngineRegistry():
+
+    def __init__(self, run_metrics: RunMetrics = None) -> None:
+
+        self._run_metrics = run_metrics
+
+        self.__engines = {}
+        self.__engines_lock = threading.Lock()
+
+        self.__run_connection = None
+        self.__step_connections = threading.local()
+
+    def __get_db_url(self, db_config: DBConnectionConfig) -> str:
+        return f"postgresql://{db_config.db_username}:{db_config.db_password}@{db_config.db_host}:{db_config.db_port}/{db_config.db_name}"
+
+    def get_engine(self, db_config: DBConnectionConfig) -> sa.Engine:
+        """
+            A method that returns the run scoped engine for the given db config, creating it and its
+            connection pool only on the first request
+
+            returns:
+                sa.Engine: A sqlalchemy db engine object
+        """
+
+        db_url = self.__get_db_url(db_config=db_config)
+
+        with self.__engines_lock:
+            if db_url not in self.__engines:
+                self.__engines[db_url] = sa.create_engine(
+                    url=db_url,
+                    pool_size=db_config.pool_size,
+                    max_overflow=db_config.max_overflow,
+                    pool_timeout=db_config.pool_timeout,
+                    pool_pre_ping=True
+                )
+
+                if self._run_metrics is not None:
+                    self._run_metrics.instrument_engine(engine=self.__engines[db_url])
+
+            return self.__engines[db_url]
+
+    @contextmanager
+    def begin(self, db_config: DBConnectionConfig) -> Iterator[sa.Connection]:
+        """
+            A method that yields the run connection when the run is executed as a single transaction, or the
+            step connection bound to the calling thread, otherwise it yields a pooled connection within its own
+            transaction committed on exit
+
+            returns:
+                Iterator[sa.Connection]: A sqlalchemy connection within a transaction
+        """
+
+        if self.__run_connection is not None:
+            yield self.__run_connection
+            return
+
+        step_connection = getattr(self.__step_connections, "connection", None)
+
+        if step_connection is not None:
+            yield step_connection
+            return
+
+        with self.get_engine(db_config=db_config).begin() as connection:
+            yield connection
+
+    @contextmanager
+    def begin_batch(self, db_config: DBConnectionConfig) -> Iterator[sa.Connection]:
+        """
+            A method that yields the connection a write batch is committed or rolled back on alone, a savepoint of
+            the run connection when the run is executed as a single transaction or of the step connection bound to
+            the calling thread, so the batches stay within the run or step transaction, otherwise a pooled
+            connection within its own transaction committed on exit
+
+            returns:
+                Iterator[sa.Connection]: A sqlalchemy connection within a transaction or a savepoint
+        """
+
+        bound_connection = self.__get_bound_connection()
+
+        if bound_connection is not None:
+            with bound_connection.begin_nested():
+                yield bound_connection
+            return
+
+        with self.get_engine(db_config=db_config).begin() as connection:
+            yield connection
+
+    @contextmanager
+    def run_transaction(self, db_config: DBConnectionConfig) -> Iterator[sa.Connection]:
+        """
+            A method that binds a single connection and transaction to the registry, so every step of the run
+            executes on it and the whole run is committed or rolled back atomically
+
+            returns:
+                Iterator[sa.Connection]: The run sqlalchemy connection
+        """
+
+        with self.get_engine(db_config=db_config).connect() as connection:
+            with connection.begin():
+                self.__run_connection = connection
+
+                try:
+                    yield connection
+                finally:
+                    self.__run_connection = None
+
+    @contextmanager
+    def step_transaction(self, db_config: DBConnectionConfig) -> Iterator[sa.Connection]:
+        """
+            A method that binds a single connection and transaction to the calling thread, so every statement
+            of the step running on it executes on that transaction, committed on exit or rolled back when an
+            exception is raised or when the caller rolls the connection back, the other threads steps keep their
+            own connections
+
+            returns:
+                Iterator[sa.Connection]: The step sqlalchemy connection
+        """
+
+        if self.__run_connection is not None:
+            yield self.__run_connection
+            return
+
+        with self.get_engine(db_config=db_config).connect() as connection:
+            with connection.begin():
+                self.__step_connections.connection = connection
+
+                try:
+                    yield connection
+                finally:
+                    self.__step_connections.connection = None
+
+    def in_run_transaction(self) -> bool:
+        """
+            A method that returns if the registry is bound to a single run transaction
+
+            returns:
+                bool: A boolean flag indicating if there is a run transaction open
+        """
+
+        return self.__run_connection is not None
+
+    def in_bound_transaction(self) -> bool:
+        """
+            A method that returns if the statements of the calling thread run on a bound connection, the run
+            connection or the step connection of the thread, whose transaction can't outlive the connection
+
+            returns:
+                bool: A boolean flag indicating if there is a run or step transaction open for the calling thread
+        """
+
+        return self.__get_bound_connection() is not None
+
+    def __get_bound_connection(self) -> sa.Connection | None:
+        """
+            A private method that returns the run connection or the step connection bound to the calling thread
+
+            returns:
+                sa.Connection | None: The bound sqlalchemy connection, none when there isn't one
+        """
+
+        return self.__run_connection or getattr(self.__step_connections, "connection", None)
+
+    def dispose(self) -> None:
+        """
+            A method that disposes every engine created by the registry and their connection pools
+        """
+
+        with self.__engines_lock:
+            for engine in self.__engines.values():
+                engine.dispose()
+
+            self.__engines.clear()
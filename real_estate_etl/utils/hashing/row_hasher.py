@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+class RowHasher():
+
+    HASH_KEY = "real_estate_etl0"
+
+    def __to_canonical(self, series: pd.Series) -> pd.Series:
+        """
+            A private method that casts a key column to the representation hashed for it, dates as datetimes,
+            numbers as floats and texts as lowered strings, so the same value hashes the same whether it was parsed
+            as an integer, a nullable integer, a float or an object (like the ids brought by left merges), with a
+            single NaN bit pattern for the missing values and negative zeros as zeros, since floats are hashed by
+            their bytes
+
+            returns:
+                pd.Series: The canonical pandas Series
+        """
+
+        series = series.infer_objects()
+
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series.astype("datetime64[ns]")
+
+        if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            values = series.astype("float64")
+
+            return values.where(values.notna(), np.nan) + 0.0
+
+        return series.astype("string").str.lower()
+
+    def hash_rows(self, df: pd.DataFrame, columns: list[str]) -> pd.Series:
+        """
+            A method that computes a deterministic 64 bit hash of the given key columns of each row, vectorized
+            over the whole data frame
+
+            returns:
+                pd.Series: A pandas Series of signed 64 bit row hashes, matching a BIGINT column
+        """
+
+        df_canonical = pd.DataFrame({column: self.__to_canonical(df[column]) for column in columns}, index=df.index)
+
+        row_hashes = pd.util.hash_pandas_object(df_canonical, index=False, hash_key=self.HASH_KEY)
+
+        return pd.Series(row_hashes.to_numpy().view("int64"), index=df.index, name="row_hash")
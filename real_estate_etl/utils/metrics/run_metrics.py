@@ -0,0 +1,189 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
+
+import sqlalchemy as sa
+
+from models.metrics.step_metrics import StepMetrics
+
+class RunMetrics():
+
+    def __init__(self, trace_memory: bool = False) -> None:
+
+        self._trace_memory = trace_memory
+
+        self.__steps: list[StepMetrics] = []
+        self.__running_steps: list[StepMetrics] = []
+        self.__lock = threading.Lock()
+        self.__current = threading.local()
+
+        self.__started_at = datetime.now(timezone.utc)
+        self.__started_counter = time.perf_counter()
+
+        if self._trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def __share_memory_peak(self) -> None:
+        """
+            A private method that hands the traced memory peak reached since the last reset to every running
+            step before resetting it, so concurrent steps don't erase each other peaks
+        """
+
+        _, peak = tracemalloc.get_traced_memory()
+
+        for step_metrics in self.__running_steps:
+            step_metrics.tracemalloc_peak_bytes = max(step_metrics.tracemalloc_peak_bytes or 0, peak)
+
+        tracemalloc.reset_peak()
+
+    def current(self) -> StepMetrics | None:
+        """
+            A method that returns the metrics of the step running on the calling thread
+
+            returns:
+                StepMetrics | None: The running step metrics or None when no step is measured on the thread
+        """
+
+        return getattr(self.__current, "step_metrics", None)
+
+    def add(self, **counters: int) -> None:
+        """
+            A method that increments the given counters of the step running on the calling thread, doing nothing
+            when there is no measured step
+        """
+
+        step_metrics = self.current()
+
+        if step_metrics is None:
+            return
+
+        for counter, value in counters.items():
+            setattr(step_metrics, counter, getattr(step_metrics, counter) + value)
+
+    @contextmanager
+    def measure_step(self, step: str, chunk: int = None, source_rows: int = 0) -> Iterator[StepMetrics]:
+        """
+            A method that measures the wall and CPU time of the wrapped step and, when memory tracing is on, the
+            traced memory peak of the process while it runs, the step counters are incremented through add by
+            the code running on the same thread
+
+            returns:
+                Iterator[StepMetrics]: The metrics of the measured step
+        """
+
+        step_metrics = StepMetrics(step=step, chunk=chunk, source_rows=source_rows)
+        parent_step_metrics = self.current()
+
+        with self.__lock:
+            if self._trace_memory:
+                self.__share_memory_peak()
+
+            self.__running_steps.append(step_metrics)
+
+        self.__current.step_metrics = step_metrics
+
+        started_counter = time.perf_counter()
+        started_thread_time = time.thread_time()
+
+        try:
+            yield step_metrics
+        except BaseException:
+            step_metrics.success = False
+            raise
+        else:
+            if step_metrics.success is None:
+                step_metrics.success = True
+        finally:
+            step_metrics.wall_seconds = time.perf_counter() - started_counter
+            step_metrics.cpu_seconds = time.thread_time() - started_thread_time
+
+            self.__current.step_metrics = parent_step_metrics
+
+            with self.__lock:
+                if self._trace_memory:
+                    self.__share_memory_peak()
+
+                self.__running_steps.remove(step_metrics)
+                self.__steps.append(step_metrics)
+
+    def measure_iterator(self, step: str, iterable: Iterable) -> Iterator:
+        """
+            A method that measures each item production of the given iterable as a step, like each chunk read
+            from the source file
+
+            returns:
+                Iterator: The items of the iterable
+        """
+
+        iterator = iter(iterable)
+        chunk = 1
+
+        while True:
+            with self.measure_step(step=step, chunk=chunk) as step_metrics:
+                item = next(iterator, None)
+                step_metrics.success = item is not None
+                step_metrics.source_rows = len(item.index) if hasattr(item, "index") else 0
+
+            if item is None:
+                with self.__lock:
+                    self.__steps.remove(step_metrics)
+
+                return
+
+            yield item
+            chunk += 1
+
+    def instrument_engine(self, engine: sa.Engine) -> None:
+        """
+            A method that counts each statement executed through the engine as a round trip of the step running
+            on the executing thread, along with the statement size as sent bytes
+        """
+
+        @sa.event.listens_for(engine, "before_cursor_execute")
+        def before_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+            self.add(db_round_trips=1, bytes_sent=len(statement))
+
+    def write_report(self, file_path: str, **run_details) -> None:
+        """
+            A method that writes the run details, every measured step and the totals of each step name as a JSON
+            report
+        """
+
+        with self.__lock:
+            steps = [asdict(step_metrics) for step_metrics in self.__steps]
+
+        totals = {}
+
+        for step_metrics in steps:
+            step_totals = totals.setdefault(step_metrics["step"], {"executions": 0})
+            step_totals["executions"] += 1
+
+            for counter, value in step_metrics.items():
+                if counter in ("step", "chunk", "success") or value is None:
+                    continue
+
+                if counter == "tracemalloc_peak_bytes":
+                    step_totals[counter] = max(step_totals.get(counter, 0), value)
+                else:
+                    step_totals[counter] = step_totals.get(counter, 0) + value
+
+        report = {
+            **run_details,
+            "started_at": self.__started_at.isoformat(),
+            "wall_seconds": time.perf_counter() - self.__started_counter,
+            "trace_memory": self._trace_memory,
+            "totals": totals,
+            "steps": steps
+        }
+
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+
+        with open(file_path, "w") as report_file:
+            json.dump(report, report_file, indent=4, default=str)
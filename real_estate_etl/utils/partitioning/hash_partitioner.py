@@ -0,0 +1,34 @@
+import pandas as pd
+
+from utils.hashing.row_hasher import RowHasher
+
+class HashPartitioner():
+
+    def __init__(self, partitions: int) -> None:
+
+        if partitions <= 0:
+            raise ValueError("The number of partitions must be a positive number.")
+
+        self._partitions = partitions
+
+    def partition(self, df: pd.DataFrame, columns: list[str]) -> list[pd.DataFrame]:
+        """
+            A method that splits the data frame by the hash of the given key columns, so every row sharing the same
+            key lands in the same partition and the partitions can be deduplicated and loaded independently
+
+            returns:
+                list[pd.DataFrame]: The non empty partitions of the data frame
+        """
+
+        if self._partitions == 1 or df.empty:
+            return [df]
+
+        row_hashes = RowHasher().hash_rows(df=df, columns=columns).to_numpy().view("uint64")
+
+        partition_numbers = row_hashes % self._partitions
+
+        return [
+            df[partition_numbers == partition_number]
+            for partition_number in range(self._partitions)
+            if (partition_numbers == partition_number).any()
+        ]
@@ -0,0 +1,101 @@
+import importlib
+
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any
+
+class PipelineRegistry():
+
+    # The entry point group other distributions register their pipeline definitions in
+    ENTRY_POINT_GROUP = "real_estate_etl.pipelines"
+
+    def __init__(self, pipelines: dict[str, dict]) -> None:
+
+        self._pipelines = pipelines
+
+        self.__entry_points = None
+
+    @staticmethod
+    def resolve(dotted_path: str) -> Any:
+        """
+            A method that imports the module of the given dotted path and returns the attribute it names, the
+            path being either "package.module.attribute" or, like the entry points, "package.module:attribute"
+
+            returns:
+                Any: The object named by the dotted path
+        """
+
+        if ":" in dotted_path:
+            module_path, _, attribute = dotted_path.partition(":")
+        else:
+            module_path, _, attribute = dotted_path.rpartition(".")
+
+        return getattr(importlib.import_module(module_path), attribute)
+
+    def __get_entry_points(self) -> dict[str, EntryPoint]:
+        """
+            A private method that returns the pipelines registered through entry points, looked up once and only
+            when a pipeline isn't one of the registry own pipelines
+
+            returns:
+                dict[str, EntryPoint]: The pipeline entry points by pipeline name
+        """
+
+        if self.__entry_points is None:
+            self.__entry_points = {entry_point.name: entry_point for entry_point in entry_points(group=self.ENTRY_POINT_GROUP)}
+
+        return self.__entry_points
+
+    def get_names(self) -> list[str]:
+        """
+            A method that returns the names of the registry own pipelines followed by the ones registered through
+            entry points
+
+            returns:
+                list[str]: The pipeline names
+        """
+
+        return [*self._pipelines, *(name for name in self.__get_entry_points() if name not in self._pipelines)]
+
+    def contains(self, name: str) -> bool:
+        """
+            A method that returns if the registry has a pipeline with the given name, without importing anything
+            the pipeline runs
+
+            returns:
+                bool: A boolean flag indicating if the pipeline exists
+        """
+
+        return name in self._pipelines or name in self.__get_entry_points()
+
+    def load(self, name: str) -> dict:
+        """
+            A method that returns the definition of the given pipeline with its source schema, dimensions and
+            steps resolved from their dotted paths, importing only the modules of this pipeline
+
+            returns:
+                dict: The pipeline definition with the resolved objects
+        """
+
+        if name in self._pipelines:
+            pipeline = dict(self._pipelines[name])
+        elif name in self.__get_entry_points():
+            pipeline = dict(self.__get_entry_points()[name].load())
+        else:
+            raise ValueError(f"The {name} pipeline is not valid, please chose of these: [{','.join(self.get_names())}]")
+
+        pipeline["schema"] = self.__resolve_value(pipeline["schema"])
+        pipeline["dimensions"] = self.__resolve_value(pipeline["dimensions"])
+        pipeline["steps"] = {step: self.__resolve_value(extractor) for step, extractor in pipeline["steps"].items()}
+
+        return pipeline
+
+    def __resolve_value(self, value: Any) -> Any:
+        """
+            A private method that resolves a dotted path of a pipeline definition, the already imported objects
+            being kept as they are
+
+            returns:
+                Any: The resolved object
+        """
+
+        return self.resolve(dotted_path=value) if isinstance(value, str) else value
@@ -0,0 +1,86 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable
+
+from utils.log.custom_logger import CustomLogger
+
+class DAGScheduler():
+
+    def __init__(
+        self,
+        steps: list[type],
+        logger: CustomLogger,
+        max_workers: int = 1
+    ) -> None:
+
+        self._steps = steps
+        self._logger = logger
+        self._max_workers = max_workers
+
+    def __get_step_dependencies(self) -> dict[type, set[type]]:
+        """
+            A private method that resolves the steps each step depends on, being the steps writing to the tables
+            it declares in depends_on, tables not written by any step (like the seeded states) are already available
+
+            returns:
+                dict[type, set[type]]: The steps each pipeline step must wait for
+        """
+
+        table_writers = {}
+
+        for step in self._steps:
+            for table in step.get_target_tables():
+                table_writers.setdefault(table, set()).add(step)
+
+        return {
+            step: {writer for table in step.depends_on for writer in table_writers.get(table, set()) if writer is not step}
+            for step in self._steps
+        }
+
+    def run(self, run_step: Callable[[type], bool]) -> bool:
+        """
+            A method that runs the pipeline steps as soon as the steps they depend on succeed, running the
+            ready steps concurrently on a thread pool limited to max_workers
+
+            returns:
+                bool: A boolean flag indicating if every step was successfully executed
+        """
+
+        step_dependencies = self.__get_step_dependencies()
+
+        pending_steps = list(self._steps)
+        completed_steps = set()
+        running_steps: dict[Future, type] = {}
+        success = True
+
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="pipeline_step") as executor:
+
+            while pending_steps or running_steps:
+
+                ready_steps = [step for step in pending_steps if step_dependencies[step] <= completed_steps] if success else []
+
+                for step in ready_steps:
+                    pending_steps.remove(step)
+                    running_steps[executor.submit(run_step, step)] = step
+
+                if not running_steps:
+                    if success:
+                        raise ValueError(f"The pipeline steps have circular dependencies: [{','.join(step.__name__ for step in pending_steps)}]")
+
+                    break
+
+                done, _ = wait(running_steps.keys(), return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    step = running_steps.pop(future)
+
+                    if future.exception() is not None or not future.result():
+                        self._logger.error(f"DAGScheduler.run The step {step.__name__} failed, no further steps will be scheduled.")
+                        success = False
+
+                        if future.exception() is not None:
+                            wait(running_steps.keys())
+                            raise future.exception()
+                    else:
+                        completed_steps.add(step)
+
+        return success
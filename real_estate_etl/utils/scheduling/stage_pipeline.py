@@ -0,0 +1,132 @@
+import queue
+import threading
+
+from typing import Any, Callable, Iterable, Iterator
+
+class StageFailure():
+
+    def __init__(self, exception: BaseException) -> None:
+
+        self.exception = exception
+
+
+class StagePipeline():
+
+    END_OF_STREAM = object()
+    STOP_CHECK_INTERVAL = 0.1
+
+    def __init__(self, stages: list[Callable[[Any], Any]], queue_size: int = 2) -> None:
+
+        if queue_size <= 0:
+            raise ValueError("The stage queue size must be a positive number of items.")
+
+        self._stages = stages
+        self._queue_size = queue_size
+
+    def __put(self, stage_queue: queue.Queue, item: Any, stop_event: threading.Event) -> bool:
+        """
+            A private method that waits for room in the bounded queue to put the item, giving up when the pipeline
+            is stopped so a stage blocked by its consumer never outlives it
+
+            returns:
+                bool: A boolean flag indicating if the item was put in the queue
+        """
+
+        while not stop_event.is_set():
+            try:
+                stage_queue.put(item, timeout=self.STOP_CHECK_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def __get(self, stage_queue: queue.Queue, stop_event: threading.Event) -> Any:
+        """
+            A private method that waits for the next item of the queue, returning the end of the stream when the
+            pipeline is stopped
+
+            returns:
+                Any: The next item of the queue
+        """
+
+        while not stop_event.is_set():
+            try:
+                return stage_queue.get(timeout=self.STOP_CHECK_INTERVAL)
+            except queue.Empty:
+                continue
+
+        return self.END_OF_STREAM
+
+    def __produce(self, source: Iterable, output_queue: queue.Queue, stop_event: threading.Event) -> None:
+        try:
+            for item in source:
+                if not self.__put(output_queue, item, stop_event):
+                    return
+        except BaseException as exception:
+            self.__put(output_queue, StageFailure(exception), stop_event)
+            return
+
+        self.__put(output_queue, self.END_OF_STREAM, stop_event)
+
+    def __process(self, stage: Callable[[Any], Any], input_queue: queue.Queue, output_queue: queue.Queue, stop_event: threading.Event) -> None:
+        while True:
+            item = self.__get(input_queue, stop_event)
+
+            if item is self.END_OF_STREAM or isinstance(item, StageFailure):
+                self.__put(output_queue, item, stop_event)
+                return
+
+            try:
+                item = stage(item)
+            except BaseException as exception:
+                self.__put(output_queue, StageFailure(exception), stop_event)
+                return
+
+            if not self.__put(output_queue, item, stop_event):
+                return
+
+    def run(self, source: Iterable) -> Iterator:
+        """
+            A method that iterates the source on its own thread and runs each stage on its own thread, linked by
+            queues bounded to queue_size items, yielding the items coming out of the last stage in order, so the
+            source reading and the stages overlap with the work done by the caller on the yielded items while the
+            bounded queues hold back the stages running ahead of it, a stage failure is raised to the caller and
+            stopping the iteration stops every stage
+
+            returns:
+                Iterator: The items processed by every stage
+        """
+
+        stop_event = threading.Event()
+        stage_queues = [queue.Queue(maxsize=self._queue_size) for _ in range(len(self._stages) + 1)]
+
+        threads = [threading.Thread(target=self.__produce, args=(source, stage_queues[0], stop_event), name="pipeline_stage_source", daemon=True)]
+
+        for stage_number, stage in enumerate(self._stages):
+            threads.append(threading.Thread(
+                target=self.__process,
+                args=(stage, stage_queues[stage_number], stage_queues[stage_number + 1], stop_event),
+                name=f"pipeline_stage_{stage_number + 1}",
+                daemon=True
+            ))
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = self.__get(stage_queues[-1], stop_event)
+
+                if item is self.END_OF_STREAM:
+                    return
+
+                if isinstance(item, StageFailure):
+                    raise item.exception
+
+                yield item
+        finally:
+            stop_event.set()
+
+            for thread in threads:
+                thread.join()
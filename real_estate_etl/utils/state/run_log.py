@@ -0,0 +1,195 @@
+import hashlib
+import os
+
+from contextlib import contextmanager
+from typing import Iterator
+
+import sqlalchemy as sa
+
+from models.config.db_connection_config import DBConnectionConfig
+from models.metrics.step_metrics import StepMetrics
+from utils.db.db_engine_registry import DBEngineRegistry
+
+class RunLog():
+
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    def __init__(
+        self,
+        pipeline_name: str,
+        target_db_config: DBConnectionConfig,
+        db_engine_registry: DBEngineRegistry
+    ) -> None:
+
+        self._pipeline_name = pipeline_name
+        self._target_db_config = target_db_config
+        self._db_engine_registry = db_engine_registry
+
+        self.run_id = None
+        self.__completed_steps = set()
+
+    @staticmethod
+    def get_input_fingerprint(file_paths: list[str], chunk_size: int = None) -> str:
+        """
+            A method that fingerprints the run input by the path, size and modification time of each input file
+            and by the chunk size, a resumed run must read the same chunks as the run it continues
+
+            returns:
+                str: The sha256 hex digest of the run input
+        """
+
+        input_hash = hashlib.sha256(f"chunk_size={chunk_size or 0}".encode())
+
+        for file_path in file_paths:
+            file_stat = os.stat(file_path)
+            input_hash.update(f"|{os.path.realpath(file_path)}:{file_stat.st_size}:{file_stat.st_mtime_ns}".encode())
+
+        return input_hash.hexdigest()
+
+    def start(self, input_fingerprint: str, resume: bool = False) -> bool:
+        """
+            A method that starts the run log of the run, continuing the last unfinished run of the pipeline over
+            the same input when resuming, along with the steps and chunks it already committed
+
+            returns:
+                bool: A boolean flag indicating if an unfinished run is being resumed
+        """
+
+        with self._db_engine_registry.begin(db_config=self._target_db_config) as connection:
+            if not self.__has_run_log_tables(connection=connection):
+                raise Exception("The run log tables don't exist in the target db, run the 004_create_pipeline_run_log.sql migration before checkpointing or resuming runs.")
+
+            if resume:
+                self.run_id = connection.execute(sa.text("""
+                    SELECT pipeline_run_id
+                      FROM pipeline_runs
+                     WHERE pipeline_name = :pipeline_name
+                       AND input_fingerprint = :input_fingerprint
+                       AND status <> :succeeded
+                  ORDER BY pipeline_run_id DESC
+                     LIMIT 1
+                """), {"pipeline_name": self._pipeline_name, "input_fingerprint": input_fingerprint, "succeeded": self.SUCCEEDED}).scalar()
+
+            if self.run_id is not None:
+                self.__completed_steps = {
+                    (row.step, row.chunk)
+                    for row in connection.execute(
+                        sa.text("SELECT step, chunk FROM pipeline_run_steps WHERE pipeline_run_id = :run_id AND status = :succeeded"),
+                        {"run_id": self.run_id, "succeeded": self.SUCCEEDED}
+                    )
+                }
+
+                connection.execute(
+                    sa.text("UPDATE pipeline_runs SET status = :running, utc_datetime_updated = CURRENT_TIMESTAMP(3) WHERE pipeline_run_id = :run_id"),
+                    {"run_id": self.run_id, "running": self.RUNNING}
+                )
+
+                return True
+
+            self.run_id = connection.execute(
+                sa.text("INSERT INTO pipeline_runs (pipeline_name, input_fingerprint, status) VALUES (:pipeline_name, :input_fingerprint, :running) RETURNING pipeline_run_id"),
+                {"pipeline_name": self._pipeline_name, "input_fingerprint": input_fingerprint, "running": self.RUNNING}
+            ).scalar()
+
+        return False
+
+    def __has_run_log_tables(self, connection: sa.Connection) -> bool:
+        """
+            A private method that returns if the run log tables were created in the target db by the 004 migration
+
+            returns:
+                bool: A boolean flag indicating if the run log tables exist
+        """
+
+        return connection.execute(
+            sa.text("SELECT TO_REGCLASS('pipeline_runs') IS NOT NULL AND TO_REGCLASS('pipeline_run_steps') IS NOT NULL")
+        ).scalar()
+
+    def is_completed(self, step: str, chunk: int) -> bool:
+        """
+            A method that returns if the step of the chunk was committed by the resumed run
+
+            returns:
+                bool: A boolean flag indicating if the step can be skipped
+        """
+
+        return (step, chunk) in self.__completed_steps
+
+    def is_chunk_completed(self, steps: list[str], chunk: int) -> bool:
+        """
+            A method that returns if every given step of the chunk was committed by the resumed run
+
+            returns:
+                bool: A boolean flag indicating if the whole chunk can be skipped
+        """
+
+        return all(self.is_completed(step=step, chunk=chunk) for step in steps)
+
+    def __record_step(self, connection: sa.Connection, step_metrics: StepMetrics, status: str) -> None:
+        """
+            A private method that records the status and row counts of a step of a chunk on the given connection
+        """
+
+        connection.execute(sa.text("""
+            INSERT INTO pipeline_run_steps (pipeline_run_id, step, chunk, status, source_rows, rows_written)
+            VALUES (:run_id, :step, :chunk, :status, :source_rows, :rows_written)
+            ON CONFLICT (pipeline_run_id, step, chunk) DO UPDATE SET
+                status = EXCLUDED.status,
+                source_rows = EXCLUDED.source_rows,
+                rows_written = EXCLUDED.rows_written,
+                utc_datetime_updated = CURRENT_TIMESTAMP(3)
+        """), {
+            "run_id": self.run_id,
+            "step": step_metrics.step,
+            "chunk": step_metrics.chunk,
+            "status": status,
+            "source_rows": step_metrics.source_rows,
+            "rows_written": step_metrics.rows_written
+        })
+
+    @contextmanager
+    def checkpoint(self, step_metrics: StepMetrics) -> Iterator[None]:
+        """
+            A method that runs the step on a transaction bound to its thread, committing its checkpoint along
+            with the rows it loaded when it succeeds and rolling both back when it fails, the failure being
+            recorded on its own transaction (the worker processes loading partitions of a step commit on their
+            own, a resumed run reloads only the rows they didn't commit)
+
+            returns:
+                Iterator[None]: The context the step runs within
+        """
+
+        try:
+            with self._db_engine_registry.step_transaction(db_config=self._target_db_config) as connection:
+                try:
+                    yield
+                except:
+                    step_metrics.success = False
+                    connection.rollback()
+                    raise
+
+                if step_metrics.success:
+                    self.__record_step(connection=connection, step_metrics=step_metrics, status=self.SUCCEEDED)
+                else:
+                    connection.rollback()
+        finally:
+            if not step_metrics.success:
+                with self._db_engine_registry.begin(db_config=self._target_db_config) as connection:
+                    self.__record_step(connection=connection, step_metrics=step_metrics, status=self.FAILED)
+
+    def finish(self, success: bool) -> None:
+        """
+            A method that records the outcome of the run, a failed run being the one resumed by the next run
+            with the resume flag
+        """
+
+        if self.run_id is None:
+            return
+
+        with self._db_engine_registry.begin(db_config=self._target_db_config) as connection:
+            connection.execute(
+                sa.text("UPDATE pipeline_runs SET status = :status, utc_datetime_updated = CURRENT_TIMESTAMP(3) WHERE pipeline_run_id = :run_id"),
+                {"run_id": self.run_id, "status": self.SUCCEEDED if success else self.FAILED}
+            )
@@ -0,0 +1,148 @@
+import hashlib
+import os
+
+import sqlalchemy as sa
+
+from models.config.db_connection_config import DBConnectionConfig
+from models.state.source_file_state import SourceFileState
+from utils.db.db_engine_registry import DBEngineRegistry
+
+class SourceFileTracker():
+
+    PREFIX_SIZE = 1024 * 1024
+    HASH_BLOCK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        pipeline_name: str,
+        file_path: str,
+        target_db_config: DBConnectionConfig,
+        db_engine_registry: DBEngineRegistry
+    ) -> None:
+
+        self._pipeline_name = pipeline_name
+        self._file_path = os.path.realpath(file_path)
+        self._target_db_config = target_db_config
+        self._db_engine_registry = db_engine_registry
+
+    def __get_prefix_hash(self, prefix_size: int) -> str:
+        """
+            A private method that hashes the first bytes of the source file, which must stay the same for the
+            file to be considered unchanged or only appended to
+
+            returns:
+                str: The sha256 hex digest of the file prefix
+        """
+
+        prefix_hash = hashlib.sha256()
+        remaining_bytes = prefix_size
+
+        with open(self._file_path, "rb") as source_file:
+            while remaining_bytes > 0:
+                block = source_file.read(min(self.HASH_BLOCK_SIZE, remaining_bytes))
+
+                if not block:
+                    break
+
+                prefix_hash.update(block)
+                remaining_bytes -= len(block)
+
+        return prefix_hash.hexdigest()
+
+    def get_fingerprint(self) -> SourceFileState:
+        """
+            A method that fingerprints the current source file by its size, modification time and the hash of
+            its prefix, the offsets are left unset until the file is processed
+
+            returns:
+                SourceFileState: The current state of the source file
+        """
+
+        file_stat = os.stat(self._file_path)
+        prefix_size = min(file_stat.st_size, self.PREFIX_SIZE)
+
+        return SourceFileState(
+            pipeline_name=self._pipeline_name,
+            file_path=self._file_path,
+            file_size=file_stat.st_size,
+            file_mtime_ns=file_stat.st_mtime_ns,
+            prefix_size=prefix_size,
+            prefix_hash=self.__get_prefix_hash(prefix_size=prefix_size)
+        )
+
+    def get_saved_state(self) -> SourceFileState | None:
+        """
+            A method that returns the state recorded by the last successful run of the pipeline for the file
+
+            returns:
+                SourceFileState | None: The saved source file state or None when the file was never processed
+        """
+
+        sql = sa.text("""
+            SELECT file_size, file_mtime_ns, prefix_size, prefix_hash, byte_offset, row_offset
+            FROM source_file_states
+            WHERE pipeline_name = :pipeline_name AND file_path = :file_path
+        """)
+
+        with self._db_engine_registry.begin(db_config=self._target_db_config) as connection:
+            row = connection.execute(sql, {"pipeline_name": self._pipeline_name, "file_path": self._file_path}).mappings().first()
+
+        if row is None:
+            return None
+
+        return SourceFileState(pipeline_name=self._pipeline_name, file_path=self._file_path, **row)
+
+    def is_unchanged(self, saved_state: SourceFileState, fingerprint: SourceFileState) -> bool:
+        """
+            A method that checks if the source file is the same one fully processed by the last run
+
+            returns:
+                bool: A boolean flag indicating if the file can be skipped
+        """
+
+        return (
+            saved_state.byte_offset == fingerprint.file_size
+            and saved_state.file_size == fingerprint.file_size
+            and saved_state.file_mtime_ns == fingerprint.file_mtime_ns
+            and saved_state.prefix_hash == fingerprint.prefix_hash
+        )
+
+    def is_appended(self, saved_state: SourceFileState, fingerprint: SourceFileState) -> bool:
+        """
+            A method that checks if the source file only had rows appended since the last run, meaning it
+            didn't shrink and the prefix hashed by the last run is still the same
+
+            returns:
+                bool: A boolean flag indicating if the file can be resumed from the saved byte offset
+        """
+
+        if fingerprint.file_size < saved_state.byte_offset or fingerprint.file_size < saved_state.prefix_size:
+            return False
+
+        return self.__get_prefix_hash(prefix_size=saved_state.prefix_size) == saved_state.prefix_hash
+
+    def save_state(self, state: SourceFileState) -> None:
+        """
+            A method that records the fingerprint and the watermark reached by the run, it runs on the run
+            transaction when there is one so the watermark is committed along with the loaded rows
+        """
+
+        sql = sa.text("""
+            INSERT INTO source_file_states (
+                pipeline_name, file_path, file_size, file_mtime_ns, prefix_size, prefix_hash, byte_offset, row_offset
+            )
+            VALUES (
+                :pipeline_name, :file_path, :file_size, :file_mtime_ns, :prefix_size, :prefix_hash, :byte_offset, :row_offset
+            )
+            ON CONFLICT (pipeline_name, file_path) DO UPDATE SET
+                file_size = EXCLUDED.file_size,
+                file_mtime_ns = EXCLUDED.file_mtime_ns,
+                prefix_size = EXCLUDED.prefix_size,
+                prefix_hash = EXCLUDED.prefix_hash,
+                byte_offset = EXCLUDED.byte_offset,
+                row_offset = EXCLUDED.row_offset,
+                utc_datetime_updated = CURRENT_TIMESTAMP(3)
+        """)
+
+        with self._db_engine_registry.begin(db_config=self._target_db_config) as connection:
+            connection.execute(sql, vars(state))